@@ -15,6 +15,8 @@ SESSION_COOKIE_SECURE = True if os.environ.get("FLASK_ENV") == "production" else
 # Database
 SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
 SQLALCHEMY_ECHO = True if os.environ.get("SQLALCHEMY_ECHO") == "True" else False
+# Fail requests exceeding their query budget instead of logging a warning, for tests
+QUERY_BUDGET_STRICT = True if os.environ.get("QUERY_BUDGET_STRICT") == "True" else False
 
 # Security
 SECRET_KEY = os.environ.get("SECRET_KEY")
@@ -8,10 +8,20 @@ Decorators:
  * `csrf_protected` - Protects routes from CSRF attacks.
  * `verify_google_oidc_token` - Verifies Google OIDC tokens for authentication.
  * `nextjs_auth_required` - Ensures that the request is authenticated by the Next.js server.
+ * `cached_response` - Caches successful responses of public routes, with ETags and compressed variants.
+ * `metrics_auth_required` - Ensures that the request is made by the metrics scraper.
 """
 
 from .csrf_protection import csrf_protected
 from .google_oidc import verify_google_oidc_token
 from .nextjs_auth import nextjs_auth_required
+from .cached_response import cached_response
+from .metrics_auth import metrics_auth_required
 
-__all__ = ["csrf_protected", "verify_google_oidc_token", "nextjs_auth_required"]
+__all__ = [
+    "csrf_protected",
+    "verify_google_oidc_token",
+    "nextjs_auth_required",
+    "cached_response",
+    "metrics_auth_required",
+]
@@ -0,0 +1,115 @@
+from functools import wraps
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterable, List
+from urllib.parse import urlencode
+from flask import Response, current_app, make_response, request
+from utility.cache import SingleFlight, cache
+from utility.payload import CompressedPayload
+from utility.translation import retrieve_languages
+
+# WSGI environ key set by `refresh_response`, cannot be set by clients
+REFRESH_ENVIRON_KEY = "medieteknik.cache_refresh"
+
+
+def get_response_cache_key() -> str:
+    """
+    Builds the cache key of the current request from its path and query string. Language codes are normalized,
+    so that e.g. '?language=sv' and '?language=sv-SE' share an entry.
+    :return: str - The cache key.
+    """
+
+    args = sorted(
+        (key, value)
+        for key, value in request.args.items(multi=True)
+        if key != "language"
+    )
+    args.append(("language", ",".join(retrieve_languages(request.args))))
+
+    return f"response:{request.path}?{urlencode(args)}"
+
+
+def cached_response(
+    ttl: int,
+    stale_ttl: int = 0,
+    tags: Callable[..., Iterable[str]] | Iterable[str] | None = None,
+    cache_control: str | None = None,
+):
+    """
+    Decorator to cache successful responses of a public route. The body is stored with its gzip and brotli variants
+    and served with an ETag, only one worker at a time renders a missing entry.
+    :param ttl: int - Seconds the response is fresh.
+    :param stale_ttl: int - Seconds the response is served stale after `ttl` while it is rendered again.
+    :param tags: Iterable[str] | Callable - The cache tags, or a function building them from the view arguments.
+    :param cache_control: str - The Cache-Control header of the response, defaults to the public route default.
+    :return: function - The decorated function.
+    """
+
+    def decorator(f):
+        def get_tags(key: str, view_args: Dict[str, Any], rejected: List[Response]):
+            if callable(tags):
+                return tags(**view_args)
+            return tags or []
+
+        def render(
+            key: str, view_args: Dict[str, Any], rejected: List[Response]
+        ) -> bytes | None:
+            response = make_response(f(**view_args))
+
+            if response.status_code != HTTPStatus.OK or response.is_streamed:
+                # Errors are not cached, the caller returns them as they are
+                rejected.append(response)
+                return None
+
+            return CompressedPayload.from_body(response.get_data()).encode()
+
+        flight = SingleFlight(
+            cache,
+            render,
+            key=lambda key, view_args, rejected: key,
+            ttl=ttl,
+            stale_ttl=stale_ttl,
+            tags=get_tags,
+        )
+
+        @wraps(f)
+        def decorated_function(**kwargs):
+            key = get_response_cache_key()
+            rejected: List[Response] = []
+
+            if request.environ.get(REFRESH_ENVIRON_KEY):
+                value = flight.refresh(key, kwargs, rejected)
+            else:
+                value = flight(key, kwargs, rejected)
+
+            if value is None:
+                return rejected[0] if rejected else make_response(f(**kwargs))
+
+            response = CompressedPayload.decode(value).to_response(request)
+            if cache_control:
+                response.headers["Cache-Control"] = cache_control
+
+            return response
+
+        decorated_function.response_cache = flight
+        return decorated_function
+
+    return decorator
+
+
+def refresh_response(path: str, query: Dict[str, str] | None = None) -> bool:
+    """
+    Renders a route decorated with `cached_response` again and stores the result, regardless of what is cached.
+    :param path: str - The path of the route, e.g. '/api/v1/public/news/latest'.
+    :param query: Dict[str, str] - The query string arguments.
+    :return: bool - True if the response was rendered and cached.
+    """
+
+    with current_app.test_request_context(
+        path,
+        query_string=query or {},
+        environ_overrides={REFRESH_ENVIRON_KEY: True},
+    ):
+        view = current_app.view_functions[request.url_rule.endpoint]
+        response = make_response(view(**request.view_args))
+
+    return response.status_code == HTTPStatus.OK
@@ -0,0 +1,35 @@
+"""
+Metrics authentication decorator, for the Prometheus scraper
+"""
+
+import secrets
+from functools import wraps
+from os import environ
+from flask import request, jsonify
+from http import HTTPStatus
+
+
+def metrics_auth_required(f):
+    """Decorator to check if the request carries the metrics bearer token (`METRICS_AUTHORIZATION_KEY`)."""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        expected_key = environ.get("METRICS_AUTHORIZATION_KEY")
+        if not expected_key:
+            return jsonify({"error": "Metrics are disabled"}), HTTPStatus.NOT_FOUND
+
+        token = request.headers.get("Authorization")
+        if not token or not token.startswith("Bearer "):
+            return jsonify(
+                {"error": "Unauthorized, missing token"}
+            ), HTTPStatus.UNAUTHORIZED
+
+        # Compared as bytes, strings with non-ASCII characters raise TypeError
+        if not secrets.compare_digest(
+            token.split(" ", 1)[1].encode(), expected_key.encode()
+        ):
+            return jsonify({"error": "Invalid token"}), HTTPStatus.UNAUTHORIZED
+
+        return f(*args, **kwargs)
+
+    return decorated_function
@@ -38,6 +38,8 @@ from models.content import (
     Document,  # noqa: F401
     DocumentTranslation,  # noqa: F401
     Event,  # noqa: F401
+    EventOccurrence,  # noqa: F401
+    EventOccurrenceState,  # noqa: F401
     EventTranslation,  # noqa: F401
     Item,  # noqa: F401
     Media,  # noqa: F401
@@ -67,6 +69,9 @@ from models.core import (
 from models.utility import (
     DiscordMessages,  # noqa: F401
     RevokedTokens,  # noqa: F401
+    SearchDocument,  # noqa: F401
+    SearchIndexChange,  # noqa: F401
+    SearchIndexState,  # noqa: F401
 )
 from utility import db
 
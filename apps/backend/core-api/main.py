@@ -13,7 +13,7 @@ from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from werkzeug.middleware.proxy_fix import ProxyFix
-from utility import db, jwt, oauth, csrf
+from utility import db, jwt, oauth, csrf, ORJSONProvider
 from routes import register_v1_routes
 from rich.logging import RichHandler
 
@@ -43,6 +43,7 @@ logging.basicConfig(
 
 app = Flask(__name__)
 app.config.from_object("config")
+app.json = ORJSONProvider(app)
 
 # Enable proxy support
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
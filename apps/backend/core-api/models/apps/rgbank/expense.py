@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     MetaData,
     String,
     func,
@@ -101,7 +102,11 @@ class ExpenseDomain(db.Model):
 
 class Expense(db.Model):
     __tablename__ = "expense"
-    __table_args__ = {"schema": "rgbank"}
+    __table_args__ = (
+        # Keyset pagination, newest first
+        Index("ix_expense_created_at_expense_id", "created_at", "expense_id"),
+        {"schema": "rgbank"},
+    )
 
     expense_id = Column(
         UUID(as_uuid=True),
@@ -167,7 +172,8 @@ class Expense(db.Model):
 
     @committee_id.expression
     def committee_id(cls):
-        return func.jsonb_extract_path_text(cls.categories, "committee_id")
+        # Like the instance value, the committee of the first category
+        return cls.categories[0]["committee_id"].astext
 
     @property
     def committee(self) -> Committee | None:
@@ -229,7 +235,11 @@ class Expense(db.Model):
 
 class Invoice(db.Model):
     __tablename__ = "invoice"
-    __table_args__ = {"schema": "rgbank"}
+    __table_args__ = (
+        # Keyset pagination, newest first
+        Index("ix_invoice_created_at_invoice_id", "created_at", "invoice_id"),
+        {"schema": "rgbank"},
+    )
 
     invoice_id = Column(
         UUID(as_uuid=True),
@@ -298,7 +308,8 @@ class Invoice(db.Model):
 
     @committee_id.expression
     def committee_id(cls):
-        return func.jsonb_extract_path_text(cls.categories, "committee_id")
+        # Like the instance value, the committee of the first category
+        return cls.categories[0]["committee_id"].astext
 
     @property
     def committee(self) -> Committee | None:
@@ -1,11 +1,13 @@
 import uuid
 from typing import Any, Dict, List
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, inspect, text
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
 from utility.database import db
+from utility.fieldsets import Fieldset, nested, project, wants_relationship
+from utility.serializer import serialize_columns
 from utility.reception_mode import RECEPTION_MODE
 
 
@@ -60,26 +62,27 @@ class Committee(db.Model):
         return "<Committee %r>" % self.committee_id
 
     def to_dict(
-        self, provided_languages: List[str] = AVAILABLE_LANGUAGES
+        self,
+        provided_languages: List[str] = AVAILABLE_LANGUAGES,
+        fieldset: Fieldset | None = None,
     ) -> Dict[str, Any] | None:
-        columns = inspect(self)
+        data = serialize_columns(self)
 
-        if not columns:
+        if not data:
             return None
 
-        columns = columns.mapper.column_attrs.keys()
+        del data["committee_category_id"]
 
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
+        data["group_photo_url"] = self.group_photo_url if not RECEPTION_MODE else None
 
-        if not data:
-            return None
+        if not wants_relationship(fieldset, "translations"):
+            return project(data, fieldset)
 
         translation_lookup = {
             translation.language_code: translation for translation in self.translations
         }
         translations = []
+        translation_fieldset = nested(fieldset, "translations")
 
         for language_code in provided_languages:
             translation: CommitteeTranslation | None = translation_lookup.get(
@@ -92,15 +95,11 @@ class Committee(db.Model):
                 ) or next(iter(translation_lookup.values()), None)
 
             if translation and isinstance(translation, CommitteeTranslation):
-                translations.append(translation.to_dict())
-
-        del data["committee_category_id"]
-
-        data["group_photo_url"] = self.group_photo_url if not RECEPTION_MODE else None
+                translations.append(project(translation.to_dict(), translation_fieldset))
 
         data["translations"] = translations
 
-        return data
+        return project(data, fieldset)
 
 
 class CommitteeTranslation(db.Model):
@@ -128,17 +127,10 @@ class CommitteeTranslation(db.Model):
         return "<CommitteeTranslation %r>" % self.committee_translation_id
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["committee_translation_id"]
-        del data["committee_id"]
-
-        return data
+        return serialize_columns(
+            self,
+            exclude=(
+                "committee_translation_id",
+                "committee_id",
+            ),
+        )
@@ -1,8 +1,9 @@
 import uuid
 from typing import List
-from sqlalchemy import String, Column, ForeignKey, inspect, text
+from sqlalchemy import String, Column, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from utility.database import db
+from utility.serializer import serialize_columns
 from utility.constants import AVAILABLE_LANGUAGES
 from utility.translation import get_translation
 
@@ -28,15 +29,7 @@ class CommitteeCategory(db.Model):
         return "<CommitteeCategory %r>" % self.committee_category_id
 
     def to_dict(self, provided_languages: List[str] = AVAILABLE_LANGUAGES):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
+        data = serialize_columns(self)
 
         if not data:
             return {}
@@ -92,17 +85,10 @@ class CommitteeCategoryTranslation(db.Model):
         )
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["committee_category_translation_id"]
-        del data["committee_category_id"]
-
-        return data
+        return serialize_columns(
+            self,
+            exclude=(
+                "committee_category_translation_id",
+                "committee_category_id",
+            ),
+        )
@@ -9,14 +9,14 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     Boolean,
-    inspect,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from models.committees.committee import Committee
 from utility.database import db
-from utility.constants import AVAILABLE_LANGUAGES
-from utility.translation import get_translation
+from utility.fieldsets import Fieldset, nested, project, wants_relationship
+from utility.serializer import serialize_columns
+from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
 
 
 class CommitteePositionsRole(enum.Enum):
@@ -83,57 +83,55 @@ class CommitteePosition(db.Model):
         provided_languages: List[str] = AVAILABLE_LANGUAGES,
         is_public_route=True,
         include_parent=False,
+        fieldset: Fieldset | None = None,
     ) -> Dict[str, Any] | None:
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            data[column] = value
+        data = serialize_columns(self)
 
         if not data:
             return {}
 
-        translations = []
+        if wants_relationship(fieldset, "translations"):
+            translation_lookup = {
+                translation.language_code: translation
+                for translation in self.translations
+            }
+            translations: List[CommitteePositionTranslation] = []
 
-        for language_code in provided_languages:
-            translation = get_translation(
-                CommitteePositionTranslation,
-                ["committee_position_id"],
-                {"committee_position_id": self.committee_position_id},
-                language_code,
-            )
-            translations.append(translation)
+            for language_code in provided_languages:
+                translation: CommitteePositionTranslation | None = (
+                    translation_lookup.get(language_code)
+                    or translation_lookup.get(DEFAULT_LANGUAGE_CODE)
+                )
+
+                if not translation:
+                    translation = next(iter(translation_lookup.values()), None)
 
-        data["translations"] = [
-            translation.to_dict()
-            for translation in set(translations)
-            if translation is not None
-        ]
+                if translation and translation not in translations:
+                    translations.append(translation)
+
+            translation_fieldset = nested(fieldset, "translations")
+            data["translations"] = [
+                project(translation.to_dict(), translation_fieldset)
+                for translation in translations
+            ]
 
         if is_public_route:
             del data["role"]
 
         if include_parent and self.committee_id:
             del data["committee_id"]
-            parent_committee = Committee.query.filter_by(
-                committee_id=self.committee_id
-            ).first()
+            parent_committee: Committee | None = self.committee
 
             if not parent_committee or not isinstance(parent_committee, Committee):
-                return data
+                return project(data, fieldset)
 
-            data["committee"] = parent_committee.to_dict(
-                provided_languages=provided_languages,
-            )
+            if wants_relationship(fieldset, "committee"):
+                data["committee"] = parent_committee.to_dict(
+                    provided_languages=provided_languages,
+                    fieldset=nested(fieldset, "committee"),
+                )
 
-        return data
+        return project(data, fieldset)
 
 
 class CommitteePositionTranslation(db.Model):
@@ -169,20 +167,13 @@ class CommitteePositionTranslation(db.Model):
         )
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["committee_position_translation_id"]
-        del data["committee_position_id"]
-
-        return data
+        return serialize_columns(
+            self,
+            exclude=(
+                "committee_position_translation_id",
+                "committee_position_id",
+            ),
+        )
 
 
 class CommitteePositionRecruitment(db.Model):
@@ -218,37 +209,29 @@ class CommitteePositionRecruitment(db.Model):
         )
 
     def to_dict(self, provided_languages: List[str] = AVAILABLE_LANGUAGES):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
+        data = serialize_columns(self)
 
+        translation_lookup = {
+            translation.language_code: translation for translation in self.translations
+        }
         translations: List[CommitteePositionRecruitmentTranslation] = []
 
         for language_code in provided_languages:
-            translation = get_translation(
-                CommitteePositionRecruitmentTranslation,
-                ["committee_position_recruitment_id"],
-                {
-                    "committee_position_recruitment_id": self.committee_position_recruitment_id
-                },
-                language_code,
+            translation: CommitteePositionRecruitmentTranslation | None = (
+                translation_lookup.get(language_code)
+                or translation_lookup.get(DEFAULT_LANGUAGE_CODE)
             )
-            translations.append(translation)
 
-        data["translations"] = [
-            translation_dict
-            for translation in set(translations)
-            if (translation_dict := translation.to_dict()) is not None
-        ]
+            if not translation:
+                translation = next(iter(translation_lookup.values()), None)
+
+            if translation and translation not in translations:
+                translations.append(translation)
+
+        data["translations"] = [translation.to_dict() for translation in translations]
         del data["committee_position_recruitment_id"]
 
-        committee_position = CommitteePosition.query.get(data["committee_position_id"])
+        committee_position: CommitteePosition | None = self.committee_position
         del data["committee_position_id"]
 
         if not committee_position or not isinstance(
@@ -296,18 +279,11 @@ class CommitteePositionRecruitmentTranslation(db.Model):
     )
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["committee_position_recruitment_id"]
-        del data["committee_position_recruitment_translation_id"]
-        del data["language_code"]
-
-        return data
+        return serialize_columns(
+            self,
+            exclude=(
+                "committee_position_recruitment_id",
+                "committee_position_recruitment_translation_id",
+                "language_code",
+            ),
+        )
@@ -6,7 +6,14 @@ from .album import Album, AlbumTranslation
 from .media import Media, MediaTranslation
 from .base import Item, PublishedStatus
 from .document import Document, DocumentTranslation
-from .event import Event, RepeatableEvent, EventTranslation, Frequency
+from .event import (
+    Event,
+    EventOccurrence,
+    EventOccurrenceState,
+    EventTranslation,
+    Frequency,
+    RepeatableEvent,
+)
 from .news import News, NewsTranslation
 from .tags import Tag, TagTranslation
 
@@ -20,6 +27,8 @@ __all__ = [
     "Document",
     "DocumentTranslation",
     "Event",
+    "EventOccurrence",
+    "EventOccurrenceState",
     "RepeatableEvent",
     "EventTranslation",
     "Frequency",
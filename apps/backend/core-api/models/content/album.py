@@ -8,12 +8,12 @@ from sqlalchemy import (
     Integer,
     String,
     func,
-    inspect,
     text,
 )
 from models.content.media import Media
 from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
 from utility.database import db
+from utility.serializer import serialize_columns
 
 
 class Album(db.Model):
@@ -35,6 +35,12 @@ class Album(db.Model):
         "AlbumTranslation", back_populates="album", lazy="joined"
     )
     media = db.relationship("Media", back_populates="album", passive_deletes=True)
+    # The preview is not a foreign key, media can be deleted without clearing it
+    preview_media = db.relationship(
+        "Media",
+        primaryjoin="foreign(Album.preview_media_id) == Media.media_id",
+        viewonly=True,
+    )
 
     def to_dict(self, provided_languages: List[str] = AVAILABLE_LANGUAGES):
         data = {}
@@ -61,9 +67,7 @@ class Album(db.Model):
         data["updated_at"] = self.updated_at
 
         if self.preview_media_id:
-            media: Media | None = Media.query.filter_by(
-                media_id=self.preview_media_id
-            ).first()
+            media: Media | None = self.preview_media
 
             if not media:
                 data["preview_media"] = None
@@ -94,17 +98,4 @@ class AlbumTranslation(db.Model):
     language = db.relationship("Language", back_populates="album_translations")
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["album_translation_id"]
-        del data["album_id"]
-
-        return data
+        return serialize_columns(self, exclude=("album_translation_id", "album_id"))
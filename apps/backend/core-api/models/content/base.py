@@ -1,6 +1,6 @@
 import enum
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 from sqlalchemy import (
     Column,
     DateTime,
@@ -8,12 +8,14 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Boolean,
+    Index,
     func,
 )
-from sqlalchemy.inspection import inspect
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from utility.constants import AVAILABLE_LANGUAGES
 from utility.database import db
+from utility.fieldsets import Fieldset, nested, project, wants_relationship
+from utility.serializer import serialize_columns
 from datetime import datetime, timezone
 
 
@@ -49,6 +51,10 @@ class Item(db.Model):
     """
 
     __tablename__ = "item"
+    __table_args__ = (
+        # Keyset pagination, newest first
+        Index("ix_item_created_at_item_id", "created_at", "item_id"),
+    )
 
     item_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -83,7 +89,11 @@ class Item(db.Model):
         return f"<Item {self.item_id}, {self.type}>"
 
     def to_dict(
-        self, provided_languages: List[str] = AVAILABLE_LANGUAGES, is_public_route=True
+        self,
+        provided_languages: List[str] = AVAILABLE_LANGUAGES,
+        is_public_route=True,
+        fieldset: Fieldset | None = None,
+        author_summaries: Mapping[Any, Dict[str, Any]] | None = None,
     ) -> Dict[str, Any] | None:
         if not self.is_public is not None and self.is_public and is_public_route:
             return None
@@ -95,29 +105,25 @@ class Item(db.Model):
             ):
                 return None
 
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
+        data = serialize_columns(self, exclude=("item_id", "author_id"), fieldset=fieldset)
 
-        data = {}
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            data[column] = value
+        if not wants_relationship(fieldset, "author"):
+            return data
 
-        data["author"] = (
-            self.author.to_dict(
-                provided_languages=provided_languages, is_public_route=is_public_route
+        if author_summaries is not None:
+            # Serialized ahead of time by the public lists, see `services.core.public.author`
+            data["author"] = project(
+                author_summaries.get(self.author_id, {}), nested(fieldset, "author")
+            )
+        else:
+            data["author"] = (
+                self.author.to_dict(
+                    provided_languages=provided_languages,
+                    is_public_route=is_public_route,
+                    fieldset=nested(fieldset, "author"),
+                )
+                if self.author
+                else {}
             )
-            if self.author
-            else {}
-        )
-
-        del data["item_id"]
-        del data["author_id"]
 
         return data
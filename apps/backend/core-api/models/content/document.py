@@ -1,10 +1,12 @@
 import enum
 import uuid
-from typing import List
+from typing import Any, Dict, List, Mapping
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
-from sqlalchemy import Column, ForeignKey, String, inspect, Enum
+from sqlalchemy import Column, ForeignKey, String, Enum
 from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
 from utility.database import db
+from utility.fieldsets import Fieldset, nested, project, wants_relationship
+from utility.serializer import serialize_columns
 from models.content.base import Item
 
 
@@ -49,31 +51,32 @@ class Document(Item):
     __mapper_args__ = {"polymorphic_identity": "document"}
 
     def to_dict(
-        self, provided_languages: List[str] = AVAILABLE_LANGUAGES, is_public_route=True
+        self,
+        provided_languages: List[str] = AVAILABLE_LANGUAGES,
+        is_public_route=True,
+        fieldset: Fieldset | None = None,
+        author_summaries: Mapping[Any, Dict[str, Any]] | None = None,
     ):
         base_data = super().to_dict(
-            provided_languages=provided_languages, is_public_route=is_public_route
+            provided_languages=provided_languages,
+            is_public_route=is_public_route,
+            fieldset=fieldset,
+            author_summaries=author_summaries,
         )
 
-        if not base_data:
+        if base_data is None:
             return {}
 
-        columns = inspect(self)
+        base_data.update(serialize_columns(self, fieldset=fieldset))
 
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            base_data[column] = value
+        if not wants_relationship(fieldset, "translations"):
+            return base_data
 
         translation_lookup = {
             translation.language_code: translation for translation in self.translations
         }
         translations = []
+        translation_fieldset = nested(fieldset, "translations")
 
         for language_code in provided_languages:
             translation: DocumentTranslation | None = translation_lookup.get(language_code)
@@ -84,7 +87,7 @@ class Document(Item):
                 ) or next(iter(translation_lookup.values()), None)
 
             if translation and isinstance(translation, DocumentTranslation):
-                translations.append(translation.to_dict())
+                translations.append(project(translation.to_dict(), translation_fieldset))
 
         base_data["translations"] = translations
 
@@ -113,20 +116,6 @@ class DocumentTranslation(db.Model):
     language = db.relationship("Language", back_populates="document_translations")
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        if not data:
-            return {}
-
-        del data["document_translation_id"]
-        del data["document_id"]
-
-        return data
+        return serialize_columns(
+            self, exclude=("document_translation_id", "document_id")
+        )
@@ -1,21 +1,23 @@
 import enum
 import uuid
 from datetime import timedelta
-from typing import List
+from typing import Any, Dict, List, Mapping
 from sqlalchemy import (
     Boolean,
     Column,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     func,
-    inspect,
+    literal_column,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, TIMESTAMP, UUID
 from sqlalchemy.ext.hybrid import hybrid_property
 from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
 from utility.database import db
+from utility.serializer import serialize_columns
 from models.content.base import Item
 
 
@@ -97,32 +99,26 @@ class Event(Item):
 
     @end_date.expression
     def end_date(cls):
-        return cls.start_date + func.make_interval(mins=cls.duration)
+        # Without bound parameters, so the expression matches the one of the period index
+        return cls.start_date + cls.duration * literal_column("interval '1 minute'")
 
     def to_dict(
         self,
         provided_languages: List[str] = AVAILABLE_LANGUAGES,
         is_public_route=True,
         custom_start_date: str = None,
+        author_summaries: Mapping[Any, Dict[str, Any]] | None = None,
     ):
         data = super().to_dict(
-            provided_languages=provided_languages, is_public_route=is_public_route
+            provided_languages=provided_languages,
+            is_public_route=is_public_route,
+            author_summaries=author_summaries,
         )
 
         if data is None:
             return None
 
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            data[column] = value
+        data.update(serialize_columns(self))
 
         if not data:
             return None
@@ -158,6 +154,12 @@ class Event(Item):
         return data
 
 
+# The time taken up by an event, closed so events without a duration still overlap their start.
+# Overlapping a window (`EVENT_PERIOD.op("&&")(window)`) is answered by the GiST index below
+EVENT_PERIOD = func.tsrange(Event.start_date, Event.end_date, literal_column("'[]'"))
+Index("ix_event_period", EVENT_PERIOD, postgresql_using="gist")
+
+
 class EventTranslation(db.Model):
     __tablename__ = "event_translation"
 
@@ -181,20 +183,7 @@ class EventTranslation(db.Model):
     language = db.relationship("Language", back_populates="event_translations")
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["event_translation_id"]
-        del data["event_id"]
-
-        return data
+        return serialize_columns(self, exclude=("event_translation_id", "event_id"))
 
 
 class RepeatableEvent(db.Model):
@@ -218,3 +207,63 @@ class RepeatableEvent(db.Model):
 
     # Relationships
     event = db.relationship("Event", back_populates="repeatable_event")
+
+
+class EventOccurrence(db.Model):
+    """
+    An occurrence of an event within the materialized horizon, see `services.content.occurrences`.
+    Single events have one occurrence, recurring events one per repetition.
+
+    Attributes:
+        event_id: The event, part of the primary key
+        start_date: The start of the occurrence, part of the primary key
+        end_date: The end of the occurrence
+        calendar_id: The calendar of the event, copied so a calendar is read with a single range scan
+    """
+
+    __tablename__ = "event_occurrence"
+
+    event_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("event.event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    start_date = Column(TIMESTAMP, primary_key=True)
+    end_date = Column(TIMESTAMP, nullable=False)
+    calendar_id = Column(
+        UUID(as_uuid=True), ForeignKey("calendar.calendar_id", ondelete="CASCADE")
+    )
+
+    # Relationships
+    event = db.relationship("Event")
+
+    def __repr__(self):
+        return f"<EventOccurrence {self.event_id} {self.start_date}>"
+
+
+# Closed like `EVENT_PERIOD`, overlapping a window is answered by the GiST index below
+EVENT_OCCURRENCE_PERIOD = func.tsrange(
+    EventOccurrence.start_date, EventOccurrence.end_date, literal_column("'[]'")
+)
+Index(
+    "ix_event_occurrence_period", EVENT_OCCURRENCE_PERIOD, postgresql_using="gist"
+)
+
+
+class EventOccurrenceState(db.Model):
+    """
+    The window covered by the occurrence table, a single row.
+
+    Attributes:
+        event_occurrence_state_id: Primary key, always 1
+        materialized_from: Occurrences overlapping the window from this date are stored
+        materialized_until: Occurrences overlapping the window until this date (exclusive) are stored
+        refreshed_at: When the table was last rebuilt
+    """
+
+    __tablename__ = "event_occurrence_state"
+
+    event_occurrence_state_id = Column(Integer, primary_key=True, default=1)
+    materialized_from = Column(TIMESTAMP, nullable=False)
+    materialized_until = Column(TIMESTAMP, nullable=False)
+    refreshed_at = Column(TIMESTAMP, default=func.now(), nullable=False)
@@ -1,10 +1,12 @@
 import enum
-from typing import List
+from typing import Any, Dict, List, Mapping
 import uuid
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import Column, Enum, ForeignKey, String, inspect
+from sqlalchemy import Column, Enum, ForeignKey, String
 from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
 from utility.database import db
+from utility.fieldsets import Fieldset, nested, project, wants_relationship
+from utility.serializer import serialize_columns
 from models.content.base import Item
 
 
@@ -41,34 +43,33 @@ class Media(Item):
     __mapper_args__ = {"polymorphic_identity": "media"}
 
     def to_dict(
-        self, provided_languages: List[str] = AVAILABLE_LANGUAGES, is_public_route=True
+        self,
+        provided_languages: List[str] = AVAILABLE_LANGUAGES,
+        is_public_route=True,
+        fieldset: Fieldset | None = None,
+        author_summaries: Mapping[Any, Dict[str, Any]] | None = None,
     ):
         data = super().to_dict(
-            provided_languages=provided_languages, is_public_route=is_public_route
+            provided_languages=provided_languages,
+            is_public_route=is_public_route,
+            fieldset=fieldset,
+            author_summaries=author_summaries,
         )
 
         if data is None:
             return None
 
-        columns = inspect(self)
+        data.update(serialize_columns(self, fieldset=fieldset))
+        data.pop("media_id", None)
 
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            data[column] = value
-
-        if not data:
-            return None
+        if not wants_relationship(fieldset, "translations"):
+            return data
 
         translation_lookup = {
             translation.language_code: translation for translation in self.translations
         }
         translations = []
+        translation_fieldset = nested(fieldset, "translations")
 
         for language_code in provided_languages:
             translation: MediaTranslation | None = translation_lookup.get(language_code)
@@ -79,14 +80,10 @@ class Media(Item):
                 ) or next(iter(translation_lookup.values()), None)
 
             if translation and isinstance(translation, MediaTranslation):
-                translations.append(translation.to_dict())
+                translations.append(project(translation.to_dict(), translation_fieldset))
 
         data["translations"] = translations
 
-        del data["media_id"]
-
-        data["media_url"] = self.media_url
-
         return data
 
 
@@ -109,17 +106,4 @@ class MediaTranslation(db.Model):
     language = db.relationship("Language", back_populates="media_translations")
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["media_translation_id"]
-        del data["media_id"]
-
-        return data
+        return serialize_columns(self, exclude=("media_translation_id", "media_id"))
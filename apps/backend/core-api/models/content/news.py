@@ -1,9 +1,10 @@
 import uuid
-from typing import List
+from typing import Any, Dict, List, Mapping
 from sqlalchemy import Column, ForeignKey, String
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
-from sqlalchemy import inspect
 from utility.database import db
+from utility.fieldsets import Fieldset, nested, project, wants_relationship
+from utility.serializer import serialize_columns
 from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
 from models.content.base import Item
 
@@ -39,19 +40,33 @@ class News(Item):
     __mapper_args__ = {"polymorphic_identity": "news"}
 
     def to_dict(
-        self, provided_languages: List[str] = AVAILABLE_LANGUAGES, is_public_route=True
+        self,
+        provided_languages: List[str] = AVAILABLE_LANGUAGES,
+        is_public_route=True,
+        fieldset: Fieldset | None = None,
+        author_summaries: Mapping[Any, Dict[str, Any]] | None = None,
     ):
         base_data = super().to_dict(
-            provided_languages=provided_languages, is_public_route=is_public_route
+            provided_languages=provided_languages,
+            is_public_route=is_public_route,
+            fieldset=fieldset,
+            author_summaries=author_summaries,
         )
 
-        if not base_data:
+        if base_data is None:
             return None
 
+        if is_public_route:
+            base_data.pop("news_id", None)
+
+        if not wants_relationship(fieldset, "translations"):
+            return base_data
+
         translation_lookup = {
             translation.language_code: translation for translation in self.translations
         }
         translations = []
+        translation_fieldset = nested(fieldset, "translations")
 
         for language_code in provided_languages:
             translation: NewsTranslation | None = translation_lookup.get(language_code)
@@ -62,10 +77,7 @@ class News(Item):
                 ) or next(iter(translation_lookup.values()), None)
 
             if translation and isinstance(translation, NewsTranslation):
-                translations.append(translation.to_dict())
-
-        if is_public_route:
-            del base_data["news_id"]
+                translations.append(project(translation.to_dict(), translation_fieldset))
 
         base_data["translations"] = translations
 
@@ -94,18 +106,4 @@ class NewsTranslation(db.Model):
     language = db.relationship("Language", back_populates="news_translations")
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["news_translation_id"]
-        del data["news_id"]
-
-        return data
+        return serialize_columns(self, exclude=("news_translation_id", "news_id"))
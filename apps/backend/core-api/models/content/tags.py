@@ -1,11 +1,12 @@
 import enum
 from typing import List
 import uuid
-from sqlalchemy import Column, Enum, ForeignKey, String, inspect, text
+from sqlalchemy import Column, Enum, ForeignKey, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from utility.constants import AVAILABLE_LANGUAGES
 from utility.translation import get_translation
 from utility.database import db
+from utility.serializer import serialize_columns
 
 
 class TagCategory(enum.Enum):
@@ -31,18 +32,7 @@ class Tag(db.Model):
     translations = db.relationship("TagTranslation", back_populates="tag")
 
     def to_dict(self, provided_languages: List[str] = AVAILABLE_LANGUAGES):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            data[column] = value
+        data = serialize_columns(self)
 
         if not data:
             return {}
@@ -83,18 +73,11 @@ class TagTranslation(db.Model):
     language = db.relationship("Language", back_populates="tag_translations")
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        del data["tag_translation_id"]
-        del data["tag_id"]
-        del data["language_code"]
-
-        return data
+        return serialize_columns(
+            self,
+            exclude=(
+                "tag_translation_id",
+                "tag_id",
+                "language_code",
+            ),
+        )
@@ -3,6 +3,7 @@
 This includes module includes the following PostgreSQL tables:
 - Author, used for the author of user generated content like events, news, etc.
 - Calendar, used for the main calendar of the application, and also for committee specific calendars.
+- CalendarFeedToken, used for the secret authorising the iCal feed of a personal calendar.
 - Language, defines the languages available in the application, and all translation tables require a language.
 - Notifications, used for system notifications, and committee notifications.
 - NotificationSubscription, used for push notifications if a user has subscribed to them.
@@ -20,6 +21,7 @@ from .author import AuthorResource
 from .author import AuthorType
 
 from .calendar import Calendar
+from .calendar import CalendarFeedToken
 
 from .language import Language
 
@@ -44,6 +46,7 @@ __all__ = [
     "AuthorResource",
     "AuthorType",
     "Calendar",
+    "CalendarFeedToken",
     "Language",
     "NotificationType",
     "NotificationSubscription",
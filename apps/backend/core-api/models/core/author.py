@@ -13,6 +13,7 @@ from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.hybrid import hybrid_property
 from utility.constants import AVAILABLE_LANGUAGES
 from utility.database import db
+from utility.fieldsets import Fieldset, wants
 
 
 class AuthorType(enum.Enum):
@@ -140,20 +141,30 @@ class Author(db.Model):
         )
 
     def to_dict(
-        self, provided_languages: List[str] = AVAILABLE_LANGUAGES, is_public_route=True
+        self,
+        provided_languages: List[str] = AVAILABLE_LANGUAGES,
+        is_public_route=True,
+        fieldset: Fieldset | None = None,
     ) -> Dict[str, Any] | None:
         """
         Returns a dictionary representation of the model.
 
+        Args:
+            fieldset (Fieldset | None, optional): The selected attributes of the author. Defaults to None, for all.
+
         Returns:
             Dict[str, Any] | None: A dictionary containing the model's attributes.
         """
 
         author_data = {}
         if self.author_type == AuthorType.STUDENT and self.student:
-            author_data = self.student.to_dict(is_public_route=is_public_route)
+            author_data = self.student.to_dict(
+                is_public_route=is_public_route, fieldset=fieldset
+            )
         elif self.author_type == AuthorType.COMMITTEE and self.committee:
-            author_data = self.committee.to_dict(provided_languages=provided_languages)
+            author_data = self.committee.to_dict(
+                provided_languages=provided_languages, fieldset=fieldset
+            )
         elif (
             self.author_type == AuthorType.COMMITTEE_POSITION
             and self.committee_position
@@ -162,10 +173,12 @@ class Author(db.Model):
                 provided_languages=provided_languages,
                 is_public_route=is_public_route,
                 include_parent=True,
+                fieldset=fieldset,
             )
 
-        author_data["author_type"] = (
-            self.author_type.value if self.author_type else None
-        )
+        if wants(fieldset, "author_type"):
+            author_data["author_type"] = (
+                self.author_type.value if self.author_type else None
+            )
 
         return author_data
@@ -124,3 +124,30 @@ class Calendar(db.Model):
             dict: A dictionary containing the `name` and `is_root` attributes of the `Calendar` object.
         """
         return {"name": self.name, "is_root": self.is_root()}
+
+
+class CalendarFeedToken(db.Model):
+    """
+    The secret authorising the iCal feed of a personal calendar. A table of its own, since `db.create_all` creates new
+    tables but never alters existing ones, and it is never serialized with the calendar.
+
+    Attributes:
+        calendar_id: Primary key, the personal calendar
+        token: The secret, passed as the `token` of the feed
+        created_at: When the token was created or last replaced
+    """
+
+    __tablename__ = "calendar_feed_token"
+
+    calendar_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("calendar.calendar_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    token = Column(String(64), unique=True, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
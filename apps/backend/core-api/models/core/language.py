@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, inspect
+from sqlalchemy import Column, String
 from utility.database import db
+from utility.serializer import serialize_columns
 
 
 class Language(db.Model):
@@ -51,14 +52,4 @@ class Language(db.Model):
         return "<Language %r>" % self.language_code
 
     def to_dict(self):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
-
-        return data
+        return serialize_columns(self)
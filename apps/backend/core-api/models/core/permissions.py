@@ -1,9 +1,10 @@
 import enum
-from typing import Any, Dict, List
+from typing import Any, Dict
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, inspect
+from sqlalchemy import Column, Enum, ForeignKey, Integer
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from utility.database import db
+from utility.serializer import serialize_columns
 
 
 class Role(enum.Enum):
@@ -71,26 +72,4 @@ class StudentPermission(db.Model):
     student = db.relationship("Student", back_populates="permissions")
 
     def to_dict(self) -> Dict[str, Any] | None:
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            elif isinstance(value, List):
-                value = [v.value if isinstance(v, enum.Enum) else v for v in value]
-
-            data[column] = value
-
-        if not data:
-            return {}
-
-        del data["permission_id"]
-
-        return data
+        return serialize_columns(self, exclude=("permission_id",))
@@ -9,7 +9,6 @@ from sqlalchemy import (
     ForeignKey,
     String,
     func,
-    inspect,
     or_,
     text,
 )
@@ -18,6 +17,8 @@ from sqlalchemy.dialects.postgresql import UUID
 from models.utility.auth import RevokedTokens
 from utility.authorization import jwt
 from utility.database import db
+from utility.fieldsets import Fieldset, project
+from utility.serializer import serialize_columns
 from utility.reception_mode import RECEPTION_MODE
 
 
@@ -116,22 +117,10 @@ class Student(db.Model):
     def __repr__(self):
         return "<Student %r>" % self.student_id
 
-    def to_dict(self, is_public_route=True) -> Dict[str, Any] | None:
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-
-        data = {}
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            data[column] = value
-
-        del data["password_hash"]
+    def to_dict(
+        self, is_public_route=True, fieldset: Fieldset | None = None
+    ) -> Dict[str, Any] | None:
+        data = serialize_columns(self, exclude=("password_hash",))
 
         if is_public_route:
             if RECEPTION_MODE:
@@ -157,7 +146,8 @@ class Student(db.Model):
                     else:
                         data["profile_picture_url"] = self.profile_picture_url
 
-        return data
+        # The public names and pictures are computed from several columns, the projection is applied last
+        return project(data, fieldset)
 
 
 class Profile(db.Model):
@@ -206,24 +196,7 @@ class Profile(db.Model):
         if RECEPTION_MODE and is_public_route:
             return None
 
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-
-        data = {}
-        for column in columns:
-            value = getattr(self, column)
-            if isinstance(value, enum.Enum):
-                value = value.value
-            data[column] = value
-
-        del data["profile_id"]
-        del data["student_id"]
-
-        return data
+        return serialize_columns(self, exclude=("profile_id", "student_id"))
 
 
 class StudentMembership(db.Model):
@@ -268,22 +241,14 @@ class StudentMembership(db.Model):
     )
 
     def to_dict(self, is_public_route=True):
-        columns = inspect(self)
-
-        if not columns:
-            return None
-
-        columns = columns.mapper.column_attrs.keys()
-        data = {}
-        for column in columns:
-            data[column] = getattr(self, column)
+        data = serialize_columns(self)
 
         if is_public_route:
-            del data["student_positions_id"]
+            del data["student_membership_id"]
             del data["committee_position_id"]
 
         del data["student_id"]
-        student: Student | None = Student.query.get(self.student_id)
+        student: Student | None = self.student
 
         if not student:
             return None
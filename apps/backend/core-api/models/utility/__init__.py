@@ -6,8 +6,13 @@ from .auth import RevokedTokens
 
 from .discord import DiscordMessages
 
+from .search import SearchDocument, SearchIndexChange, SearchIndexState
+
 
 __all__ = [
     "RevokedTokens",
     "DiscordMessages",
+    "SearchDocument",
+    "SearchIndexChange",
+    "SearchIndexState",
 ]
@@ -0,0 +1,138 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from models.committees.committee import Committee, CommitteeTranslation
+from models.committees.committee_position import (
+    CommitteePosition,
+    CommitteePositionTranslation,
+)
+from models.content.album import Album, AlbumTranslation
+from models.content.document import Document, DocumentTranslation
+from models.content.media import Media, MediaTranslation
+from models.content.news import News, NewsTranslation
+from utility.constants import AVAILABLE_LANGUAGES
+from utility.database import db
+
+
+class SearchDocument(db.Model):
+    """
+    A single entry of the search index, serialised once per language so the search payload can be assembled without touching the source tables.
+
+    Attributes:
+        language_code: The language the entry is rendered in
+        document_type: The section of the search payload, e.g. 'news'
+        document_id: Primary key of the source row, e.g. the news_id
+        sort_key: Orders the entries within a section, newest first
+        data: The entry as a JSON object
+        updated_at: When the entry was last rebuilt
+    """
+
+    __tablename__ = "search_document"
+
+    language_code = Column(
+        String(20), ForeignKey("language.language_code"), primary_key=True
+    )
+    document_type = Column(String(50), primary_key=True)
+    document_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    sort_key = Column(DateTime, nullable=True)
+    data = Column(Text, nullable=False)
+    updated_at = Column(
+        DateTime, default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<SearchDocument {self.document_type} {self.document_id} {self.language_code}>"
+
+
+class SearchIndexChange(db.Model):
+    """
+    Journal of source rows that changed since the search index was last updated, one entry per language. Filled by the mapper listeners below, in the same transaction as the change itself, and removed once applied to the index of its language.
+
+    Attributes:
+        search_index_change_id: Primary key, increasing
+        language_code: The language whose index the change is pending for
+        document_type: The section of the search payload, e.g. 'news'
+        document_id: Primary key of the changed source row
+        created_at: When the change was recorded
+    """
+
+    __tablename__ = "search_index_change"
+
+    search_index_change_id = Column(Integer, primary_key=True, autoincrement=True)
+    language_code = Column(
+        String(20), ForeignKey("language.language_code"), nullable=False, index=True
+    )
+    document_type = Column(String(50), nullable=False)
+    document_id = Column(UUID(as_uuid=True), nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+
+
+class SearchIndexState(db.Model):
+    """
+    The version stamp of the search index for a language.
+
+    Attributes:
+        language_code: Primary key
+        version: Incremented every time the index changes
+        rebuilt_at: When the index was last rebuilt from scratch, None if it never was
+    """
+
+    __tablename__ = "search_index_state"
+
+    language_code = Column(
+        String(20), ForeignKey("language.language_code"), primary_key=True
+    )
+    version = Column(Integer, default=0, nullable=False)
+    rebuilt_at = Column(DateTime, nullable=True)
+
+
+# Source model -> (document type, attribute holding the source row ID)
+SEARCH_SOURCES = {
+    Committee: ("committees", "committee_id"),
+    CommitteeTranslation: ("committees", "committee_id"),
+    CommitteePosition: ("committee_positions", "committee_position_id"),
+    CommitteePositionTranslation: ("committee_positions", "committee_position_id"),
+    Album: ("albums", "album_id"),
+    AlbumTranslation: ("albums", "album_id"),
+    Document: ("documents", "document_id"),
+    DocumentTranslation: ("documents", "document_id"),
+    Media: ("media", "media_id"),
+    MediaTranslation: ("media", "media_id"),
+    News: ("news", "news_id"),
+    NewsTranslation: ("news", "news_id"),
+}
+
+
+def _record_search_change(document_type: str, id_attribute: str):
+    def listener(mapper, connection, target):
+        document_id = getattr(target, id_attribute)
+        if document_id is None:
+            return
+
+        connection.execute(
+            SearchIndexChange.__table__.insert().values(created_at=func.now()),
+            [
+                {
+                    "language_code": language_code,
+                    "document_type": document_type,
+                    "document_id": document_id,
+                }
+                for language_code in AVAILABLE_LANGUAGES
+            ],
+        )
+
+    return listener
+
+
+for model, (document_type, id_attribute) in SEARCH_SOURCES.items():
+    for event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, event_name, _record_search_change(document_type, id_attribute))
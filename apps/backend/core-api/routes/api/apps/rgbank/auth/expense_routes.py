@@ -24,9 +24,10 @@ from services.apps.rgbank import (
     has_access,
     has_full_authority,
     retrieve_accessible_cost_items,
+    retrieve_accessible_cost_items_page,
 )
 from services.utility.mail import send_expense_message
-from utility import db, rgbank_bucket, upload_file
+from utility import InvalidCursorError, db, rgbank_bucket, upload_file
 from utility.constants import DEFAULT_LANGUAGE_CODE
 
 expense_bp = Blueprint("expense", __name__)
@@ -175,9 +176,9 @@ def create_expense() -> Response:
 @expense_bp.route("/all", methods=["GET"])
 @jwt_required()
 def all_expenses():
-    """Gets all invoices
+    """Gets all expenses, or with a `cursor` argument (empty for the first page) a page of them
 
-    :return: The response object, 200 if successful
+    :return: The response object, 400 if the cursor is invalid, 404 if there are no expenses, 200 if successful
     :rtype: Response
     """
     student_id = get_jwt_identity()
@@ -186,29 +187,46 @@ def all_expenses():
         StudentMembership.student_id == student_id,
         StudentMembership.termination_date.is_(None),
     ).all()
+    cursor = request.args.get("cursor")
+    page = None
+
+    if cursor is not None:
+        try:
+            page = retrieve_accessible_cost_items_page(
+                cost_item=Expense,
+                memberships=memberships,
+                cursor=cursor,
+            )
+        except InvalidCursorError as e:
+            return jsonify({"error": str(e)}), HTTPStatus.BAD_REQUEST
 
-    page = request.args.get("page", 1, type=int)
+        if page is None:
+            return jsonify([]), HTTPStatus.NOT_FOUND
 
-    expenses: List[Expense] | None = retrieve_accessible_cost_items(
-        cost_item=Expense,
-        memberships=memberships,
-        page=page,
-    )
+        expenses = page.items
+    else:
+        expenses: List[Expense] | None = retrieve_accessible_cost_items(
+            cost_item=Expense,
+            memberships=memberships,
+        )
 
-    if not expenses:
-        return jsonify([]), HTTPStatus.NOT_FOUND
+        if not expenses:
+            return jsonify([]), HTTPStatus.NOT_FOUND
 
-    return jsonify(
-        [
-            expense.to_dict(
-                short=True,
-                is_public_route=False,
-                include_booked_item=True,
-                provided_languages=[language],
-            )
-            for expense in expenses
-        ]
-    ), HTTPStatus.OK
+    expenses_dict = [
+        expense.to_dict(
+            short=True,
+            is_public_route=False,
+            include_booked_item=True,
+            provided_languages=[language],
+        )
+        for expense in expenses
+    ]
+
+    if page is not None:
+        return jsonify(page.to_dict(expenses_dict)), HTTPStatus.OK
+
+    return jsonify(expenses_dict), HTTPStatus.OK
 
 
 @expense_bp.route("/<string:expense_id>", methods=["GET"])
@@ -24,9 +24,10 @@ from services.apps.rgbank import (
     has_access,
     has_full_authority,
     retrieve_accessible_cost_items,
+    retrieve_accessible_cost_items_page,
 )
 from services.utility.mail import send_expense_message
-from utility import db, rgbank_bucket, upload_file
+from utility import InvalidCursorError, db, rgbank_bucket, upload_file
 from utility.constants import DEFAULT_LANGUAGE_CODE
 
 invoice_bp = Blueprint("invoice", __name__)
@@ -172,9 +173,9 @@ def create_invoice() -> Response:
 @invoice_bp.route("/all", methods=["GET"])
 @jwt_required()
 def all_invoices():
-    """Gets all invoices
+    """Gets all invoices, or with a `cursor` argument (empty for the first page) a page of them
 
-    :return: The response object, 200 if successful
+    :return: The response object, 400 if the cursor is invalid, 404 if there are no invoices, 200 if successful
     :rtype: Response
     """
     student_id = get_jwt_identity()
@@ -183,28 +184,46 @@ def all_invoices():
         StudentMembership.student_id == student_id,
         StudentMembership.termination_date.is_(None),
     ).all()
-    page = request.args.get("page", 1, type=int)
+    cursor = request.args.get("cursor")
+    page = None
+
+    if cursor is not None:
+        try:
+            page = retrieve_accessible_cost_items_page(
+                cost_item=Invoice,
+                memberships=memberships,
+                cursor=cursor,
+            )
+        except InvalidCursorError as e:
+            return jsonify({"error": str(e)}), HTTPStatus.BAD_REQUEST
 
-    invoices: List[Invoice] = retrieve_accessible_cost_items(
-        cost_item=Invoice,
-        memberships=memberships,
-        page=page,
-    )
+        if page is None:
+            return jsonify([]), HTTPStatus.NOT_FOUND
 
-    if not invoices:
-        return jsonify([]), HTTPStatus.NOT_FOUND
+        invoices = page.items
+    else:
+        invoices: List[Invoice] | None = retrieve_accessible_cost_items(
+            cost_item=Invoice,
+            memberships=memberships,
+        )
 
-    return jsonify(
-        [
-            invoice.to_dict(
-                short=True,
-                is_public_route=False,
-                include_booked_item=True,
-                provided_languages=[language],
-            )
-            for invoice in invoices
-        ]
-    ), HTTPStatus.OK
+        if not invoices:
+            return jsonify([]), HTTPStatus.NOT_FOUND
+
+    invoices_dict = [
+        invoice.to_dict(
+            short=True,
+            is_public_route=False,
+            include_booked_item=True,
+            provided_languages=[language],
+        )
+        for invoice in invoices
+    ]
+
+    if page is not None:
+        return jsonify(page.to_dict(invoices_dict)), HTTPStatus.OK
+
+    return jsonify(invoices_dict), HTTPStatus.OK
 
 
 @invoice_bp.route("/<string:invoice_id>", methods=["GET"])
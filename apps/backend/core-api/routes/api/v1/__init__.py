@@ -10,7 +10,7 @@ import secrets
 import urllib
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Dict
 
 from flask import Flask, Response, jsonify, make_response, request, session
 from flask_jwt_extended import (
@@ -35,6 +35,8 @@ from services.utility.auth import (
     get_student_authorization,
     get_student_committee_details,
 )
+from services.utility.cache import invalidate_content_cache
+from services.utility.search import SEARCH_CACHE_TAGS
 from utility.authorization import jwt, oauth
 from utility.constants import (
     API_VERSION,
@@ -45,8 +47,76 @@ from utility.constants import (
     ROUTES,
 )
 from utility.database import db
+from utility.http_cache import CachePolicy, apply_cache_headers, check_not_modified
+from utility.query_stats import QueryBudget, record_query_stats, start_query_stats
 from utility.translation import retrieve_languages
 
+# Cache policies of the public routes, by endpoint or blueprint name. Routes without tags are validated by body hash,
+# e.g. because their response depends on the current time or on data that is not invalidated by tag.
+PUBLIC_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "public": CachePolicy(
+        max_age=5 * 60, tags=(*SEARCH_CACHE_TAGS, ROUTES.STUDENTS.value)
+    ),
+    "public.update_search_content": CachePolicy(max_age=0),
+    "public_news": CachePolicy(
+        max_age=5 * 60,
+        tags=(ROUTES.NEWS.value, ROUTES.COMMITTEES.value, ROUTES.STUDENTS.value),
+    ),
+    "public_documents": CachePolicy(max_age=5 * 60),
+    "public_media": CachePolicy(
+        max_age=5 * 60,
+        tags=(
+            ROUTES.MEDIA.value,
+            ROUTES.ALBUMS.value,
+            ROUTES.COMMITTEES.value,
+            ROUTES.STUDENTS.value,
+        ),
+    ),
+    "public_album": CachePolicy(
+        max_age=5 * 60, tags=(ROUTES.ALBUMS.value, ROUTES.MEDIA.value)
+    ),
+    "public_calendar": CachePolicy(max_age=5 * 60),
+    "public_committee_category": CachePolicy(
+        max_age=60 * 60, tags=(ROUTES.COMMITTEES.value,)
+    ),
+    "public_committee": CachePolicy(
+        max_age=60 * 60,
+        tags=(
+            ROUTES.COMMITTEES.value,
+            ROUTES.COMMITTEE_POSITIONS.value,
+            ROUTES.STUDENTS.value,
+        ),
+    ),
+    "public_committee_position": CachePolicy(
+        max_age=10 * 60,
+        tags=(ROUTES.COMMITTEE_POSITIONS.value, ROUTES.COMMITTEES.value),
+    ),
+    # Recruitments open and close without a write
+    "public_committee_position.get_all_committee_positions_recruitment": CachePolicy(
+        max_age=60
+    ),
+    "public_student": CachePolicy(
+        max_age=10 * 60,
+        tags=(
+            ROUTES.STUDENTS.value,
+            ROUTES.COMMITTEE_POSITIONS.value,
+            ROUTES.COMMITTEES.value,
+        ),
+    ),
+}
+
+# Query budgets of the routes whose lists are loaded in batches, by endpoint or blueprint name. A page of any size
+# should stay within them, exceeding one usually means a relationship is loaded per row again.
+QUERY_BUDGETS: Dict[str, QueryBudget] = {
+    "public_news": QueryBudget(max_queries=15),
+    "public_documents": QueryBudget(max_queries=15),
+    "public_media": QueryBudget(max_queries=15),
+    "public_album": QueryBudget(max_queries=15),
+    "public_committee": QueryBudget(max_queries=20),
+    "public_committee_position": QueryBudget(max_queries=10),
+    "public_student": QueryBudget(max_queries=15),
+}
+
 
 def register_v1_routes(app: Flask):
     """
@@ -77,6 +147,7 @@ def register_v1_routes(app: Flask):
         events_bp,
         media_bp,
         message_bp,
+        metrics_bp,
         news_bp,
         scheduler_bp,
         student_bp,
@@ -162,6 +233,8 @@ def register_v1_routes(app: Flask):
 
         app.register_blueprint(tasks_bp, url_prefix=f"{PROTECTED_PATH}/tasks")
 
+        app.register_blueprint(metrics_bp, url_prefix=f"{PROTECTED_PATH}/metrics")
+
     # RGBank Routes
     def register_rgbank_routes():
         """ "Register all routes for the RGBank app."""
@@ -202,6 +275,19 @@ def register_v1_routes(app: Flask):
     register_protected_routes()
     register_rgbank_routes()
 
+    # Registered first so the statements of every other hook are counted, `after_request` hooks run in reverse order
+    @app.before_request
+    def count_queries():
+        start_query_stats()
+
+    @app.after_request
+    def check_query_budget(response: Response):
+        return record_query_stats(response, QUERY_BUDGETS)
+
+    @app.before_request
+    def check_public_cache():
+        return check_not_modified(PUBLIC_CACHE_POLICIES)
+
     @app.after_request
     def add_headers(response: Response):
         response.headers["Content-Security-Policy"] = (
@@ -211,11 +297,9 @@ def register_v1_routes(app: Flask):
         response.headers["X-Content-Type-Options"] = "nosniff"
         response.headers["Referrer-Policy"] = "same-origin"
 
-        # If public route, set cache control to 10 minutes if not already set
-        if request.path.startswith(f"{PUBLIC_PATH}") and not response.headers.get(
-            "Cache-Control"
-        ):
-            response.headers["Cache-Control"] = "public, max-age=60"  # 1 minute
+        # If public route, set cache control and validators from the route policy
+        if request.path.startswith(f"{PUBLIC_PATH}"):
+            response = apply_cache_headers(response, PUBLIC_CACHE_POLICIES)
         elif request.path.startswith(f"{PROTECTED_PATH}") and not response.headers.get(
             "Cache-Control"
         ):
@@ -480,6 +564,7 @@ def register_v1_routes(app: Flask):
 
             db.session.add(student)
             db.session.commit()
+            invalidate_content_cache(ROUTES.STUDENTS.value)
 
         response = make_response({"student": student.to_dict(is_public_route=False)})
         expiration = timedelta(hours=1) if not remember else timedelta(days=14)
@@ -26,6 +26,8 @@ from .utility.message_routes import message_bp
 
 from .utility.task_routes import tasks_bp
 
+from .utility.metrics_routes import metrics_bp
+
 __all__ = [
     "album_bp",
     "calendar_bp",
@@ -39,4 +41,5 @@ __all__ = [
     "scheduler_bp",
     "message_bp",
     "tasks_bp",
+    "metrics_bp",
 ]
@@ -18,8 +18,10 @@ from models.committees import (
 )
 from models.core import Student, StudentMembership
 from services.committees.public import get_committee_by_title
+from services.utility.cache import invalidate_content_cache
+from utility.cache import committee_tag
 from utility.database import db
-from utility.constants import AVAILABLE_LANGUAGES
+from utility.constants import AVAILABLE_LANGUAGES, ROUTES
 from utility.translation import convert_iso_639_1_to_bcp_47
 
 
@@ -93,6 +95,9 @@ def create_committee_position() -> Response:
         )
 
     db.session.commit()
+    invalidate_content_cache(
+        ROUTES.COMMITTEE_POSITIONS.value, committee_tag(committee.committee_id)
+    )
 
     return jsonify(
         {"committee_position_id": new_position.committee_position_id}
@@ -159,6 +164,14 @@ def assign_student_to_committee_position(
 
     db.session.commit()
 
+    cache_tags = [ROUTES.COMMITTEE_POSITIONS.value, ROUTES.STUDENTS.value]
+    committee_position = CommitteePosition.query.filter_by(
+        committee_position_id=committee_position_id
+    ).one_or_none()
+    if committee_position:
+        cache_tags.append(committee_tag(committee_position.committee_id))
+    invalidate_content_cache(*cache_tags)
+
     return jsonify({}), HTTPStatus.OK
 
 
@@ -183,6 +196,9 @@ def soft_delete_committee_position(committee_position_id) -> Response:
     setattr(committee_position, "active", False)
 
     db.session.commit()
+    invalidate_content_cache(
+        ROUTES.COMMITTEE_POSITIONS.value, committee_tag(committee_position.committee_id)
+    )
 
     return jsonify({}), HTTPStatus.OK
 
@@ -229,6 +245,10 @@ def recruit_for_position(committee_position_id) -> Response:
 
         recruitment.end_date = func.now()
         db.session.commit()
+        invalidate_content_cache(
+            ROUTES.COMMITTEE_POSITIONS.value,
+            committee_tag(committee_position.committee_id),
+        )
 
         return jsonify({}), HTTPStatus.OK
 
@@ -280,6 +300,9 @@ def recruit_for_position(committee_position_id) -> Response:
         )
 
     db.session.commit()
+    invalidate_content_cache(
+        ROUTES.COMMITTEE_POSITIONS.value, committee_tag(committee_position.committee_id)
+    )
 
     return jsonify(
         {"committee_position_id": committee_position.committee_position_id}
@@ -9,7 +9,9 @@ from flask_jwt_extended import jwt_required
 from http import HTTPStatus
 from typing import Any, Dict, List
 from models.content import Album, AlbumTranslation
+from services.utility.cache import invalidate_content_cache
 from utility import db, convert_iso_639_1_to_bcp_47
+from utility.constants import ROUTES
 
 
 album_bp = Blueprint("album", __name__)
@@ -67,5 +69,6 @@ def create_album() -> Response:
         db.session.add(album_translation)
 
     db.session.commit()
+    invalidate_content_cache(ROUTES.ALBUMS.value)
 
     return jsonify({"album_id": album.album_id}), HTTPStatus.CREATED
@@ -11,7 +11,8 @@ from typing import List
 from models.committees import Committee, CommitteePosition
 from models.content import Document, DocumentTranslation
 from models.core import Student, StudentMembership, Author
-from services.content import create_item
+from services.content import create_item, get_item_cache_tags
+from services.utility.cache import invalidate_content_cache
 from utility import (
     AVAILABLE_LANGUAGES,
     upload_file,
@@ -174,6 +175,7 @@ def pin_document(document_id: str) -> Response:
 
     document.is_pinned = not document.is_pinned
     db.session.commit()
+    invalidate_content_cache(*get_item_cache_tags(document))
 
     return jsonify({}), HTTPStatus.NO_CONTENT
 
@@ -238,7 +240,9 @@ def delete_document(document_id: str) -> Response:
 
     db.session.flush()
 
+    cache_tags = get_item_cache_tags(document)
     db.session.delete(document)
     db.session.commit()
+    invalidate_content_cache(*cache_tags)
 
     return jsonify({}), HTTPStatus.NO_CONTENT
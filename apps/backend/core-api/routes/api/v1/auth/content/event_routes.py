@@ -18,8 +18,10 @@ from services.content import (
     delete_item,
 )
 from services.content.public import get_main_calendar
+from services.utility.cache import invalidate_content_cache
 from services.core.notifications import add_notification
 from utility.database import db
+from utility.constants import ROUTES
 from utility.logger import log_error
 
 
@@ -179,6 +181,7 @@ def create_event() -> Response:
 
         db.session.add(repeatable_event)
         db.session.commit()
+        invalidate_content_cache(ROUTES.EVENTS.value)
 
     if author_type.upper() == "COMMITTEE":
         # Find translation with 'en' language
@@ -12,7 +12,9 @@ from models.committees import Committee
 from models.content import Album, Media
 from models.core import Student
 from services.content import create_item
+from services.utility.cache import invalidate_content_cache
 from utility import AVAILABLE_LANGUAGES, upload_file, convert_iso_639_1_to_bcp_47, db
+from utility.constants import ROUTES
 
 
 media_bp = Blueprint("media", __name__)
@@ -157,4 +159,8 @@ def create_media() -> Response:
 
     db.session.commit()
 
+    if album_id is not None:
+        # The album counters and preview changed after create_item invalidated
+        invalidate_content_cache(ROUTES.ALBUMS.value)
+
     return jsonify({"message": "Media created successfully"}), HTTPStatus.CREATED
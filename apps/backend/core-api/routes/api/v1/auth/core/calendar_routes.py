@@ -3,15 +3,20 @@ Calendar Routes (Protected)
 API Endpoint: '/api/v1/calendar'
 """
 
-from calendar import monthrange
-from datetime import datetime, timedelta
+from uuid import UUID
 from flask import Blueprint, Response, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
 from http import HTTPStatus
-from sqlalchemy import or_
-from models.content import Event
-from models.core import Student
-from services.content import generate_ics
-from services.content.public import get_main_calendar
+from decorators import csrf_protected
+from services.content import (
+    get_ics_calendar_id,
+    get_ics_feed_token,
+    get_ics_last_modified,
+    get_ics_payload,
+    get_ics_window,
+    rotate_ics_feed_token,
+)
+from services.content.event import ICS_DEFAULT_MONTHS_AHEAD, ICS_DEFAULT_MONTHS_BACK
 from utility import retrieve_languages
 
 
@@ -21,57 +26,101 @@ calendar_bp = Blueprint("calendar", __name__)
 @calendar_bp.route("/ics")
 def get_calendar_ics() -> Response:
     """
-    Retrieves the calendar in iCalendar format
-        :return: Response - The response object,  404 if the student is not found, 400 if the student is not provided, 200 if successful
+    Retrieves a calendar and the calendars below it in iCalendar format, from the cache. Polls with a current ETag or Last-Modified are answered 304
+        :param u: UUID - The subscribing student
+        :param calendar: UUID - The calendar, optional, defaults to the main calendar
+        :param committee: UUID - The committee whose calendar is retrieved, optional
+        :param personal: bool - Whether the personal calendar of the student is retrieved, optional
+        :param token: str - The feed token of the personal calendar, required if personal
+        :param months_back: int - The number of past months included, optional, defaults to 1
+        :param months_ahead: int - The number of coming months included, optional, defaults to 1
+        :return: Response - The response object,  404 if the student or the calendar is not found, 400 if the student is not provided or an identifier is invalid, 500 if the feed could not be built, 304 if not modified, 200 if successful
     """
 
-    student = request.args.get("u", type=str)
+    student = request.args.get("u", type=UUID)
+    calendar = request.args.get("calendar", type=UUID)
+    committee = request.args.get("committee", type=UUID)
 
-    if not student:
+    if (
+        not student
+        or ("calendar" in request.args and not calendar)
+        or ("committee" in request.args and not committee)
+    ):
         return jsonify({}), HTTPStatus.BAD_REQUEST
 
-    student_exist = Student.query.get(student)
+    calendar_id = get_ics_calendar_id(
+        student,
+        calendar_id=calendar,
+        committee_id=committee,
+        personal=request.args.get("personal", "false").lower() in ("true", "1"),
+        token=request.args.get("token", type=str),
+    )
 
-    if not student_exist:
+    if not calendar_id:
         return jsonify({}), HTTPStatus.NOT_FOUND
 
     provided_langauges = retrieve_languages(request.args)
 
-    main_calendar = get_main_calendar()
+    window_start, window_end = get_ics_window(
+        months_back=request.args.get(
+            "months_back", ICS_DEFAULT_MONTHS_BACK, type=int
+        ),
+        months_ahead=request.args.get(
+            "months_ahead", ICS_DEFAULT_MONTHS_AHEAD, type=int
+        ),
+    )
 
-    date = datetime.now()
+    payload = get_ics_payload(
+        calendar_id, provided_langauges[0], window_start, window_end
+    )
 
-    start_date = (date - timedelta(days=1)).replace(day=1)
+    if not payload:
+        return jsonify(
+            {"error": "Failed to generate calendar"}
+        ), HTTPStatus.INTERNAL_SERVER_ERROR
 
-    # Handle year and month transition for the next month
-    if date.month == 12:
-        next_month = 1
-        next_month_year = date.year + 1
-    else:
-        next_month = date.month + 1
-        next_month_year = date.year
+    response = payload.to_response(request, mimetype="text/calendar")
+    response.headers["Cache-Control"] = "private, no-cache"
 
-    _, next_month_end_day = monthrange(next_month_year, next_month)
-    end_date = date.replace(
-        year=next_month_year, month=next_month, day=next_month_end_day
-    )  # Make end_date inclusive
+    last_modified = get_ics_last_modified(window_start)
+    if last_modified:
+        response.last_modified = last_modified
 
-    # Adjusted filter conditions for overlapping events and inclusivity
-    events = Event.query.filter(
-        Event.calendar_id == main_calendar.calendar_id,
-        or_(
-            Event.start_date <= end_date,  # Starts before or on the end date
-            Event.start_date >= start_date,  # Starts after or on the start date
-        ),
-    ).all()
+        # Clients polling with If-Modified-Since only
+        if response.status_code == HTTPStatus.OK:
+            response.make_conditional(request)
 
-    return Response(
-        response=generate_ics(
-            calendar=main_calendar,
-            events=events,
-            language=provided_langauges[0],
-        ),
-        status=HTTPStatus.OK,
-        headers={"Content-Type": "text/calendar"},
-        mimetype="text/calendar",
-    )
+    return response
+
+
+@calendar_bp.route("/feed_token", methods=["GET"])
+@jwt_required()
+def get_calendar_feed_token() -> Response:
+    """
+    Retrieves the feed token of the personal calendar of the student, authorising its personal feed. The token is created by POST
+        :return: Response - The response object, 404 if the student has no personal calendar or no token yet, 200 if successful
+    """
+
+    token = get_ics_feed_token(get_jwt_identity())
+
+    if not token:
+        return jsonify({"error": "Feed token not found"}), HTTPStatus.NOT_FOUND
+
+    return jsonify({"token": token}), HTTPStatus.OK
+
+
+@calendar_bp.route("/feed_token", methods=["POST"])
+@csrf_protected
+@jwt_required()
+def rotate_calendar_feed_token() -> Response:
+    """
+    Creates the feed token of the personal calendar of the student, or replaces it so that subscriptions with the previous token are refused
+        :return: Response - The response object, 404 if the student has no personal calendar, 200 if successful
+    """
+
+    token = rotate_ics_feed_token(get_jwt_identity())
+
+    if not token:
+        return jsonify({"error": "Personal calendar not found"}), HTTPStatus.NOT_FOUND
+
+    return jsonify({"token": token}), HTTPStatus.OK
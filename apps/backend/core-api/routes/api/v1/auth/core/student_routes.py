@@ -17,12 +17,13 @@ from models.core import Profile, Student
 from services.apps.rgbank.auth_service import get_bank_account
 from services.apps.rgbank.permission_service import attach_permissions
 from services.core import update, retrieve_notifications, subscribe_to_notifications
+from services.utility.cache import invalidate_content_cache
 from services.utility.auth import (
     get_student_authorization,
     get_student_committee_details,
 )
 from utility import delete_file, upload_file, retrieve_languages, db
-from utility.constants import DEFAULT_FILTER, POSSIBLE_FILTERS
+from utility.constants import DEFAULT_FILTER, POSSIBLE_FILTERS, ROUTES
 from utility.translation import convert_iso_639_1_to_bcp_47
 
 student_bp = Blueprint("student", __name__)
@@ -104,6 +105,7 @@ def update_profile() -> Response:
             setattr(profile, key, value)
 
     db.session.commit()
+    invalidate_content_cache(ROUTES.STUDENTS.value)
     return jsonify(profile.to_dict()), HTTPStatus.CREATED
 
 
@@ -157,6 +159,7 @@ def update_reception() -> Response:
         setattr(student, "reception_name", reception_name)
 
     db.session.commit()
+    invalidate_content_cache(ROUTES.STUDENTS.value)
 
     return jsonify({"message": "Updated"}), HTTPStatus.CREATED
 
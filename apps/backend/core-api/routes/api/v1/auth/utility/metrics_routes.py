@@ -0,0 +1,27 @@
+"""
+Metrics Routes (Protected), for Prometheus
+API Endpoint: '/api/v1/metrics'
+"""
+
+from http import HTTPStatus
+from flask import Blueprint, Response
+from decorators.metrics_auth import metrics_auth_required
+from utility.cache import get_cache_metrics
+
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("", methods=["GET"])
+@metrics_auth_required
+def get_metrics() -> Response:
+    """
+    Retrieves the cache and database metrics of all workers on this instance
+        :return: Response - The metrics in the Prometheus text format, 200 if successful
+    """
+
+    return Response(
+        get_cache_metrics(),
+        status=HTTPStatus.OK,
+        mimetype="text/plain; version=0.0.4",
+    )
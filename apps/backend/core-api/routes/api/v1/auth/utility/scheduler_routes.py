@@ -18,12 +18,16 @@ from models.core.notifications import (
     Notifications,
     SentNotifications,
 )
+from services.content import refresh_event_occurrences
 from services.core.notifications import send_notification
+from services.utility.search import refresh_search_index, update_search_cache
+from services.utility.warmers import run_warmers
 from services.utility.messages import (
     TopicType,
     send_discord_topic,
 )
-from utility import log_error, db
+from utility import AVAILABLE_LANGUAGES, log_error, db
+from utility.cache import CacheError, purge_expired_cache
 
 
 scheduler_bp = Blueprint("scheduler", __name__)
@@ -274,6 +278,88 @@ def check_upcoming_events():
     )
 
 
+@scheduler_bp.route("/search_index", methods=["POST"])
+@verify_google_oidc_token("https://api.medieteknik.com")
+def refresh_search_indexes():
+    """
+    Applies the change journal to the search index of every language, rebuilding it from scratch once a day, and refreshes the search cache.
+    Should run every few minutes, the cache warmers apply the journal as well.
+    """
+
+    indexed = {}
+    for language in AVAILABLE_LANGUAGES:
+        try:
+            indexed[language] = refresh_search_index(language)
+        except Exception as e:
+            db.session.rollback()
+            log_error(f"Error refreshing search index: {e}", language=language)
+            return {
+                "error": "Failed to refresh search index."
+            }, HTTPStatus.INTERNAL_SERVER_ERROR
+
+        update_search_cache(language)
+
+    return (
+        {
+            "message": "Search index refreshed successfully.",
+            "indexed": indexed,
+        },
+        HTTPStatus.OK,
+    )
+
+
+@scheduler_bp.route("/event_occurrences", methods=["POST"])
+@verify_google_oidc_token("https://api.medieteknik.com")
+def refresh_occurrences():
+    """
+    Rebuilds the materialized event occurrences over the current horizon, moving it forward. Should run daily.
+    """
+
+    try:
+        occurrences = refresh_event_occurrences()
+    except Exception as e:
+        db.session.rollback()
+        log_error(f"Error refreshing event occurrences: {e}")
+        return {
+            "error": "Failed to refresh event occurrences."
+        }, HTTPStatus.INTERNAL_SERVER_ERROR
+
+    return (
+        {
+            "message": "Event occurrences refreshed successfully.",
+            "occurrences": occurrences,
+        },
+        HTTPStatus.OK,
+    )
+
+
+@scheduler_bp.route("/warm_cache", methods=["POST"])
+@verify_google_oidc_token("https://api.medieteknik.com")
+def warm_cache():
+    """
+    Refreshes the cached public endpoints before they expire, and removes the expired entries of the cache. Should run more often than the shortest TTL of the warmed entries (10 minutes).
+    """
+
+    results = run_warmers()
+    failed = [name for name, success in results.items() if not success]
+
+    try:
+        purged = purge_expired_cache()
+    except CacheError as e:
+        log_error(f"Error purging expired cache entries: {e}")
+        purged = 0
+
+    return (
+        {
+            "message": "Cache warmed." if not failed else "Some warmers failed.",
+            "warmed": [name for name, success in results.items() if success],
+            "failed": failed,
+            "purged": purged,
+        },
+        HTTPStatus.OK if not failed else HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+
+
 @scheduler_bp.route("/dev/upcoming_events", methods=["GET"])
 def dev_check_upcoming_events():
     """
@@ -6,16 +6,13 @@ API Endpoint: '/api/v1/public/committee_positions'
 from http import HTTPStatus
 from flask import Blueprint, Response, jsonify, request
 from typing import List
-from sqlalchemy import func
-from models.committees import (
-    Committee,
-    CommitteePosition,
-    CommitteePositionRecruitment,
-)
+from models.committees import Committee, CommitteePosition
 from services.committees.public import (
     get_committee_by_title,
     get_committee_position_by_title,
+    get_open_recruitments,
 )
+from services.utility import COMMITTEE_POSITION_LOADER_OPTIONS
 from utility import retrieve_languages
 
 
@@ -36,15 +33,23 @@ def get_all_positions() -> Response:
 
     committee_positions = []
     if position_type == "committee":
-        committee_positions: List[CommitteePosition] = CommitteePosition.query.filter(
-            CommitteePosition.committee_id != None,  # noqa
-            CommitteePosition.base != True,  # noqa
-            CommitteePosition.role != "MEMBER",
-        ).all()
+        committee_positions: List[CommitteePosition] = (
+            CommitteePosition.query.filter(
+                CommitteePosition.committee_id != None,  # noqa
+                CommitteePosition.base != True,  # noqa
+                CommitteePosition.role != "MEMBER",
+            )
+            .options(*COMMITTEE_POSITION_LOADER_OPTIONS)
+            .all()
+        )
     elif position_type == "independent":
-        committee_positions: List[CommitteePosition] = CommitteePosition.query.filter(
-            CommitteePosition.committee_id == None  # noqa
-        ).all()
+        committee_positions: List[CommitteePosition] = (
+            CommitteePosition.query.filter(
+                CommitteePosition.committee_id == None  # noqa
+            )
+            .options(*COMMITTEE_POSITION_LOADER_OPTIONS)
+            .all()
+        )
 
     return jsonify(
         [
@@ -64,25 +69,8 @@ def get_all_committee_positions_recruitment() -> Response:
     provided_languages = retrieve_languages(request.args)
     committee_name = request.args.get("committee", type=str, default="all")
 
-    recruitments: List[CommitteePositionRecruitment] = []
-
     if committee_name == "all":
-        recruitments = CommitteePositionRecruitment.query.filter(
-            CommitteePositionRecruitment.start_date <= func.now(),
-            CommitteePositionRecruitment.end_date >= func.now(),
-        ).all()
-        return jsonify(
-            [
-                recruitment_dict
-                for recruitment in recruitments
-                if (
-                    recruitment_dict := recruitment.to_dict(
-                        provided_languages=provided_languages
-                    )
-                )
-                is not None
-            ]
-        ), HTTPStatus.OK
+        return jsonify(get_open_recruitments(provided_languages)), HTTPStatus.OK
 
     found_committee: Committee | None = get_committee_by_title(
         committee_name,
@@ -90,28 +78,11 @@ def get_all_committee_positions_recruitment() -> Response:
     if not found_committee:
         return jsonify([])
 
-    recruitments = (
-        CommitteePositionRecruitment.query.filter(
-            CommitteePositionRecruitment.start_date <= func.now(),
-            CommitteePositionRecruitment.end_date >= func.now(),
-        )
-        .join(CommitteePosition)
-        .filter(CommitteePosition.committee_id == found_committee.committee_id)
-        .all()
-    )
-
-    recruitment_dicts = [
-        recruitment_dict
-        for recruitment in recruitments
-        if (
-            recruitment_dict := recruitment.to_dict(
-                provided_languages=provided_languages
-            )
+    return jsonify(
+        get_open_recruitments(
+            provided_languages, committee_id=found_committee.committee_id
         )
-        is not None
-    ]
-
-    return jsonify(recruitment_dicts), HTTPStatus.OK
+    ), HTTPStatus.OK
 
 
 @public_committee_position_bp.route("/<string:position_title>", methods=["GET"])
@@ -6,6 +6,7 @@ API Endpoint: '/api/v1/public/committees'
 from http import HTTPStatus
 from typing import List
 from flask import Blueprint, Response, request, jsonify
+from decorators.cached_response import cached_response
 from models.committees import CommitteePosition
 from services.committees.public import (
     get_all_committee_categories,
@@ -17,6 +18,8 @@ from services.committees.public import (
     get_committee_category_by_title,
 )
 from utility import retrieve_languages
+from utility.fieldsets import parse_fieldset
+from utility.constants import ROUTES
 
 public_committee_category_bp = Blueprint("public_committee_category", __name__)
 public_committee_bp = Blueprint("public_committee", __name__)
@@ -59,15 +62,18 @@ def get_committee_category_by_name(committee_category_title: str) -> Response:
 
 
 @public_committee_bp.route("", methods=["GET"])
+@cached_response(ttl=60 * 60, stale_ttl=10 * 60, tags=[ROUTES.COMMITTEES.value])
 def get_committees() -> Response:
     """
-    Retrieves all committees
+    Retrieves all committees, with the attributes selected by the optional `fields` and `include` arguments
         :return: Response - The response object, 200 if successful
     """
 
     provided_languages = retrieve_languages(request.args)
 
-    return jsonify(get_all_committees(provided_languages)), HTTPStatus.OK
+    return jsonify(
+        get_all_committees(provided_languages, fieldset=parse_fieldset(request.args))
+    ), HTTPStatus.OK
 
 
 @public_committee_bp.route("/<string:committee_title>", methods=["GET"])
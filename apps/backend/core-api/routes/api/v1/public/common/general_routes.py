@@ -4,11 +4,20 @@ API Endpoint: '/api/v1/public'
 """
 
 from http import HTTPStatus
-import json
+import hashlib
 from flask import Blueprint, Response, jsonify, request
-from services.utility.search import update_search_cache
-from utility.cache import get_cache
+from services.utility.search import (
+    SEARCH_CACHE_TAGS,
+    SEARCH_DOCUMENT_TYPES,
+    get_search_index_version,
+    get_search_payload,
+    update_search_cache,
+)
+from services.utility.search_index import SEARCH_QUERY_CACHE_TTL, search
+from utility.cache import get_cache, language_tag, set_cache
 from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE_CODE
+from utility.json_provider import json_dumps
+from utility.logger import log_error
 from utility.translation import convert_iso_639_1_to_bcp_47, retrieve_languages
 
 public_bp = Blueprint("public", __name__)
@@ -17,8 +26,11 @@ public_bp = Blueprint("public", __name__)
 @public_bp.route("/search", methods=["GET"])
 def search_content() -> Response:
     """
-    Retrieves all translations
-        :return: Response - The response object, 200 if successful
+    Retrieves all translations, or the ranked matches of a query if `q` is given
+        :param q: str - The query, optional
+        :param type: str - Comma separated document types to return, e.g. 'news,documents', optional
+        :param limit: int - Maximum number of results, defaults to 20
+        :return: Response - The response object, 400 if the type or limit is invalid, 200 if successful
     """
 
     language = request.args.get("language", DEFAULT_LANGUAGE_CODE)
@@ -27,48 +39,81 @@ def search_content() -> Response:
     if language not in AVAILABLE_LANGUAGES:
         return jsonify({"error": "Language not available"}), HTTPStatus.NOT_FOUND
 
-    cached_data = None
+    if "q" in request.args:
+        return search_by_query(language)
 
     try:
-        cached_data = get_cache(f"search_{language}")
-    except Exception as e:
-        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
-
-    if not cached_data:
-        cached_data = update_search_cache(language)
-
-    if not cached_data:
+        payload = get_search_payload(language)
+    except Exception:
+        log_error("Failed to retrieve search data", language=language)
         return jsonify(
             {"error": "Failed to retrieve search data"}
         ), HTTPStatus.INTERNAL_SERVER_ERROR
 
-    cached_data_json = json.loads(cached_data)
-    data = cached_data_json
+    return payload.to_response(request)
 
-    if "data" in cached_data_json:
-        data = cached_data_json["data"]
 
-    if "committees" not in data:
-        return jsonify(
-            {"error": "Failed to retrieve search data"}
-        ), HTTPStatus.INTERNAL_SERVER_ERROR
+def search_by_query(language: str) -> Response:
+    query = request.args.get("q", "").strip()
 
-    if isinstance(data, dict):
-        return jsonify(data), HTTPStatus.OK
+    types = [
+        document_type.strip()
+        for document_type in request.args.get("type", "").split(",")
+        if document_type.strip()
+    ]
+    invalid_types = [
+        document_type
+        for document_type in types
+        if document_type not in SEARCH_DOCUMENT_TYPES
+    ]
+    if invalid_types:
+        return jsonify(
+            {"error": f"Invalid type: {', '.join(invalid_types)}"}
+        ), HTTPStatus.BAD_REQUEST
 
     try:
-        data = json.loads(data)
-    except json.JSONDecodeError:
+        limit = int(request.args.get("limit", 20))
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), HTTPStatus.BAD_REQUEST
+
+    if limit < 1 or limit > 100:
         return jsonify(
-            {"error": "Failed to parse data as JSON"}
-        ), HTTPStatus.INTERNAL_SERVER_ERROR
+            {"error": "Limit must be between 1 and 100"}
+        ), HTTPStatus.BAD_REQUEST
 
-    return jsonify(data), HTTPStatus.OK
+    query_hash = hashlib.sha1(
+        f"{query}|{','.join(sorted(types))}|{limit}".encode("utf-8")
+    ).hexdigest()
+    # Keyed by the version of the index, so that results ranked before a refresh are not served after it
+    cache_key = (
+        f"search_{language}_query_{get_search_index_version(language)}_{query_hash}"
+    )
+
+    try:
+        cached_data = get_cache(cache_key)
+    except Exception as e:
+        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+    if not cached_data:
+        cached_data = json_dumps(
+            search(language, query, types=types or None, limit=limit)
+        )
+        try:
+            set_cache(
+                cache_key,
+                cached_data,
+                ttl=SEARCH_QUERY_CACHE_TTL,
+                tags=[*SEARCH_CACHE_TAGS, language_tag(language)],
+            )
+        except Exception:
+            log_error("Failed to cache search results", language=language)
+
+    return Response(cached_data, status=HTTPStatus.OK, mimetype="application/json")
 
 
 @public_bp.route("/search/update", methods=["GET"])
 def update_search_content():
-    # TODO: Add GCP scheduler to update search data
+    # Kept for manual refreshes, the scheduler keeps the search data warm (see services/utility/warmers.py)
     language = retrieve_languages(args=request.args, fallback=False)[0]
     result = update_search_cache(language)
 
@@ -5,7 +5,9 @@ API Endpoint: '/api/v1/public/albums'
 
 from http import HTTPStatus
 from flask import Blueprint, Response, jsonify, request
-from models.content import Album, AlbumTranslation
+from sqlalchemy.orm import selectinload
+from models.content import Album, AlbumTranslation, Media
+from services.utility import ALBUM_LOADER_OPTIONS, get_item_loader_options
 from utility import retrieve_languages
 
 
@@ -29,16 +31,22 @@ def get_albums() -> Response:
             AlbumTranslation.title.ilike(f"%{search_query}%")
             | AlbumTranslation.description.ilike(f"%{search_query}%")
         ).paginate(max_per_page=10)
-        paginated_albums = Album.query.filter(
-            Album.album_id.in_(
-                [
-                    album_translation.album_id
-                    for album_translation in album_translations.items
-                ]
+        paginated_albums = (
+            Album.query.options(*ALBUM_LOADER_OPTIONS)
+            .filter(
+                Album.album_id.in_(
+                    [
+                        album_translation.album_id
+                        for album_translation in album_translations.items
+                    ]
+                )
             )
-        ).paginate(max_per_page=10)
+            .paginate(max_per_page=10)
+        )
     else:
-        paginated_albums = Album.query.paginate(max_per_page=10)
+        paginated_albums = Album.query.options(*ALBUM_LOADER_OPTIONS).paginate(
+            max_per_page=10
+        )
     albums = paginated_albums.items
 
     album_dicts = [
@@ -69,7 +77,10 @@ def get_album(album_id) -> Response:
 
     provided_languages = retrieve_languages(args=request.args)
 
-    album = Album.query.get_or_404(album_id)
+    album = Album.query.options(
+        *ALBUM_LOADER_OPTIONS,
+        selectinload(Album.media).options(*get_item_loader_options(Media)),
+    ).get_or_404(album_id)
 
     album_dict = album.to_dict(provided_languages=provided_languages)
     media_dicts = [
@@ -7,9 +7,15 @@ from datetime import datetime, timedelta
 from flask import Blueprint, Response, jsonify, request
 from http import HTTPStatus
 from sqlalchemy import or_
-from models.content import Document, DocumentTranslation
-from services.content.public import get_item_by_url
-from utility import retrieve_languages
+from models.content import Document, DocumentTranslation, Item
+from services.content.public import (
+    ITEM_KEYSET_KEYS,
+    get_item_author_summaries,
+    get_item_by_url,
+)
+from services.utility.loader_options import get_item_loader_options
+from utility import InvalidCursorError, keyset_paginate, retrieve_languages
+from utility.fieldsets import parse_fieldset
 
 
 public_documents_bp = Blueprint("public_documents", __name__)
@@ -18,17 +24,22 @@ public_documents_bp = Blueprint("public_documents", __name__)
 @public_documents_bp.route("", methods=["GET"])
 def get_documents() -> Response:
     """
-    Retrieves all documents with optional search and status filters
-        :return: Response - The response object, 200 if successful
+    Retrieves all documents with optional search and status filters, by page number or, with a `cursor` argument
+    (empty for the first page), by cursor. The optional `fields` and `include` arguments select the attributes of the
+    documents.
+        :return: Response - The response object, 400 if the cursor is invalid, 200 if successful
     """
 
     provided_languages = retrieve_languages(request.args)
     status = request.args.get("status", type=str, default="active")
     search = request.args.get("search", type=str, default=None)
-    documents_pagination = None
+    cursor = request.args.get("cursor")
+    fieldset = parse_fieldset(request.args)
+    documents_query = None
+    keyset_keys = ITEM_KEYSET_KEYS
 
     if search:
-        documents_pagination = (
+        documents_query = (
             Document.query.order_by(Document.created_at.desc())
             .join(
                 DocumentTranslation,
@@ -38,46 +49,81 @@ def get_documents() -> Response:
                 DocumentTranslation.title.ilike(f"%{search}%"),
                 Document.is_public == True,  # noqa: E712
             )
-            .paginate(per_page=30, max_per_page=30)
         )
 
     if status == "active" and not search:
-        documents_pagination = (
-            Document.query.order_by(
-                Document.is_pinned.desc(), Document.created_at.desc()
-            )
-            .filter(
-                Document.is_public == True,  # noqa: E712
-                or_(
-                    Document.created_at >= datetime.now() - timedelta(days=365),
-                    Document.is_pinned == True,  # noqa: E712
-                ),
-            )
-            .paginate(per_page=30, max_per_page=30)
+        documents_query = Document.query.order_by(
+            Document.is_pinned.desc(), Document.created_at.desc()
+        ).filter(
+            Document.is_public == True,  # noqa: E712
+            or_(
+                Document.created_at >= datetime.now() - timedelta(days=365),
+                Document.is_pinned == True,  # noqa: E712
+            ),
         )
+        # Pinned documents first
+        keyset_keys = (Item.is_pinned, *ITEM_KEYSET_KEYS)
     elif status == "archived" and not search:
-        documents_pagination = (
-            Document.query.order_by(Document.created_at.desc())
-            .filter(
-                Document.is_public == True,  # noqa: E712
-                Document.created_at < datetime.now() - timedelta(days=365),
-                Document.is_pinned == False,  # noqa: E712
+        documents_query = Document.query.order_by(Document.created_at.desc()).filter(
+            Document.is_public == True,  # noqa: E712
+            Document.created_at < datetime.now() - timedelta(days=365),
+            Document.is_pinned == False,  # noqa: E712
+        )
+
+    documents_query = documents_query.options(
+        *get_item_loader_options(Document, fieldset, load_authors=False)
+    )
+
+    if cursor is not None:
+        try:
+            page = keyset_paginate(
+                documents_query, keyset_keys, cursor=cursor, per_page=30
             )
-            .paginate(per_page=30, max_per_page=30)
+        except InvalidCursorError as e:
+            return jsonify({"error": str(e)}), HTTPStatus.BAD_REQUEST
+
+        author_summaries = get_item_author_summaries(
+            page.items, provided_languages, fieldset
         )
 
+        # No total, the filters depend on the current time so a count could not be reused
+        return jsonify(
+            page.to_dict(
+                [
+                    document_dict
+                    for document in page.items
+                    if (
+                        document_dict := document.to_dict(
+                            is_public_route=True,
+                            provided_languages=provided_languages,
+                            fieldset=fieldset,
+                            author_summaries=author_summaries,
+                        )
+                    )
+                    is not None
+                ]
+            )
+        ), HTTPStatus.OK
+
+    documents_pagination = documents_query.paginate(per_page=30, max_per_page=30)
+
     documents = documents_pagination.items
+    author_summaries = get_item_author_summaries(
+        documents, provided_languages, fieldset
+    )
     document_dict = [
         document_dict
         for document in documents
         if (
             document_dict := document.to_dict(
-                is_public_route=True, provided_languages=provided_languages
+                is_public_route=True,
+                provided_languages=provided_languages,
+                fieldset=fieldset,
+                author_summaries=author_summaries,
             )
         )
         is not None
     ]
-
     return jsonify(
         {
             "items": document_dict,
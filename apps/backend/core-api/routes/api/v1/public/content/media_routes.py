@@ -11,6 +11,8 @@ from services.content.public.item import (
     get_items_from_author,
     get_latest_items,
 )
+from utility.fieldsets import parse_fieldset
+from utility.pagination import InvalidCursorError, wants_total
 from utility.translation import retrieve_languages
 
 
@@ -21,9 +23,10 @@ public_media_bp = Blueprint("public_media", __name__)
 @public_media_bp.route("/author/<string:author_id>")
 def get_media_by_author(author_id: str) -> Response:
     """
-    Retrieves all media by author
+    Retrieves all media by author, by page number or, with a `cursor` argument (empty for the first page), by cursor.
+    The optional `fields` and `include` arguments select the attributes of the items.
         :param author_id: str - The author id
-        :return: Response - The response object, 404 if the author is not found, 200 if successful
+        :return: Response - The response object, 400 if the cursor is invalid, 404 if the author is not found, 200 if successful
     """
 
     provided_languages = retrieve_languages(request.args)
@@ -36,21 +39,34 @@ def get_media_by_author(author_id: str) -> Response:
     if not author:
         return jsonify({}), HTTPStatus.NOT_FOUND
 
-    return jsonify(
-        get_items_from_author(author, Media, provided_languages)
-    ), HTTPStatus.OK
+    try:
+        return jsonify(
+            get_items_from_author(
+                author,
+                Media,
+                provided_languages,
+                cursor=request.args.get("cursor"),
+                include_total=wants_total(),
+                fieldset=parse_fieldset(request.args),
+            )
+        ), HTTPStatus.OK
+    except InvalidCursorError as e:
+        return jsonify({"error": str(e)}), HTTPStatus.BAD_REQUEST
 
 
 @public_media_bp.route("/latest")
 def get_latest_media() -> Response:
     """
-    Retrieves the latest media items
+    Retrieves the latest media items, with the attributes selected by the optional `fields` and `include` arguments
         :return: Response - The response object, 200 if successful
     """
 
     provided_languages = retrieve_languages(request.args)
     return jsonify(
         get_latest_items(
-            item_table=Media, count=10, provided_languages=provided_languages
+            item_table=Media,
+            count=10,
+            provided_languages=provided_languages,
+            fieldset=parse_fieldset(request.args),
         )
     ), HTTPStatus.OK
@@ -5,10 +5,13 @@ API Endpoint: '/api/v1/public/news'
 
 from http import HTTPStatus
 from flask import Blueprint, Response, request, jsonify
+from decorators.cached_response import cached_response
 from models.content import News
 from models.core import AuthorType, Author, Student
 from services.core import get_author_from_email
-from utility import retrieve_languages
+from utility import InvalidCursorError, retrieve_languages, wants_total
+from utility.fieldsets import parse_fieldset
+from utility.constants import ROUTES
 from services.content.public import (
     get_latest_items,
     get_item_by_url,
@@ -22,19 +25,40 @@ public_news_bp = Blueprint("public_news", __name__)
 @public_news_bp.route("", methods=["GET"])
 def get_news() -> Response:
     """
-    Retrieves all news
-        :return: Response - The response object, 200 if successful
+    Retrieves all news, by page number or, with a `cursor` argument (empty for the first page), by cursor.
+    The optional `fields` and `include` arguments select the attributes of the items.
+        :return: Response - The response object, 400 if the cursor is invalid, 200 if successful
     """
 
     provided_languages = retrieve_languages(request.args)
     author_id = request.args.get("author")
+    cursor = request.args.get("cursor")
+    fieldset = parse_fieldset(request.args)
+
+    try:
+        if author_id:
+            return jsonify(
+                get_items_from_author(
+                    Author.query.get(author_id),
+                    News,
+                    provided_languages,
+                    cursor=cursor,
+                    include_total=wants_total(),
+                    fieldset=fieldset,
+                )
+            ), HTTPStatus.OK
 
-    if author_id:
         return jsonify(
-            get_items_from_author(Author.query.get(author_id), News, provided_languages)
+            get_items(
+                News,
+                provided_languages,
+                cursor=cursor,
+                include_total=wants_total(),
+                fieldset=fieldset,
+            )
         ), HTTPStatus.OK
-
-    return jsonify(get_items(News, provided_languages)), HTTPStatus.OK
+    except InvalidCursorError as e:
+        return jsonify({"error": str(e)}), HTTPStatus.BAD_REQUEST
 
 
 @public_news_bp.route("/student/<string:email>", methods=["GET"])
@@ -84,13 +108,28 @@ def get_news_by_url(url: str) -> Response:
 
 
 @public_news_bp.route("/latest", methods=["GET"])
+@cached_response(
+    ttl=60 * 60,
+    stale_ttl=10 * 60,
+    # The items embed their authors
+    tags=[
+        ROUTES.NEWS.value,
+        ROUTES.COMMITTEES.value,
+        ROUTES.COMMITTEE_POSITIONS.value,
+        ROUTES.STUDENTS.value,
+    ],
+)
 def get_latest_news() -> Response:
     """
-    Retrieves the latest news items
+    Retrieves the latest news items, with the attributes selected by the optional `fields` and `include` arguments
         :return: Response - The response object, 200 if successful
     """
 
     provided_languages = retrieve_languages(request.args)
     return jsonify(
-        get_latest_items(News, provided_languages=provided_languages)
+        get_latest_items(
+            News,
+            provided_languages=provided_languages,
+            fieldset=parse_fieldset(request.args),
+        )
     ), HTTPStatus.OK
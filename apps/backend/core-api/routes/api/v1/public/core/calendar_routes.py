@@ -6,13 +6,27 @@ API Endpoint: '/api/v1/public/calendar'
 import datetime
 from http import HTTPStatus
 from flask import Blueprint, jsonify, make_response, request
+from decorators.cached_response import cached_response
 from services.content.public import get_events_monthly
 from utility import retrieve_languages
+from utility.constants import ROUTES
 
 public_calendar_bp = Blueprint("public_calendar", __name__)
 
 
 @public_calendar_bp.route("/events", methods=["GET"])
+@cached_response(
+    ttl=60 * 60,
+    stale_ttl=10 * 60,
+    # The events embed their authors
+    tags=[
+        ROUTES.EVENTS.value,
+        ROUTES.COMMITTEES.value,
+        ROUTES.COMMITTEE_POSITIONS.value,
+        ROUTES.STUDENTS.value,
+    ],
+    cache_control="public, no-store, max-age=0",
+)
 def get_events():
     """
     Retrieves all events
@@ -8,7 +8,15 @@ from flask import Blueprint, Response, jsonify, request
 from typing import Any, Dict, List
 from models.core import Student, Profile, StudentMembership
 from services.core.public import retrieve_student_membership_by_id, get_officials
-from utility import retrieve_languages
+from utility import (
+    InvalidCursorError,
+    get_cached_total,
+    keyset_paginate,
+    retrieve_languages,
+    wants_total,
+)
+from utility.constants import ROUTES
+from utility.fieldsets import parse_fieldset
 
 public_student_bp = Blueprint("public_student", __name__)
 
@@ -16,24 +24,57 @@ public_student_bp = Blueprint("public_student", __name__)
 @public_student_bp.route("", methods=["GET"])
 def get_students() -> Response:
     """
-    Retrieves all students
-        :return: Response - The response object, 200 if successful
+    Retrieves all students, by page number or, with a `cursor` argument (empty for the first page), by cursor.
+    The optional `fields` argument selects the attributes of the students.
+        :return: Response - The response object, 400 if the cursor is invalid, 200 if successful
     """
 
     search_query = request.args.get("q", type=str, default=None)
-    paginated_items = None
+    cursor = request.args.get("cursor")
+    fieldset = parse_fieldset(request.args)
+    students_query = Student.query
 
     if search_query:
-        paginated_items = Student.query.filter(
+        students_query = Student.query.filter(
             Student.first_name.ilike(f"%{search_query}%")
             | Student.last_name.ilike(f"%{search_query}%")
             | Student.email.ilike(f"%{search_query}%")
-        ).paginate(max_per_page=10)
-    else:
-        paginated_items = Student.query.paginate(max_per_page=10)
+        )
+
+    if cursor is not None:
+        try:
+            # Students have no creation date, the unique email gives a stable order instead
+            page = keyset_paginate(
+                students_query,
+                (Student.email, Student.student_id),
+                cursor=cursor,
+                max_per_page=10,
+                descending=False,
+            )
+        except InvalidCursorError as e:
+            return jsonify({"error": str(e)}), HTTPStatus.BAD_REQUEST
+
+        total = None
+        if wants_total():
+            total = get_cached_total(students_query, tags=[ROUTES.STUDENTS.value])
+
+        return jsonify(
+            page.to_dict(
+                [
+                    student.to_dict(is_public_route=True, fieldset=fieldset)
+                    for student in page.items
+                ],
+                total=total,
+            )
+        ), HTTPStatus.OK
+
+    paginated_items = students_query.paginate(max_per_page=10)
 
     students: List[Student] = paginated_items.items
-    students_dict = [student.to_dict(is_public_route=True) for student in students]
+    students_dict = [
+        student.to_dict(is_public_route=True, fieldset=fieldset)
+        for student in students
+    ]
     return jsonify(
         {
             "items": students_dict,
@@ -6,7 +6,9 @@ This module contains the services for the RGBank application.
 from .auth_service import has_access
 from .auth_service import has_full_authority
 from .auth_service import get_bank_account
+from .auth_service import get_accessible_cost_items_query
 from .auth_service import retrieve_accessible_cost_items
+from .auth_service import retrieve_accessible_cost_items_page
 
 from .message_service import add_message
 
@@ -22,7 +24,9 @@ __all__ = [
     "has_access",
     "has_full_authority",
     "get_bank_account",
+    "get_accessible_cost_items_query",
     "retrieve_accessible_cost_items",
+    "retrieve_accessible_cost_items_page",
     "add_message",
     "attach_permissions",
     "add_committee_statistic",
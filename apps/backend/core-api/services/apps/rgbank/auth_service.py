@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Tuple, Type, Union
 
+from flask_sqlalchemy.query import Query
+
 from models.apps.rgbank import (
     AccountBankInformation,
     Expense,
@@ -10,6 +12,13 @@ from models.apps.rgbank import (
 from models.committees.committee import Committee
 from models.core import StudentMembership
 from utility import log_error
+from utility.pagination import KeysetPage, keyset_paginate
+
+# Newest first, the id breaks ties between cost items created at the same time
+COST_ITEM_KEYSET_KEYS = {
+    Expense: (Expense.created_at, Expense.expense_id),
+    Invoice: (Invoice.created_at, Invoice.invoice_id),
+}
 
 
 def has_access(
@@ -106,12 +115,20 @@ def has_full_authority(memberships: List[StudentMembership]) -> Tuple[bool, str]
     )
 
 
-def retrieve_accessible_cost_items(
+def get_accessible_cost_items_query(
     cost_item: Type[Union[Expense, Invoice]],
     memberships: List[StudentMembership],
-    page: int = 1,
-) -> List[Expense | Invoice] | None:
-    # Gets all costs items the student has access to
+) -> Query | None:
+    """
+    Builds the query of the cost items the student has access to through their memberships.
+
+    :param cost_item: The cost item type (Expense or Invoice).
+    :type cost_item: Type[Expense | Invoice]
+    :param memberships: List of StudentMembership objects for the student.
+    :type memberships: List[StudentMembership]
+    :return: The unordered query, None if the student has no access to any cost item.
+    :rtype: Query | None
+    """
 
     if cost_item is not Expense and cost_item is not Invoice:
         log_error(f"Invalid cost item type. type: {type(cost_item)}")
@@ -129,32 +146,46 @@ def retrieve_accessible_cost_items(
     if not permissions:
         return None
 
-    committee = None
-    all_access = False
+    if any(
+        permission.view_permission_level == RGBankViewPermissions.ALL_COMMITTEES
+        for permission in permissions
+    ):
+        return cost_item.query
+
+    committee_ids = {
+        str(permission.committee.committee_id)
+        for permission in permissions
+        if permission.view_permission_level == RGBankViewPermissions.OWN_COMMITTEE
+        and isinstance(permission.committee, Committee)
+    }
 
-    for permission in permissions:
-        if permission.view_permission_level == RGBankViewPermissions.ALL_COMMITTEES:
-            committee = None
-            all_access = True
-            break
+    if not committee_ids:
+        return None
 
-        if permission.view_permission_level == RGBankViewPermissions.OWN_COMMITTEE:
-            committee = permission.committee
+    return cost_item.query.filter(cost_item.committee_id.in_(committee_ids))
 
-    if all_access:
-        cost_items = cost_item.query.order_by(cost_item.created_at.desc()).all()
 
-    if committee and isinstance(committee, Committee):
-        if not cost_item.committee:
-            return None
+def retrieve_accessible_cost_items(
+    cost_item: Type[Union[Expense, Invoice]],
+    memberships: List[StudentMembership],
+) -> List[Expense | Invoice] | None:
+    """
+    Gets all cost items the student has access to, newest first.
 
-        cost_items = (
-            cost_item.query.filter_by(
-                cost_item.committee.committee_id == committee.committee_id,
-            )
-            .order_by(cost_item.created_at.desc())
-            .all()
-        )
+    :param cost_item: The cost item type (Expense or Invoice).
+    :type cost_item: Type[Expense | Invoice]
+    :param memberships: List of StudentMembership objects for the student.
+    :type memberships: List[StudentMembership]
+    :return: The cost items, None if there are none.
+    :rtype: List[Expense | Invoice] | None
+    """
+
+    query = get_accessible_cost_items_query(cost_item, memberships)
+
+    if query is None:
+        return None
+
+    cost_items = query.order_by(cost_item.created_at.desc()).all()
 
     if not cost_items:
         return None
@@ -162,6 +193,33 @@ def retrieve_accessible_cost_items(
     return cost_items
 
 
+def retrieve_accessible_cost_items_page(
+    cost_item: Type[Union[Expense, Invoice]],
+    memberships: List[StudentMembership],
+    cursor: str | None = None,
+) -> KeysetPage | None:
+    """
+    Gets a page of the cost items the student has access to, newest first.
+
+    :param cost_item: The cost item type (Expense or Invoice).
+    :type cost_item: Type[Expense | Invoice]
+    :param memberships: List of StudentMembership objects for the student.
+    :type memberships: List[StudentMembership]
+    :param cursor: The cursor of the page, None or empty for the first page.
+    :type cursor: str | None
+    :return: The page, None if the student has no access to any cost item.
+    :rtype: KeysetPage | None
+    :raises InvalidCursorError: If the cursor was not issued for this cost item type.
+    """
+
+    query = get_accessible_cost_items_query(cost_item, memberships)
+
+    if query is None:
+        return None
+
+    return keyset_paginate(query, COST_ITEM_KEYSET_KEYS[cost_item], cursor=cursor)
+
+
 def get_bank_account(student_id: str) -> Dict[str, Any] | None:
     """
     Get the bank account of the student.
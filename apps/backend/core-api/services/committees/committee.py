@@ -3,6 +3,9 @@ from typing import Any, Dict, List
 from flask import Request
 from models.committees import Committee, CommitteeTranslation
 from services.committees.public.committee import get_committee_by_title
+from services.utility.cache import invalidate_content_cache
+from utility.cache import committee_tag
+from utility.constants import ROUTES
 from utility.gc import upload_file
 from utility.translation import get_translation
 from utility.database import db
@@ -73,6 +76,9 @@ def update_committee(
         committee.group_photo_url = url
 
     db.session.commit()
+    invalidate_content_cache(
+        ROUTES.COMMITTEES.value, committee_tag(committee.committee_id)
+    )
 
     return {
         "success": True,
@@ -18,6 +18,7 @@ from .committee_position import (
     get_committee_positions_by_committee_title,
     get_all_committee_members,
 )
+from .recruitment import build_recruitments, get_open_recruitments
 
 __all__ = [
     "CommitteeCategorySettings",
@@ -30,4 +31,6 @@ __all__ = [
     "get_committee_position_by_title",
     "get_committee_positions_by_committee_title",
     "get_all_committee_members",
+    "build_recruitments",
+    "get_open_recruitments",
 ]
@@ -11,7 +11,12 @@ from models.committees import (
     CommitteeTranslation,
 )
 from models.core import StudentMembership
+from services.utility.loader_options import (
+    MEMBERSHIP_LOADER_OPTIONS,
+    get_committee_loader_options,
+)
 from utility.constants import AVAILABLE_LANGUAGES
+from utility.fieldsets import Fieldset
 from .committee_position import get_committee_positions_by_committee_title
 from datetime import datetime
 
@@ -28,22 +33,32 @@ class CommitteeSettings:
     include_positions: bool = False
 
 
-def get_all_committees(provided_languages: List[str]) -> List[Dict[str, Any]]:
+def get_all_committees(
+    provided_languages: List[str], fieldset: Fieldset | None = None
+) -> List[Dict[str, Any]]:
     """
     Retrieves all committees from the database.
 
     Args:
         provided_languages (List[str]): The languages to include in the response.
+        fieldset (Fieldset | None, optional): The attributes to serialize and load. Defaults to None, for all.
 
     Returns:
         List[Dict[str, Any]]: A list of committee dictionaries.
     """
-    committees: List[Committee] = Committee.query.filter_by(hidden=False).all()
+    committees: List[Committee] = (
+        Committee.query.options(*get_committee_loader_options(fieldset))
+        .filter_by(hidden=False)
+        .all()
+    )
 
     return [
         committee_dict
         for committee in committees
-        if (committee_dict := committee.to_dict(provided_languages)) is not None
+        if (
+            committee_dict := committee.to_dict(provided_languages, fieldset=fieldset)
+        )
+        is not None
     ]
 
 
@@ -133,15 +148,19 @@ def get_committee_data_by_title(
             )
             for position in positions
         ]
-        members = StudentMembership.query.filter(
-            StudentMembership.committee_position_id.in_(
-                position.committee_position_id for position in positions
-            ),
-            or_(
-                StudentMembership.termination_date == None,  # noqa
-                StudentMembership.termination_date > datetime.now(),
-            ),
-        ).paginate(per_page=10, max_per_page=25)
+        members = (
+            StudentMembership.query.filter(
+                StudentMembership.committee_position_id.in_(
+                    position.committee_position_id for position in positions
+                ),
+                or_(
+                    StudentMembership.termination_date == None,  # noqa
+                    StudentMembership.termination_date > datetime.now(),
+                ),
+            )
+            .options(*MEMBERSHIP_LOADER_OPTIONS)
+            .paginate(per_page=10, max_per_page=25)
+        )
         data["members"] = {
             "items": [
                 member.to_dict(is_public_route=is_public_route)
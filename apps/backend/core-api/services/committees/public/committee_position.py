@@ -8,9 +8,12 @@ from models.committees import (
     CommitteePositionTranslation,
 )
 from models.core import Student, StudentMembership
+from services.utility.loader_options import (
+    COMMITTEE_POSITION_LOADER_OPTIONS,
+    MEMBERSHIP_LOADER_OPTIONS,
+)
 from utility.constants import AVAILABLE_LANGUAGES
 from utility.database import db
-from sqlalchemy.orm import joinedload
 
 
 def get_committee_position_by_title(
@@ -80,10 +83,14 @@ def get_committee_positions_by_committee_title(
     if not committee:
         return None
 
-    committee_positions: List[CommitteePosition] = CommitteePosition.query.filter_by(
-        committee_id=committee.committee_id,
-        active=True,
-    ).all()
+    committee_positions: List[CommitteePosition] = (
+        CommitteePosition.query.filter_by(
+            committee_id=committee.committee_id,
+            active=True,
+        )
+        .options(*COMMITTEE_POSITION_LOADER_OPTIONS)
+        .all()
+    )
 
     if (
         not committee_positions
@@ -180,10 +187,7 @@ def get_all_committee_members(
                     )
                 ),
             )
-            .options(
-                joinedload(StudentMembership.student),  # type: ignore
-                joinedload(StudentMembership.committee_position),  # type: ignore
-            )
+            .options(*MEMBERSHIP_LOADER_OPTIONS)
             .limit(per_page)
             .offset(offset)
         )
@@ -214,10 +218,7 @@ def get_all_committee_members(
                 Student,
                 StudentMembership.student_id == Student.student_id,
             )
-            .options(
-                joinedload(StudentMembership.student),  # type: ignore
-                joinedload(StudentMembership.committee_position),  # type: ignore
-            )
+            .options(*MEMBERSHIP_LOADER_OPTIONS)
             .limit(per_page)
             .offset(offset)
         )
@@ -0,0 +1,111 @@
+"""
+Recruitment read model
+
+The recruitments that have not ended yet are loaded in a single query and serialized once per language selection.
+The result is cached until a recruitment, position or committee is written, and the open ones are picked from it on
+every read, so recruitments open and close on time without a write.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+from uuid import UUID
+from flask import current_app
+from sqlalchemy import func
+from models.committees import CommitteePositionRecruitment
+from services.utility.loader_options import RECRUITMENT_LOADER_OPTIONS
+from utility.cache import CacheError, language_tag, single_flight
+from utility.constants import ROUTES
+from utility.logger import log_error
+
+# Invalidated by writes to recruitments, positions and committees, the TTL only bounds the size of the stored list
+RECRUITMENT_CACHE_TTL = 24 * 60 * 60
+RECRUITMENT_CACHE_STALE_TTL = 60
+RECRUITMENT_CACHE_TAGS = [
+    ROUTES.COMMITTEE_POSITIONS.value,
+    ROUTES.COMMITTEES.value,
+]
+
+
+@single_flight(
+    key=lambda provided_languages: f"recruitments_{'_'.join(provided_languages)}",
+    ttl=RECRUITMENT_CACHE_TTL,
+    stale_ttl=RECRUITMENT_CACHE_STALE_TTL,
+    tags=lambda provided_languages: [
+        *RECRUITMENT_CACHE_TAGS,
+        *(language_tag(language) for language in provided_languages),
+    ],
+)
+def build_recruitments(provided_languages: Sequence[str]) -> str:
+    """
+    Builds the read model of the recruitments that have not ended yet.
+
+    Args:
+        provided_languages (Sequence[str]): The languages to serialize.
+
+    Returns:
+        str: A JSON list of the recruitments, each with its window, the committee of its position
+            and its serialized form.
+    """
+
+    recruitments: List[CommitteePositionRecruitment] = (
+        CommitteePositionRecruitment.query.filter(
+            CommitteePositionRecruitment.start_date != None,  # noqa
+            CommitteePositionRecruitment.end_date >= func.now(),
+        )
+        .options(*RECRUITMENT_LOADER_OPTIONS)
+        .all()
+    )
+
+    entries = []
+    for recruitment in recruitments:
+        recruitment_dict = recruitment.to_dict(
+            provided_languages=list(provided_languages)
+        )
+        if recruitment_dict is None:
+            continue
+
+        committee_id = recruitment.committee_position.committee_id
+        entries.append(
+            {
+                "start_date": recruitment.start_date.isoformat(),
+                "end_date": recruitment.end_date.isoformat(),
+                "committee_id": str(committee_id) if committee_id else None,
+                "recruitment": recruitment_dict,
+            }
+        )
+
+    # Serialized like the responses, so cached entries render exactly like fresh ones
+    return current_app.json.dumps(entries)
+
+
+def get_open_recruitments(
+    provided_languages: List[str], committee_id: UUID | None = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieves the recruitments that are currently open.
+
+    Args:
+        provided_languages (List[str]): The languages to include in the response.
+        committee_id (UUID | None, optional): Only the recruitments for positions of this committee. Defaults to None.
+
+    Returns:
+        List[Dict[str, Any]]: The serialized recruitments.
+    """
+
+    try:
+        payload = build_recruitments(tuple(provided_languages))
+    except CacheError as e:
+        log_error(f"Failed to retrieve recruitments from cache: {str(e)}")
+        payload = build_recruitments.compute(tuple(provided_languages))
+
+    now = datetime.now()
+    committee = str(committee_id) if committee_id else None
+
+    return [
+        entry["recruitment"]
+        for entry in current_app.json.loads(payload)
+        if datetime.fromisoformat(entry["start_date"])
+        <= now
+        <= datetime.fromisoformat(entry["end_date"])
+        and (committee is None or entry["committee_id"] == committee)
+    ]
@@ -2,7 +2,17 @@
 Content Service
 """
 
-from .event import generate_ics, generate_events
+from .event import (
+    generate_ics,
+    generate_events,
+    get_ics_calendar_id,
+    get_ics_feed_token,
+    get_ics_last_modified,
+    get_ics_payload,
+    get_ics_window,
+    rotate_ics_feed_token,
+)
+from .occurrences import refresh_event_occurrences
 from .item import (
     get_items,
     get_items_from_author,
@@ -12,12 +22,20 @@ from .item import (
     delete_item,
     publish,
     create_item,
+    get_item_cache_tags,
 )
 
 
 __all__ = [
     "generate_ics",
     "generate_events",
+    "get_ics_calendar_id",
+    "get_ics_feed_token",
+    "get_ics_last_modified",
+    "get_ics_payload",
+    "get_ics_window",
+    "rotate_ics_feed_token",
+    "refresh_event_occurrences",
     "get_items",
     "get_items_from_author",
     "get_item_by_url",
@@ -26,4 +44,5 @@ __all__ = [
     "delete_item",
     "publish",
     "create_item",
+    "get_item_cache_tags",
 ]
@@ -1,10 +1,57 @@
-from calendar import Calendar
-from datetime import timedelta
-from textwrap import dedent
-from typing import List
-from models.content import Event, EventTranslation, Frequency
+"""
+Event service, the iCal feeds and the recurrences of events.
+
+A feed covers a calendar and the calendars below it over a window of months. It is written line by line and stored per
+calendar, language and window as the final response bytes, with their compressed variants and ETag, so that every
+subscriber of a feed shares one render and polls are answered 304 while the events are unchanged. Every write to the
+events invalidates the stored feeds.
+"""
+
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Tuple
+from uuid import UUID
+from sqlalchemy.orm import lazyload, selectinload
+from models.content import Event, EventTranslation, RepeatableEvent
+from models.core import Calendar, CalendarFeedToken, Student
+from services.content.occurrences import (
+    EVENT_OCCURRENCE_HISTORY_MONTHS,
+    EVENT_OCCURRENCE_HORIZON_MONTHS,
+    get_occurrence_event_ids,
+    get_window_events,
+)
+from services.content.public.calendar import (
+    get_calendar_subtree_ids,
+    get_main_calendar,
+)
+from services.content.recurrence import add_months, expand_events
+from utility.cache import (
+    CacheError,
+    get_cache,
+    get_tag_version,
+    language_tag,
+    set_cache,
+    single_flight,
+)
+from utility.constants import ROUTES
+from utility.database import db
 from utility.logger import log_error
-from utility.translation import get_translation
+from utility.payload import CompressedPayload
+from utility.translation import get_translations
+
+# Invalidated by writes to the events, the TTL only bounds the lifetime of feeds nobody polls
+ICS_CACHE_TTL = 24 * 60 * 60
+# Served while a single worker rebuilds the expired feed
+ICS_CACHE_STALE_TTL = 60 * 60
+
+# Resolved calendars of the subscribers, invalidated by writes to students and committees
+ICS_CALENDAR_CACHE_TTL = 60 * 60
+
+# Default window of the feeds, in months around the current one
+ICS_DEFAULT_MONTHS_BACK = 1
+ICS_DEFAULT_MONTHS_AHEAD = 1
+
+ICS_DATE_FORMAT = "%Y%m%dT%H%M%S"
 
 
 def escape_special_chars(text: str) -> str:
@@ -75,137 +122,401 @@ def sanitize_ical_value(value: str) -> str:
     return value
 
 
+def get_rrule(repeatable_event: RepeatableEvent) -> str:
+    """Builds the RRULE value of a repeatable event.
+
+    :param repeatable_event: The recurrence of the event.
+    :type repeatable_event: RepeatableEvent
+    """
+    rrule_parts = [f"FREQ={repeatable_event.frequency.value}".upper()]
+
+    if repeatable_event.interval:
+        rrule_parts.append(f"INTERVAL={repeatable_event.interval}")
+
+    if repeatable_event.end_date:
+        rrule_parts.append(
+            f"UNTIL={repeatable_event.end_date.strftime(ICS_DATE_FORMAT)}"
+        )
+
+    if repeatable_event.max_occurrences:
+        rrule_parts.append(f"COUNT={repeatable_event.max_occurrences}")
+
+    return ";".join(rrule_parts)
+
+
+def iter_ics_lines(
+    calendar: Calendar, events: Iterable[Event], language: str
+) -> Iterator[str]:
+    """Writes a calendar in iCalendar format, one CRLF terminated content line at a time.
+    The translations of the events are retrieved in a single query.
+
+    :param calendar: The calendar.
+    :type calendar: Calendar
+    :param events: The events of the calendar, with their repeatable events loaded.
+    :type events: Iterable[Event]
+    :param language: The language of the titles and descriptions.
+    :type language: str
+    """
+    events = [event for event in events if event]
+
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield f"NAME:{calendar.name}\r\n"
+    yield f"X-WR-CALNAME:{calendar.name}\r\n"
+    yield "X-WR-TIMEZONE:Europe/Stockholm\r\n"
+    yield "COLOR:yellow\r\n"
+    yield f"PRODID:-//medieteknik//Calendar 1.0//{language[0:2].upper()}\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+
+    translations = get_translations(
+        EventTranslation,
+        "event_id",
+        [event.event_id for event in events],
+        [language],
+    )
+
+    for event in events:
+        translation = translations[event.event_id][language]
+
+        if not isinstance(translation, EventTranslation):
+            continue
+
+        event_location = sanitize_ical_value(event.location)
+        event_summary = sanitize_ical_value(translation.title)
+        event_description = sanitize_ical_value(translation.description)
+        event_end = event.start_date + timedelta(minutes=event.duration)
+
+        yield "BEGIN:VEVENT\r\n"
+        yield f"UID:{event.event_id}@medieteknik.com\r\n"
+        yield f"DTSTAMP:{event.created_at.strftime(ICS_DATE_FORMAT)}Z\r\n"
+        yield fold_property("SUMMARY", event_summary) + "\r\n"
+        yield fold_property("LOCATION", event_location) + "\r\n"
+        yield f"LAST-MODIFIED:{event.last_updated.strftime(ICS_DATE_FORMAT)}Z\r\n"
+        yield f"DTSTART:{event.start_date.strftime(ICS_DATE_FORMAT)}Z\r\n"
+        yield f"DTEND:{event_end.strftime(ICS_DATE_FORMAT)}Z\r\n"
+
+        if translation.description:
+            yield fold_property("DESCRIPTION", event_description) + "\r\n"
+
+        if event.repeatable_event:
+            yield f"RRULE:{get_rrule(event.repeatable_event)}\r\n"
+
+        yield "END:VEVENT\r\n"
+
+    yield "END:VCALENDAR\r\n"
+
+
 def generate_ics(calendar: Calendar, events: List[Event], language: str) -> str:
+    """Generates a calendar in iCalendar format.
+
+    :param calendar: The calendar.
+    :type calendar: Calendar
+    :param events: The events of the calendar, with their repeatable events loaded.
+    :type events: List[Event]
+    :param language: The language of the titles and descriptions.
+    :type language: str
+    """
     try:
-        ics = dedent(f"""\
-                BEGIN:VCALENDAR
-                VERSION:2.0
-                NAME:{calendar.name}
-                X-WR-CALNAME:{calendar.name}
-                X-WR-TIMEZONE:Europe/Stockholm
-                COLOR:yellow
-                PRODID:-//medieteknik//Calendar 1.0//{language[0:2].upper()}
-                CALSCALE:GREGORIAN""")
-
-        for event in events:
-            if not event:
-                continue
-            translation = get_translation(
-                EventTranslation, ["event_id"], {"event_id": event.event_id}, language
-            )
-
-            if not isinstance(translation, EventTranslation):
-                continue
-
-            rrule = ""
-            if event.repeatable_event:
-                rrule_parts = []
-                rrule_parts.append(
-                    f"FREQ={event.repeatable_event.frequency.value}".upper()
-                )
-
-                if event.repeatable_event.interval:
-                    rrule_parts.append(f"INTERVAL={event.repeatable_event.interval}")
-
-                if event.repeatable_event.end_date:
-                    rrule_parts.append(
-                        f"UNTIL={event.repeatable_event.end_date.strftime('%Y%m%dT%H%M%S')}"
-                    )
-
-                if event.repeatable_event.max_occurrences:
-                    rrule_parts.append(
-                        f"COUNT={event.repeatable_event.max_occurrences}"
-                    )
-
-                rrule = ";".join(rrule_parts)
-
-            event_location = sanitize_ical_value(event.location)
-            event_summary = sanitize_ical_value(translation.title)
-            event_description = sanitize_ical_value(translation.description)
-
-            ics += dedent(f"""
-                    BEGIN:VEVENT
-                    UID:{str(event.event_id) + "@medieteknik.com"}
-                    DTSTAMP:{event.created_at.strftime("%Y%m%dT%H%M%S" + "Z")}
-                    {fold_property("SUMMARY", event_summary)}
-                    {fold_property("LOCATION", event_location)}
-                    LAST-MODIFIED:{event.last_updated.strftime("%Y%m%dT%H%M%S")}Z
-                    DTSTART:{event.start_date.strftime("%Y%m%dT%H%M%S")}Z
-                    DTEND:{(event.start_date + timedelta(minutes=event.duration)).strftime("%Y%m%dT%H%M%S")}Z""")
-            if translation.description or rrule:
-                ics += "\n"
-                if translation.description:
-                    ics += fold_property("DESCRIPTION", event_description)
-
-                if translation.description and rrule:
-                    ics += "\n"
-
-                if rrule:
-                    ics += f"RRULE:{rrule}"
-
-            ics += "\nEND:VEVENT"
-
-        ics += "\nEND:VCALENDAR"
-        ics = dedent(ics)
-
-        return ics
-
+        return "".join(iter_ics_lines(calendar, events, language))
     except Exception as e:
         log_error(f"Failed to generate iCal: {e}")
     return ""
 
 
+def get_ics_window(
+    months_back: int = ICS_DEFAULT_MONTHS_BACK,
+    months_ahead: int = ICS_DEFAULT_MONTHS_AHEAD,
+    now: datetime | None = None,
+) -> Tuple[datetime, datetime]:
+    """Retrieves the window of a feed, on month boundaries so that every poll within a month shares the same feed.
+    The window is kept within the horizon of the materialized occurrences.
+
+    :param months_back: The number of months before the current one.
+    :type months_back: int
+    :param months_ahead: The number of months after the current one.
+    :type months_ahead: int
+    :param now: The time, defaults to the current time.
+    :type now: datetime | None
+    :return: The start (inclusive) and end (exclusive) of the window.
+    :rtype: Tuple[datetime, datetime]
+    """
+    now = now or datetime.now()
+    months_back = min(max(months_back, 0), EVENT_OCCURRENCE_HISTORY_MONTHS)
+    months_ahead = min(max(months_ahead, 0), EVENT_OCCURRENCE_HORIZON_MONTHS)
+
+    return add_months(now, -months_back), add_months(now, months_ahead + 1)
+
+
+def _find_ics_calendar(
+    student_id: UUID, calendar_id: UUID | None, committee_id: UUID | None
+) -> Calendar | None:
+    if not db.session.get(Student, student_id):
+        return None
+
+    if calendar_id:
+        calendar = db.session.get(Calendar, calendar_id)
+        # Personal calendars are only served as personal feeds, with their feed token
+        if calendar and calendar.student_id is not None:
+            return None
+        return calendar
+
+    if committee_id:
+        return Calendar.query.filter(Calendar.committee_id == committee_id).first()
+
+    return get_main_calendar()
+
+
+def _find_personal_ics_calendar(student_id: UUID, token: str | None) -> UUID | None:
+    row = (
+        db.session.query(Calendar.calendar_id, CalendarFeedToken.token)
+        .join(CalendarFeedToken, CalendarFeedToken.calendar_id == Calendar.calendar_id)
+        .filter(Calendar.student_id == student_id)
+        .first()
+    )
+
+    if (
+        not row
+        or not token
+        or not secrets.compare_digest(row.token.encode(), token.encode())
+    ):
+        return None
+
+    return row.calendar_id
+
+
+def get_ics_calendar_id(
+    student_id: UUID,
+    calendar_id: UUID | None = None,
+    committee_id: UUID | None = None,
+    personal: bool = False,
+    token: str | None = None,
+) -> UUID | None:
+    """Resolves the calendar of a feed for a subscriber, cached so that polls need no query.
+    Personal feeds are authorised by the feed token of the calendar, the subscriber alone is public. They are resolved
+    on every poll, so that a rotated token is refused at once.
+
+    :param student_id: The subscriber.
+    :type student_id: UUID
+    :param calendar_id: A calendar, defaults to None.
+    :type calendar_id: UUID | None
+    :param committee_id: A committee, for its calendar, defaults to None.
+    :type committee_id: UUID | None
+    :param personal: Whether the feed is the personal calendar of the subscriber, defaults to False.
+    :type personal: bool
+    :param token: The feed token of the personal calendar, defaults to None.
+    :type token: str | None
+    :return: The calendar, None if the subscriber or the calendar does not exist, if the calendar is a personal
+        calendar and the feed is not personal, or if the token does not match. The main calendar if no calendar is given.
+    :rtype: UUID | None
+    """
+    if personal:
+        return _find_personal_ics_calendar(student_id, token)
+
+    key = f"ics_calendar_{student_id}_{calendar_id}_{committee_id}"
+
+    try:
+        cached = get_cache(key)
+    except CacheError as e:
+        log_error(f"Failed to retrieve iCal calendar from cache: {str(e)}")
+        cached = None
+
+    if cached is not None:
+        return UUID(cached.decode() if isinstance(cached, bytes) else cached)
+
+    calendar = _find_ics_calendar(student_id, calendar_id, committee_id)
+    if not calendar:
+        # Not cached, so that a new student or calendar is found on the next poll
+        return None
+
+    try:
+        set_cache(
+            key,
+            str(calendar.calendar_id),
+            ttl=ICS_CALENDAR_CACHE_TTL,
+            tags=[ROUTES.STUDENTS.value, ROUTES.COMMITTEES.value],
+        )
+    except CacheError as e:
+        log_error(f"Failed to cache iCal calendar: {str(e)}")
+
+    return calendar.calendar_id
+
+
+def get_ics_feed_token(student_id: UUID) -> str | None:
+    """Retrieves the feed token of the personal calendar of a student.
+
+    :param student_id: The student.
+    :type student_id: UUID
+    :return: The token, None if the student has no personal calendar or no token yet.
+    :rtype: str | None
+    """
+    return (
+        db.session.query(CalendarFeedToken.token)
+        .join(Calendar, Calendar.calendar_id == CalendarFeedToken.calendar_id)
+        .filter(Calendar.student_id == student_id)
+        .scalar()
+    )
+
+
+def rotate_ics_feed_token(student_id: UUID) -> str | None:
+    """Creates the feed token of the personal calendar of a student, or replaces it so that the previous one is refused.
+
+    :param student_id: The student.
+    :type student_id: UUID
+    :return: The new token, None if the student has no personal calendar.
+    :rtype: str | None
+    """
+    calendar = Calendar.query.filter(Calendar.student_id == student_id).first()
+    if not calendar:
+        return None
+
+    feed_token: CalendarFeedToken | None = db.session.get(
+        CalendarFeedToken, calendar.calendar_id
+    )
+
+    if not feed_token:
+        feed_token = CalendarFeedToken(calendar_id=calendar.calendar_id)
+        db.session.add(feed_token)
+
+    setattr(feed_token, "token", secrets.token_urlsafe(32))
+    db.session.commit()
+
+    return feed_token.token
+
+
+def get_ics_events(
+    calendar_ids: List[UUID], window_start: datetime, window_end: datetime
+) -> List[Event]:
+    """Retrieves the events of some calendars with an occurrence in a window, with their repeatable events.
+    Recurring events are written with their RRULE, the clients expand them.
+
+    :param calendar_ids: The calendars.
+    :type calendar_ids: List[UUID]
+    :param window_start: The start of the window, inclusive.
+    :type window_start: datetime
+    :param window_end: The end of the window, exclusive.
+    :type window_end: datetime
+    """
+    event_ids = get_occurrence_event_ids(calendar_ids, window_start, window_end)
+    if event_ids is None:
+        # Outside the materialized horizon
+        return sorted(
+            get_window_events(window_start, window_end, calendar_ids=calendar_ids),
+            key=lambda event: event.start_date,
+        )
+
+    if not event_ids:
+        return []
+
+    return (
+        Event.query.filter(Event.event_id.in_(event_ids))
+        # The translations are retrieved together by `iter_ics_lines`
+        .options(selectinload(Event.repeatable_event), lazyload(Event.translations))
+        .order_by(Event.start_date)
+        .all()
+    )
+
+
+@single_flight(
+    key=lambda calendar_id, language, window_start, window_end: (
+        f"ics_{calendar_id}_{language}_{window_start:%Y%m}_{window_end:%Y%m}"
+    ),
+    ttl=ICS_CACHE_TTL,
+    stale_ttl=ICS_CACHE_STALE_TTL,
+    tags=lambda calendar_id, language, window_start, window_end: [
+        ROUTES.EVENTS.value,
+        language_tag(language),
+    ],
+)
+def build_ics_payload(
+    calendar_id: UUID, language: str, window_start: datetime, window_end: datetime
+) -> bytes | None:
+    """Builds the iCal feed of a calendar and the calendars below it over a window, stored as the final response bytes
+    with their gzip and brotli variants. The feed is shared by every subscriber, and cold rebuilds are coalesced.
+
+    :param calendar_id: The calendar.
+    :type calendar_id: UUID
+    :param language: The language of the feed.
+    :type language: str
+    :param window_start: The start of the window, inclusive.
+    :type window_start: datetime
+    :param window_end: The end of the window, exclusive.
+    :type window_end: datetime
+    """
+    calendar = db.session.get(Calendar, calendar_id)
+    if not calendar:
+        return None
+
+    events = get_ics_events(
+        get_calendar_subtree_ids(calendar_id), window_start, window_end
+    )
+
+    ics = generate_ics(calendar, events, language)
+    if not ics:
+        # Not cached, the next poll tries again
+        return None
+
+    return CompressedPayload.from_body(ics).encode()
+
+
+def get_ics_payload(
+    calendar_id: UUID, language: str, window_start: datetime, window_end: datetime
+) -> CompressedPayload | None:
+    """Retrieves the iCal feed of a calendar from the cache, building it if it is missing or stale.
+
+    :param calendar_id: The calendar.
+    :type calendar_id: UUID
+    :param language: The language of the feed.
+    :type language: str
+    :param window_start: The start of the window, inclusive.
+    :type window_start: datetime
+    :param window_end: The end of the window, exclusive.
+    :type window_end: datetime
+    """
+    try:
+        payload = build_ics_payload(calendar_id, language, window_start, window_end)
+    except CacheError as e:
+        log_error(f"Failed to retrieve iCal from cache: {str(e)}")
+        payload = build_ics_payload.compute(
+            calendar_id, language, window_start, window_end
+        )
+
+    return CompressedPayload.decode(payload) if payload else None
+
+
+def get_ics_last_modified(window_start: datetime) -> datetime | None:
+    """Retrieves the Last-Modified of a feed, the time of the last write to the events or the start of its window,
+    whichever is later, since the window moves forward every month without any write.
+
+    :param window_start: The start of the window of the feed.
+    :type window_start: datetime
+    :return: The time, None if the cache is unavailable.
+    """
+    try:
+        version = get_tag_version(ROUTES.EVENTS.value)
+    except CacheError as e:
+        log_error(f"Failed to retrieve tag version: {str(e)}")
+        return None
+
+    return max(
+        datetime.fromtimestamp(version // 10**9, tz=timezone.utc),
+        window_start.astimezone(timezone.utc),
+    )
+
+
 def generate_events(event: Event, start_date, end_date) -> List:
     """
     Generate a list of occurrences for a repeatable event.
 
     Args:
         event: The event to generate occurrences for
-        start_date: The start date of the range
-        end_date: The end date of the range
+        start_date: The start date of the range, inclusive
+        end_date: The end date of the range, exclusive
 
     Returns:
-        List: A list of occurrences for the event
+        List: The occurrences overlapping the range, see `services.content.recurrence.expand_events`
     """
-    occurrences = []
-    current_occurrence = event.start_date
-    occurrence_count = 0
 
     if not event.repeatable_event:
-        return occurrences
-
-    repeat = event.repeatable_event
-
-    while current_occurrence < end_date:
-        event_end_time = current_occurrence + timedelta(minutes=event.duration)
-
-        if (repeat.end_date and current_occurrence > repeat.end_date) or (
-            repeat.max_occurrences and occurrence_count >= repeat.max_occurrences
-        ):
-            break
-
-        if current_occurrence >= start_date:
-            occurrences.append(
-                {
-                    "event": event,
-                    "start_date": current_occurrence,
-                    "end_date": event_end_time,
-                }
-            )
-            occurrence_count += 1
-
-        match event.repeatable_event.frequency:
-            case Frequency.DAILY:
-                current_occurrence += timedelta(days=event.repeatable_event.interval)
-            case Frequency.WEEKLY:
-                current_occurrence += timedelta(weeks=event.repeatable_event.interval)
-            case Frequency.MONTHLY:
-                current_occurrence = current_occurrence.replace(
-                    month=current_occurrence.month + event.repeatable_event.interval
-                )
-            case Frequency.YEARLY:
-                current_occurrence = current_occurrence.replace(
-                    year=current_occurrence.year + event.repeatable_event.interval
-                )
-
-    return occurrences
+        return []
+
+    return expand_events([event], start_date, end_date)
@@ -22,12 +22,47 @@ from models.content import (
 from models.core import Student, AuthorType, Author
 from models.committees import Committee, CommitteePosition
 from services.core import get_author_from_email
+from services.utility.cache import invalidate_content_cache
+from services.utility.loader_options import get_item_loader_options
 from utility import database, AVAILABLE_LANGUAGES, convert_iso_639_1_to_bcp_47
+from utility.cache import committee_tag
+from utility.constants import ROUTES
 from dateutil import parser
 
 
 db = database.db
 
+ITEM_CACHE_TAGS = {
+    News: ROUTES.NEWS.value,
+    Event: ROUTES.EVENTS.value,
+    Media: ROUTES.MEDIA.value,
+    Document: ROUTES.DOCUMENTS.value,
+}
+
+
+def get_item_cache_tags(item: Item) -> List[str]:
+    """
+    Retrieves the cache tags of the responses that depend on the given item.
+
+    Args:
+        item (Item): The item.
+
+    Returns:
+        List[str]: The item type tag, the committee tag if a committee is the author
+            and the albums tag if the item is media in an album.
+    """
+
+    tags = [tag for model, tag in ITEM_CACHE_TAGS.items() if isinstance(item, model)]
+
+    author: Author | None = item.author
+    if author and author.committee_id:
+        tags.append(committee_tag(author.committee_id))
+
+    if isinstance(item, Media) and item.album_id:
+        tags.append(ROUTES.ALBUMS.value)
+
+    return tags
+
 
 def get_item_by_url(
     url: str, item_table: Type[Item] = Item, provided_languages: List[str] | None = None
@@ -76,7 +111,9 @@ def get_items(
     if provided_languages is None:
         provided_languages = AVAILABLE_LANGUAGES
 
-    paginated_items = item_table.query.paginate()
+    paginated_items = item_table.query.options(
+        *get_item_loader_options(item_table)
+    ).paginate()
 
     items = paginated_items.items
     items_dict = [
@@ -117,7 +154,11 @@ def get_items_from_author(
     """
     if provided_languages is None:
         provided_languages = AVAILABLE_LANGUAGES
-    paginated_items = item_table.query.filter_by(author_id=author.author_id).paginate()
+    paginated_items = (
+        item_table.query.options(*get_item_loader_options(item_table))
+        .filter_by(author_id=author.author_id)
+        .paginate()
+    )
 
     items = paginated_items.items
     items_dict = [
@@ -279,7 +320,9 @@ def create_item(
         elif isinstance(item, News):
             setattr(committee, "total_news", committee.total_news + 1)
 
+    cache_tags = get_item_cache_tags(item)
     db.session.commit()
+    invalidate_content_cache(*cache_tags)
 
     correct_id = None
     if isinstance(item, News):
@@ -343,13 +386,18 @@ def update_item(previous_item: Item, data: Dict[str, Any]):
     """
     Updates the given item.
     """
+    # Tags of the item before the update, e.g. the album it is moved out of
+    cache_tags = get_item_cache_tags(previous_item)
+
     for key, value in data.items():
         if hasattr(previous_item, key):
             setattr(previous_item, key, value)
 
     db.session.add(previous_item)
 
+    cache_tags.extend(get_item_cache_tags(previous_item))
     db.session.commit()
+    invalidate_content_cache(*dict.fromkeys(cache_tags))
 
 
 def publish(
@@ -414,7 +462,9 @@ def publish(
     setattr(item, "published_status", PublishedStatus.PUBLISHED)
 
     db.session.add(item)
+    cache_tags = get_item_cache_tags(item)
     db.session.commit()
+    invalidate_content_cache(*cache_tags)
 
     return seo_friendly_url
 
@@ -453,6 +503,9 @@ def delete_item(
     for translation in translations:
         db.session.delete(translation)
 
+    cache_tags = get_item_cache_tags(item)
+
     db.session.flush()
     db.session.delete(item)
     db.session.commit()
+    invalidate_content_cache(*cache_tags)
@@ -0,0 +1,334 @@
+"""
+Materialized event occurrences
+
+The occurrences of every event over a rolling horizon, from a year back to 18 months ahead, are stored in
+`event_occurrence`, so a calendar window inside the horizon is read with one range scan on the period index instead of
+expanding every recurring event on each request. The occurrences of an event are rewritten by the mapper listeners
+below, in the same transaction as the change to the event or its recurrence, and a scheduled job moves the horizon
+forward. Both lock the state row first, so that a change committing during the refresh is never overwritten by it.
+Windows outside the horizon are expanded on the fly.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import delete, event, func, insert, or_, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import contains_eager
+from models.content import (
+    Event,
+    EventOccurrence,
+    EventOccurrenceState,
+    RepeatableEvent,
+)
+from models.content.event import EVENT_OCCURRENCE_PERIOD, EVENT_PERIOD
+from services.content.recurrence import add_months, get_event_periods
+from utility.database import db
+
+# Months of occurrences kept before and after the current month
+EVENT_OCCURRENCE_HISTORY_MONTHS = 12
+EVENT_OCCURRENCE_HORIZON_MONTHS = 18
+
+_STATE_ID = 1
+
+
+def get_occurrence_horizon(now: datetime | None = None) -> Tuple[datetime, datetime]:
+    """
+    Retrieves the window materialized at a given time.
+
+    Args:
+        now (datetime | None, optional): The time. Defaults to None, for the current time.
+
+    Returns:
+        Tuple[datetime, datetime]: The start (inclusive) and end (exclusive) of the window, on month boundaries.
+    """
+
+    now = now or datetime.now()
+    return (
+        add_months(now, -EVENT_OCCURRENCE_HISTORY_MONTHS),
+        add_months(now, EVENT_OCCURRENCE_HORIZON_MONTHS + 1),
+    )
+
+
+def get_window_events(
+    window_start: datetime,
+    window_end: datetime,
+    calendar_ids: Iterable[UUID] | None = None,
+) -> List[Event]:
+    """
+    Retrieves the events that may have occurrences in a window, with their repeatable events loaded.
+    Single events are found by overlap on the period index, recurring events by their recurrence horizon.
+
+    Args:
+        window_start (datetime): The start of the window, inclusive.
+        window_end (datetime): The end of the window, exclusive.
+        calendar_ids (Iterable[UUID] | None, optional): Only the events of these calendars. Defaults to None, for all
+            calendars.
+
+    Returns:
+        List[Event]: The events.
+    """
+
+    calendar_filter = (
+        () if calendar_ids is None else (Event.calendar_id.in_(list(calendar_ids)),)
+    )
+
+    # Joined so that the missing repeatable events are known without a query per event
+    single_events: List[Event] = (
+        Event.query.outerjoin(Event.repeatable_event)
+        .options(contains_eager(Event.repeatable_event))
+        .filter(
+            *calendar_filter,
+            RepeatableEvent.repeatable_event_id == None,  # noqa: E711
+            EVENT_PERIOD.op("&&")(func.tsrange(window_start, window_end)),
+        )
+        .all()
+    )
+
+    recurring_events: List[Event] = (
+        Event.query.join(Event.repeatable_event)
+        .options(contains_eager(Event.repeatable_event))
+        .filter(
+            *calendar_filter,
+            Event.start_date < window_end,
+            or_(
+                RepeatableEvent.repeat_forever == True,  # noqa: E712
+                RepeatableEvent.end_date == None,  # noqa: E711
+                # The last occurrence starts by the end date and may run into the window
+                RepeatableEvent.end_date + (Event.end_date - Event.start_date)
+                >= window_start,
+            ),
+        )
+        .all()
+    )
+
+    return [*single_events, *recurring_events]
+
+
+def write_event_occurrences(connection: Connection, event_ids: Sequence[UUID]) -> int:
+    """
+    Rewrites the stored occurrences of events from their current rows, on the given connection.
+
+    Args:
+        connection (Connection): The connection, in the transaction of the change.
+        event_ids (Sequence[UUID]): The events, deleted ones only lose their occurrences.
+
+    Returns:
+        int: The number of occurrences written.
+    """
+
+    # Locked before the occurrences, in the same order as the refresh, so that the two never interleave
+    state = connection.execute(
+        select(
+            EventOccurrenceState.materialized_from,
+            EventOccurrenceState.materialized_until,
+        )
+        .where(EventOccurrenceState.event_occurrence_state_id == _STATE_ID)
+        .with_for_update()
+    ).first()
+
+    occurrence_table = EventOccurrence.__table__
+    connection.execute(
+        occurrence_table.delete().where(occurrence_table.c.event_id.in_(event_ids))
+    )
+
+    # Never materialized, windows are expanded on the fly until the first refresh
+    if state is None:
+        return 0
+
+    event_table = Event.__table__
+    repeat_table = RepeatableEvent.__table__
+    rows = connection.execute(
+        select(
+            event_table.c.event_id,
+            event_table.c.calendar_id,
+            event_table.c.start_date,
+            event_table.c.duration,
+            repeat_table.c.repeatable_event_id,
+            repeat_table.c.frequency,
+            repeat_table.c.interval,
+            repeat_table.c.end_date,
+            repeat_table.c.max_occurrences,
+        )
+        .select_from(
+            event_table.outerjoin(
+                repeat_table, repeat_table.c.event_id == event_table.c.event_id
+            )
+        )
+        .where(event_table.c.event_id.in_(event_ids))
+    ).all()
+
+    occurrences = [
+        {
+            "event_id": row.event_id,
+            "calendar_id": row.calendar_id,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        for row in rows
+        if row.start_date is not None
+        for start_date, end_date in get_event_periods(
+            row.start_date,
+            row.duration,
+            row if row.repeatable_event_id is not None else None,
+            state.materialized_from,
+            state.materialized_until,
+        )
+    ]
+
+    if occurrences:
+        connection.execute(occurrence_table.insert(), occurrences)
+
+    return len(occurrences)
+
+
+def refresh_event_occurrences(now: datetime | None = None) -> int:
+    """
+    Rebuilds the occurrence table over the current horizon, moving it forward. Meant for a daily scheduled job.
+
+    Args:
+        now (datetime | None, optional): The time. Defaults to None, for the current time.
+
+    Returns:
+        int: The number of occurrences stored.
+    """
+
+    materialized_from, materialized_until = get_occurrence_horizon(now)
+
+    # Taken before the events are read, so that the occurrences written by a concurrent change are not deleted with
+    # the table after the read missed them. The change waits for the refresh and rewrites its own occurrences after it
+    state: EventOccurrenceState | None = db.session.get(
+        EventOccurrenceState, _STATE_ID, with_for_update=True
+    )
+
+    occurrences = [
+        {
+            "event_id": window_event.event_id,
+            "calendar_id": window_event.calendar_id,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        for window_event in get_window_events(materialized_from, materialized_until)
+        for start_date, end_date in get_event_periods(
+            window_event.start_date,
+            window_event.duration,
+            window_event.repeatable_event,
+            materialized_from,
+            materialized_until,
+        )
+    ]
+
+    db.session.execute(delete(EventOccurrence))
+    if occurrences:
+        db.session.execute(insert(EventOccurrence), occurrences)
+
+    if state is None:
+        state = EventOccurrenceState(event_occurrence_state_id=_STATE_ID)
+        db.session.add(state)
+
+    state.materialized_from = materialized_from
+    state.materialized_until = materialized_until
+    state.refreshed_at = datetime.now()
+
+    db.session.commit()
+    return len(occurrences)
+
+
+def get_event_occurrences(
+    calendar_id: UUID, window_start: datetime, window_end: datetime
+) -> List[Dict[str, Any]] | None:
+    """
+    Retrieves the stored occurrences of the events of a calendar overlapping a window.
+
+    Args:
+        calendar_id (UUID): The calendar.
+        window_start (datetime): The start of the window, inclusive.
+        window_end (datetime): The end of the window, exclusive.
+
+    Returns:
+        List[Dict[str, Any]] | None: The occurrences, with their event, start_date and end_date, by start date.
+            None if the window is not within the materialized horizon.
+    """
+
+    state: EventOccurrenceState | None = db.session.get(
+        EventOccurrenceState, _STATE_ID
+    )
+    if (
+        state is None
+        or window_start < state.materialized_from
+        or window_end > state.materialized_until
+    ):
+        return None
+
+    occurrences: List[EventOccurrence] = (
+        EventOccurrence.query.join(EventOccurrence.event)
+        .options(contains_eager(EventOccurrence.event))
+        .filter(
+            EventOccurrence.calendar_id == calendar_id,
+            EVENT_OCCURRENCE_PERIOD.op("&&")(func.tsrange(window_start, window_end)),
+        )
+        .order_by(EventOccurrence.start_date)
+        .all()
+    )
+
+    return [
+        {
+            "event": occurrence.event,
+            "start_date": occurrence.start_date,
+            "end_date": occurrence.end_date,
+        }
+        for occurrence in occurrences
+    ]
+
+
+def get_occurrence_event_ids(
+    calendar_ids: Iterable[UUID], window_start: datetime, window_end: datetime
+) -> List[UUID] | None:
+    """
+    Retrieves the events of some calendars with a stored occurrence overlapping a window.
+
+    Args:
+        calendar_ids (Iterable[UUID]): The calendars.
+        window_start (datetime): The start of the window, inclusive.
+        window_end (datetime): The end of the window, exclusive.
+
+    Returns:
+        List[UUID] | None: The event ids. None if the window is not within the materialized horizon.
+    """
+
+    state: EventOccurrenceState | None = db.session.get(
+        EventOccurrenceState, _STATE_ID
+    )
+    if (
+        state is None
+        or window_start < state.materialized_from
+        or window_end > state.materialized_until
+    ):
+        return None
+
+    return list(
+        db.session.scalars(
+            select(EventOccurrence.event_id)
+            .where(
+                EventOccurrence.calendar_id.in_(list(calendar_ids)),
+                EVENT_OCCURRENCE_PERIOD.op("&&")(
+                    func.tsrange(window_start, window_end)
+                ),
+            )
+            .distinct()
+        )
+    )
+
+
+def _rewrite_occurrences(mapper, connection, target):
+    if target.event_id is not None:
+        write_event_occurrences(connection, [target.event_id])
+
+
+# The occurrences of an event follow every change to it or to its recurrence, deleted events lose theirs by cascade
+for model, event_names in (
+    (Event, ("after_insert", "after_update")),
+    (RepeatableEvent, ("after_insert", "after_update", "after_delete")),
+):
+    for event_name in event_names:
+        event.listen(model, event_name, _rewrite_occurrences)
@@ -2,16 +2,31 @@
 Public Content Service
 """
 
-from .item import get_item_by_url, get_items, get_items_from_author, get_latest_items
-from .calendar import get_main_calendar, get_events_monthly, get_event_by_date
+from .item import (
+    ITEM_KEYSET_KEYS,
+    get_item_author_summaries,
+    get_item_by_url,
+    get_items,
+    get_items_from_author,
+    get_latest_items,
+)
+from .calendar import (
+    get_main_calendar,
+    get_calendar_subtree_ids,
+    get_events_monthly,
+    get_event_by_date,
+)
 
 
 __all__ = [
+    "ITEM_KEYSET_KEYS",
+    "get_item_author_summaries",
     "get_item_by_url",
     "get_items",
     "get_items_from_author",
     "get_latest_items",
     "get_main_calendar",
+    "get_calendar_subtree_ids",
     "get_events_monthly",
     "get_event_by_date",
 ]
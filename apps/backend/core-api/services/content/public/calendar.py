@@ -1,11 +1,13 @@
-from calendar import monthrange
-from datetime import datetime, timedelta
-from typing import List
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import joinedload
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import UUID
+from sqlalchemy import and_, select
+from sqlalchemy.orm import aliased
 from models.content import Event
 from models.core import Calendar
-from services.content.event import generate_events
+from services.content.occurrences import get_event_occurrences, get_window_events
+from services.content.recurrence import add_months, expand_events
+from services.core.public.author import get_author_summaries
 from utility.constants import AVAILABLE_LANGUAGES
 from utility.database import db
 
@@ -24,6 +26,61 @@ def get_main_calendar() -> Calendar:
     return main_calendar
 
 
+def get_calendar_subtree_ids(calendar_id: UUID) -> List[UUID]:
+    """
+    Retrieves a calendar and the calendars below it, in a single recursive query. The personal calendars of students
+    below it are left out, they are only shared with their owner.
+
+    Args:
+        calendar_id (UUID): The calendar at the top of the subtree.
+
+    Returns:
+        List[UUID]: The calendar ids, empty if the calendar does not exist.
+    """
+
+    subtree = (
+        select(Calendar.calendar_id)
+        .where(Calendar.calendar_id == calendar_id)
+        .cte("calendar_subtree", recursive=True)
+    )
+    child_calendar = aliased(Calendar)
+    subtree = subtree.union(
+        select(child_calendar.calendar_id).where(
+            child_calendar.parent_calendar_id == subtree.c.calendar_id,
+            child_calendar.student_id == None,  # noqa: E711
+        )
+    )
+
+    return list(db.session.scalars(select(subtree.c.calendar_id)))
+
+
+def get_events_in_window(
+    calendar_id: UUID, window_start: datetime, window_end: datetime
+) -> List[Dict[str, Any]]:
+    """
+    Retrieves the occurrences of the events of a calendar overlapping a window, from the occurrence table within
+    its horizon and expanded from the events otherwise.
+
+    Args:
+        calendar_id (UUID): The calendar.
+        window_start (datetime): The start of the window, inclusive.
+        window_end (datetime): The end of the window, exclusive.
+
+    Returns:
+        List[Dict[str, Any]]: The occurrences, with their event, start_date and end_date, by start date.
+    """
+
+    occurrences = get_event_occurrences(calendar_id, window_start, window_end)
+    if occurrences is not None:
+        return occurrences
+
+    return expand_events(
+        get_window_events(window_start, window_end, calendar_ids=[calendar_id]),
+        window_start,
+        window_end,
+    )
+
+
 def get_events_monthly(
     date_str: str, provided_languages: List[str] = AVAILABLE_LANGUAGES
 ):
@@ -34,59 +91,26 @@ def get_events_monthly(
 
     main_calendar = get_main_calendar()
 
-    start_date = (date - timedelta(days=1)).replace(day=1)
-
-    # Handle year and month transition for the next month
-    if date.month == 12:
-        next_month = 1
-        next_month_year = date.year + 1
-    else:
-        next_month = date.month + 1
-        next_month_year = date.year
-
-    _, next_month_end_day = monthrange(next_month_year, next_month)
-    end_date = date.replace(
-        year=next_month_year, month=next_month, day=next_month_end_day
-    )  # Make end_date inclusive
-
-    # Adjusted filter conditions for overlapping events and inclusivity
-    events = (
-        Event.query.options(joinedload(Event.repeatable_event))
-        .filter(
-            Event.calendar_id == main_calendar.calendar_id,
-            or_(
-                Event.start_date <= end_date,  # Starts before or on the end date
-                Event.start_date >= start_date,  # Starts after or on the start date
-            ),
-        )
-        .all()
-    )
+    # From the start of the previous month to the end of the next one
+    window_start = add_months(date, -1)
+    window_end = add_months(date, 2)
 
-    all_event_occurrences = []
-    for event in events:
-        if event.repeatable_event:
-            occurrences = generate_events(event, start_date, end_date)
-            all_event_occurrences.extend(occurrences)
-
-        else:
-            if event.start_date >= start_date and event.start_date <= end_date:
-                all_event_occurrences.append(
-                    {
-                        "event": event,
-                        "start_date": event.start_date,
-                        "end_date": (
-                            event.start_date + timedelta(minutes=event.duration)
-                        ),
-                    }
-                )
+    occurrences = get_events_in_window(
+        main_calendar.calendar_id, window_start, window_end
+    )
+    author_summaries = get_author_summaries(
+        (occurrence["event"].author_id for occurrence in occurrences),
+        provided_languages,
+    )
 
     return [
         event_dict
-        for event_occurrence in all_event_occurrences
+        for event_occurrence in occurrences
         if (
             event_dict := event_occurrence["event"].to_dict(
                 provided_languages=provided_languages,
                 custom_start_date=event_occurrence["start_date"],
+                author_summaries=author_summaries,
             )
         )
         is not None
@@ -1,13 +1,94 @@
 from models.content import Item
 from models.content.base import PublishedStatus
 from models.core import Author
+from services.content.item import ITEM_CACHE_TAGS
+from services.core.public.author import get_author_summaries
+from services.utility.loader_options import get_item_loader_options
 from utility.constants import AVAILABLE_LANGUAGES
-from typing import Any, Dict, Type, List
+from utility.fieldsets import Fieldset, wants_relationship
+from utility.pagination import get_cached_total, keyset_paginate
+from typing import Any, Dict, Mapping, Type, List
+
+# Newest first, the item id breaks ties between items created at the same time
+ITEM_KEYSET_KEYS = (Item.created_at, Item.item_id)
+
+
+def get_item_author_summaries(
+    items: List[Item],
+    provided_languages: List[str],
+    fieldset: Fieldset | None = None,
+) -> Mapping[Any, Dict[str, Any]] | None:
+    """
+    Retrieves the summaries of the authors of items, to embed without loading the authors with the items.
+
+    Args:
+        items (List[Item]): The items.
+        provided_languages (List[str]): The languages to serialize.
+        fieldset (Fieldset | None, optional): The serialized attributes. Defaults to None, for all of them.
+
+    Returns:
+        Mapping[Any, Dict[str, Any]] | None: Author id -> serialized author, None if the authors are not serialized.
+    """
+
+    if not wants_relationship(fieldset, "author"):
+        return None
+
+    return get_author_summaries(
+        (item.author_id for item in items), provided_languages
+    )
+
+
+def _get_keyset_page(
+    query,
+    item_table: Type[Item],
+    provided_languages: List[str],
+    cursor: str,
+    include_total: bool,
+    fieldset: Fieldset | None,
+) -> Dict[str, Any]:
+    page = keyset_paginate(
+        query.options(*get_item_loader_options(item_table, fieldset, load_authors=False)),
+        ITEM_KEYSET_KEYS,
+        cursor=cursor,
+    )
+
+    author_summaries = get_item_author_summaries(page.items, provided_languages, fieldset)
+
+    total = None
+    if include_total:
+        total = get_cached_total(
+            query,
+            tags=[
+                tag
+                for model, tag in ITEM_CACHE_TAGS.items()
+                if issubclass(model, item_table)
+            ],
+        )
+
+    return page.to_dict(
+        [
+            item_dict
+            for item in page.items
+            if (
+                item_dict := item.to_dict(
+                    provided_languages=provided_languages,
+                    is_public_route=True,
+                    fieldset=fieldset,
+                    author_summaries=author_summaries,
+                )
+            )
+            is not None
+        ],
+        total=total,
+    )
 
 
 def get_items(
     item_table: Type[Item] = Item,
     provided_languages: list[str] = AVAILABLE_LANGUAGES,
+    cursor: str | None = None,
+    include_total: bool = False,
+    fieldset: Fieldset | None = None,
 ) -> Dict[str, Any]:
     """
     Retrieves all items from the item table.
@@ -15,20 +96,42 @@ def get_items(
     Args:
         item_table (Type[Item], optional): The item table to use. Defaults to Item.
         language_code (list[str], optional): The language codes to use. Defaults to AVAILABLE_LANGUAGES.
+        cursor (str | None, optional): The cursor of the page, empty for the first one. Defaults to None,
+            for page numbers.
+        include_total (bool, optional): Whether a keyset page includes the total. Defaults to False.
+        fieldset (Fieldset | None, optional): The attributes to serialize and load. Defaults to None, for all.
 
     Returns:
         Dict[str, Any]: A dictionary containing the items and pagination information.
+
+    Raises:
+        InvalidCursorError: If the cursor was not issued by this endpoint.
     """
 
-    paginated_items = item_table.query.order_by(Item.created_at.desc()).paginate()
+    query = item_table.query
+
+    if cursor is not None:
+        return _get_keyset_page(
+            query, item_table, provided_languages, cursor, include_total, fieldset
+        )
+
+    paginated_items = (
+        query.options(*get_item_loader_options(item_table, fieldset, load_authors=False))
+        .order_by(Item.created_at.desc())
+        .paginate()
+    )
 
     items = paginated_items.items
+    author_summaries = get_item_author_summaries(items, provided_languages, fieldset)
     items_dict = [
         item_dict
         for item in items
         if (
             item_dict := item.to_dict(
-                provided_languages=provided_languages, is_public_route=True
+                provided_languages=provided_languages,
+                is_public_route=True,
+                fieldset=fieldset,
+                author_summaries=author_summaries,
             )
         )
         is not None
@@ -46,6 +149,9 @@ def get_items_from_author(
     author: Author,
     item_table: Type[Item] = Item,
     provided_languages: list[str] = AVAILABLE_LANGUAGES,
+    cursor: str | None = None,
+    include_total: bool = False,
+    fieldset: Fieldset | None = None,
 ) -> Dict[str, Any]:
     """
     Retrieves all items from the given author.
@@ -54,16 +160,38 @@ def get_items_from_author(
         author (Author): The author to retrieve items from.
         item_table (Type[Item], optional): The item table to use. Defaults to Item.
         language_code (list[str], optional): The language codes to use. Defaults to AVAILABLE_LANGUAGES.
+        cursor (str | None, optional): The cursor of the page, empty for the first one. Defaults to None,
+            for page numbers.
+        include_total (bool, optional): Whether a keyset page includes the total. Defaults to False.
+        fieldset (Fieldset | None, optional): The attributes to serialize and load. Defaults to None, for all.
 
     Returns:
         Dict[str, Any]: A dictionary containing the items and pagination information.
+
+    Raises:
+        InvalidCursorError: If the cursor was not issued by this endpoint.
     """
 
-    paginated_items = item_table.query.filter_by(author_id=author.author_id).paginate()
+    query = item_table.query.filter_by(author_id=author.author_id)
+
+    if cursor is not None:
+        return _get_keyset_page(
+            query, item_table, provided_languages, cursor, include_total, fieldset
+        )
+
+    paginated_items = query.options(
+        *get_item_loader_options(item_table, fieldset, load_authors=False)
+    ).paginate()
 
     items = paginated_items.items
+    author_summaries = get_item_author_summaries(items, provided_languages, fieldset)
     items_dict = [
-        item.to_dict(provided_languages=provided_languages, is_public_route=True)
+        item.to_dict(
+            provided_languages=provided_languages,
+            is_public_route=True,
+            fieldset=fieldset,
+            author_summaries=author_summaries,
+        )
         for item in items
     ]
     return {
@@ -97,13 +225,18 @@ def get_item_by_url(
     if not item or not isinstance(item, Item):
         return None
 
-    return item.to_dict(provided_languages=provided_languages, is_public_route=True)
+    return item.to_dict(
+        provided_languages=provided_languages,
+        is_public_route=True,
+        author_summaries=get_author_summaries([item.author_id], provided_languages),
+    )
 
 
 def get_latest_items(
     item_table: Type[Item] = Item,
     count: int = 5,
     provided_languages: List[str] = AVAILABLE_LANGUAGES,
+    fieldset: Fieldset | None = None,
 ) -> List[Dict[str, Any]]:
     """
     Retrieves the latest items from the item table.
@@ -111,26 +244,30 @@ def get_latest_items(
     Args:
         item_table (Type[Item], optional): The item table to use. Defaults to Item.
         count (int, optional): The number of items to retrieve. Defaults to 5.
+        fieldset (Fieldset | None, optional): The attributes to serialize and load. Defaults to None, for all.
 
     Returns:
         Dict[str, Any]: A dictionary containing the <count> latest items.
     """
 
     items: List[Item] = (
-        item_table.query.filter_by(
-            is_public=True, published_status=PublishedStatus.PUBLISHED.value
-        )
+        item_table.query.options(*get_item_loader_options(item_table, fieldset, load_authors=False))
+        .filter_by(is_public=True, published_status=PublishedStatus.PUBLISHED.value)
         .order_by(Item.created_at.desc())
         .limit(count)
         .all()
     )
+    author_summaries = get_item_author_summaries(items, provided_languages, fieldset)
 
     return [
         item_dict
         for item in items
         if (
             item_dict := item.to_dict(
-                provided_languages=provided_languages, is_public_route=True
+                provided_languages=provided_languages,
+                is_public_route=True,
+                fieldset=fieldset,
+                author_summaries=author_summaries,
             )
         )
         is not None
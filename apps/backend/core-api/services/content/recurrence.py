@@ -0,0 +1,258 @@
+"""
+Recurrence expansion of repeatable events, following the RFC 5545 RRULE semantics of FREQ=DAILY, WEEKLY, MONTHLY and
+YEARLY with INTERVAL, COUNT and UNTIL, the rule written to the iCal feeds.
+
+The first occurrence in a window is found arithmetically from the start of the event, instead of by stepping through
+every earlier occurrence, so expanding a window costs the occurrences in it whatever the age of the event. Expansions
+are memoized per rule and window, in each worker.
+
+As in RFC 5545, COUNT counts the occurrences from the start of the event, UNTIL bounds the start of the last one, and
+monthly and yearly occurrences on a day missing from their month (e.g. the 31st, or February 29th outside leap years)
+are skipped rather than moved.
+"""
+
+from calendar import monthrange
+from datetime import MAXYEAR, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+from models.content import Event, Frequency
+
+# Memoized (rule, window) expansions per worker
+RECURRENCE_CACHE_SIZE = 4096
+
+# (start, end) of an occurrence
+Occurrence = Tuple[datetime, datetime]
+
+_FIXED_STEPS = {
+    Frequency.DAILY: timedelta(days=1),
+    Frequency.WEEKLY: timedelta(weeks=1),
+}
+_MONTH_STEPS = {
+    Frequency.MONTHLY: 1,
+    Frequency.YEARLY: 12,
+}
+
+
+def _expand_fixed(
+    start: datetime,
+    duration: timedelta,
+    step: timedelta,
+    until: datetime | None,
+    count: int | None,
+    window_start: datetime,
+    window_end: datetime,
+) -> List[Occurrence]:
+    # Index of the first occurrence ending at or after the start of the window, rounded up
+    index = 0
+    if start + duration < window_start:
+        index = -((start + duration - window_start) // step)
+
+    occurrences = []
+    while count is None or index < count:
+        occurrence_start = start + index * step
+        if occurrence_start >= window_end or (
+            until is not None and occurrence_start > until
+        ):
+            break
+
+        occurrences.append((occurrence_start, occurrence_start + duration))
+        index += 1
+
+    return occurrences
+
+
+def _month_of(start: datetime, months: int) -> Tuple[int, int]:
+    month_index = start.month - 1 + months
+    return start.year + month_index // 12, month_index % 12 + 1
+
+
+def _day_exists(day: int, year: int, month: int) -> bool:
+    return day <= 28 or day <= monthrange(year, month)[1]
+
+
+def _expand_months(
+    start: datetime,
+    duration: timedelta,
+    step: int,
+    until: datetime | None,
+    count: int | None,
+    window_start: datetime,
+    window_end: datetime,
+) -> List[Occurrence]:
+    # Index of the last occurrence month not after the month of the earliest start overlapping the window,
+    # the occurrences of that month that end before the window are skipped below
+    earliest = window_start - duration
+    months = (earliest.year - start.year) * 12 + earliest.month - start.month
+    index = max(months // step, 0)
+
+    # Occurrences before the window, for COUNT. Only days after the 28th are ever skipped
+    number = index
+    if count is not None and start.day > 28:
+        number = sum(
+            _day_exists(start.day, *_month_of(start, earlier * step))
+            for earlier in range(index)
+        )
+
+    occurrences = []
+    while count is None or number < count:
+        year, month = _month_of(start, index * step)
+        if year > MAXYEAR or datetime(year, month, 1) >= window_end:
+            break
+        index += 1
+
+        if not _day_exists(start.day, year, month):
+            continue
+        number += 1
+
+        occurrence_start = start.replace(year=year, month=month)
+        if occurrence_start >= window_end or (
+            until is not None and occurrence_start > until
+        ):
+            break
+        if occurrence_start + duration >= window_start:
+            occurrences.append((occurrence_start, occurrence_start + duration))
+
+    return occurrences
+
+
+@lru_cache(maxsize=RECURRENCE_CACHE_SIZE)
+def expand_recurrence(
+    start: datetime,
+    duration: int,
+    frequency: Frequency,
+    interval: int | None,
+    until: datetime | None,
+    count: int | None,
+    window_start: datetime,
+    window_end: datetime,
+) -> Tuple[Occurrence, ...]:
+    """
+    Expands a recurrence rule over a window.
+
+    Args:
+        start (datetime): The start of the first occurrence, DTSTART.
+        duration (int): The duration of each occurrence in minutes.
+        frequency (Frequency): FREQ.
+        interval (int | None): INTERVAL, None for 1.
+        until (datetime | None): UNTIL, the latest start of an occurrence, None for no limit.
+        count (int | None): COUNT, the number of occurrences from the first one, None for no limit.
+        window_start (datetime): The start of the window, inclusive.
+        window_end (datetime): The end of the window, exclusive.
+
+    Returns:
+        Tuple[Occurrence, ...]: The (start, end) of the occurrences overlapping the window, in order.
+    """
+
+    duration_delta = timedelta(minutes=duration or 0)
+    interval = max(interval or 1, 1)
+    count = count or None
+
+    if frequency in _FIXED_STEPS:
+        occurrences = _expand_fixed(
+            start,
+            duration_delta,
+            _FIXED_STEPS[frequency] * interval,
+            until,
+            count,
+            window_start,
+            window_end,
+        )
+    else:
+        occurrences = _expand_months(
+            start,
+            duration_delta,
+            _MONTH_STEPS[frequency] * interval,
+            until,
+            count,
+            window_start,
+            window_end,
+        )
+
+    return tuple(occurrences)
+
+
+def add_months(date: datetime, months: int) -> datetime:
+    """
+    Retrieves the first day of the month some months from a date.
+
+    Args:
+        date (datetime): The date.
+        months (int): The number of months, negative for earlier months.
+
+    Returns:
+        datetime: Midnight on the first day of the month.
+    """
+
+    year, month = _month_of(date, months)
+    return datetime(year, month, 1)
+
+
+def get_event_periods(
+    start_date: datetime,
+    duration: int,
+    repeat: Any | None,
+    window_start: datetime,
+    window_end: datetime,
+) -> Tuple[Occurrence, ...]:
+    """
+    Expands an event over a window.
+
+    Args:
+        start_date (datetime): The start of the event.
+        duration (int): The duration of the event in minutes.
+        repeat (RepeatableEvent | None): The recurrence of the event, or any row with its frequency, interval,
+            end_date and max_occurrences. None for a single event.
+        window_start (datetime): The start of the window, inclusive.
+        window_end (datetime): The end of the window, exclusive.
+
+    Returns:
+        Tuple[Occurrence, ...]: The (start, end) of the occurrences overlapping the window, in order.
+    """
+
+    if repeat is None:
+        return expand_recurrence(
+            start_date, duration, Frequency.DAILY, 1, None, 1, window_start, window_end
+        )
+
+    return expand_recurrence(
+        start_date,
+        duration,
+        repeat.frequency,
+        repeat.interval,
+        repeat.end_date,
+        repeat.max_occurrences,
+        window_start,
+        window_end,
+    )
+
+
+def expand_events(
+    events: Iterable[Event], window_start: datetime, window_end: datetime
+) -> List[Dict[str, Any]]:
+    """
+    Expands events over a window. Single events are kept if they overlap it.
+
+    Args:
+        events (Iterable[Event]): The events, with their repeatable events loaded.
+        window_start (datetime): The start of the window, inclusive.
+        window_end (datetime): The end of the window, exclusive.
+
+    Returns:
+        List[Dict[str, Any]]: The occurrences, with their event, start_date and end_date, by start date.
+    """
+
+    occurrences = []
+    for event in events:
+        occurrences.extend(
+            {"event": event, "start_date": start_date, "end_date": end_date}
+            for start_date, end_date in get_event_periods(
+                event.start_date,
+                event.duration,
+                event.repeatable_event,
+                window_start,
+                window_end,
+            )
+        )
+
+    occurrences.sort(key=lambda occurrence: occurrence["start_date"])
+    return occurrences
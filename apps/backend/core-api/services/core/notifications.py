@@ -207,19 +207,9 @@ def retrieve_notifications(student_id: Any, language_code: str) -> Response:
         for notification in notification_result
     ]
 
-    # class CustomJSONEncoder(json.JSONEncoder):
-    #    def default(self, obj):
-    #        if isinstance(obj, datetime):
-    #            return obj.isoformat()
-    #        if isinstance(obj, UUID):
-    #            return str(obj)
-    #        return super().default(obj)
-
     # set_cache(
     #    f"notifications_{student_id}",
-    #    json.dumps(
-    #        {"time": datetime.now().isoformat(), "data": data}, cls=CustomJSONEncoder
-    #    ),
+    #    json_dumps({"time": datetime.now().isoformat(), "data": data}),
     # )
 
     return jsonify(data), HTTPStatus.OK
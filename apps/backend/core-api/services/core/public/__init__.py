@@ -1,3 +1,9 @@
+from .author import get_author_summaries, get_author_summary_tags
 from .student import get_officials, retrieve_student_membership_by_id
 
-__all__ = ["get_officials", "retrieve_student_membership_by_id"]
+__all__ = [
+    "get_author_summaries",
+    "get_author_summary_tags",
+    "get_officials",
+    "retrieve_student_membership_by_id",
+]
@@ -0,0 +1,114 @@
+"""
+Author summary read model
+
+The public serialization of every author embedded in the item lists, cached per author and language selection.
+A page of items embeds its authors with one keyed lookup each, the authors missing from the cache are loaded together
+in a single query. Entries are tagged with the student, committee or position behind the author, whose writes already
+invalidate those tags.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence
+from uuid import UUID
+from flask import current_app
+from models.core import Author, AuthorType
+from services.utility.loader_options import AUTHOR_LOADER_OPTIONS
+from utility.cache import CacheError, committee_tag, get_cache, language_tag, set_cache
+from utility.constants import ROUTES
+from utility.logger import log_error
+
+# Invalidated by writes to students, committees and positions, the TTL only bounds the lifetime of unused entries
+AUTHOR_SUMMARY_CACHE_TTL = 24 * 60 * 60
+
+
+def _get_author_summary_key(author_id: Any, provided_languages: Sequence[str]) -> str:
+    return f"author_summary_{author_id}_{'_'.join(provided_languages)}"
+
+
+def get_author_summary_tags(author: Author) -> List[str]:
+    """
+    Retrieves the cache tags of the summary of an author.
+
+    Args:
+        author (Author): The author.
+
+    Returns:
+        List[str]: The tags invalidated by writes to the student, committee or position behind the author.
+    """
+
+    if author.author_type == AuthorType.STUDENT:
+        return [ROUTES.STUDENTS.value]
+
+    if author.author_type == AuthorType.COMMITTEE:
+        return [ROUTES.COMMITTEES.value, committee_tag(author.committee_id)]
+
+    if author.author_type == AuthorType.COMMITTEE_POSITION:
+        # The position embeds its parent committee
+        tags = [ROUTES.COMMITTEE_POSITIONS.value, ROUTES.COMMITTEES.value]
+        if author.committee_position and author.committee_position.committee_id:
+            tags.append(committee_tag(author.committee_position.committee_id))
+        return tags
+
+    return []
+
+
+def get_author_summaries(
+    author_ids: Iterable[UUID | None], provided_languages: Sequence[str]
+) -> Dict[UUID, Dict[str, Any]]:
+    """
+    Retrieves the public serialization of authors, from the cache or in a single query for the missing ones.
+
+    Args:
+        author_ids (Iterable[UUID | None]): The author ids, duplicates and None are ignored.
+        provided_languages (Sequence[str]): The languages to serialize.
+
+    Returns:
+        Dict[UUID, Dict[str, Any]]: Author id -> serialized author, like `Author.to_dict(is_public_route=True)`.
+            Authors that do not exist are left out.
+    """
+
+    summaries: Dict[UUID, Dict[str, Any]] = {}
+    missing: List[UUID] = []
+
+    for author_id in dict.fromkeys(author_ids):
+        if author_id is None:
+            continue
+
+        try:
+            cached = get_cache(_get_author_summary_key(author_id, provided_languages))
+        except CacheError as e:
+            log_error(f"Failed to retrieve author summary from cache: {str(e)}")
+            cached = None
+
+        if cached is None:
+            missing.append(author_id)
+        else:
+            summaries[author_id] = current_app.json.loads(cached)
+
+    if not missing:
+        return summaries
+
+    authors: List[Author] = (
+        Author.query.filter(Author.author_id.in_(missing))
+        .options(*AUTHOR_LOADER_OPTIONS)
+        .all()
+    )
+
+    language_tags = [language_tag(language) for language in provided_languages]
+    for author in authors:
+        summary = author.to_dict(
+            provided_languages=list(provided_languages), is_public_route=True
+        )
+        summaries[author.author_id] = summary
+
+        try:
+            # Serialized like the responses, so cached summaries render exactly like fresh ones
+            set_cache(
+                _get_author_summary_key(author.author_id, provided_languages),
+                current_app.json.dumps(summary),
+                ttl=AUTHOR_SUMMARY_CACHE_TTL,
+                tags=[*get_author_summary_tags(author), *language_tags],
+            )
+        except CacheError as e:
+            log_error(f"Failed to cache author summary: {str(e)}")
+
+    return summaries
@@ -5,12 +5,12 @@ The public service for student related queries
 from datetime import datetime
 from typing import List
 from sqlalchemy import or_
-from sqlalchemy.orm import joinedload
 from models.committees import (
     CommitteePosition,
     CommitteePositionsRole,
 )
 from models.core import Student, StudentMembership
+from services.utility.loader_options import MEMBERSHIP_LOADER_OPTIONS
 from utility.database import db
 
 
@@ -60,10 +60,7 @@ def get_officials(year: str = None, semester: str = "VT") -> List[StudentMembers
             ),
             StudentMembership.initiation_date <= end_date,
         )
-        .options(
-            joinedload(StudentMembership.student),  # type: ignore
-            joinedload(StudentMembership.committee_position),  # type: ignore
-        )
+        .options(*MEMBERSHIP_LOADER_OPTIONS)
         .all()
     )
 
@@ -79,9 +76,7 @@ def retrieve_student_membership_by_id(student_id):
             == CommitteePosition.committee_position_id,
         )
         .filter(StudentMembership.student_id == student_id)
-        .options(
-            joinedload(StudentMembership.committee_position),  # type: ignore
-        )
+        .options(*MEMBERSHIP_LOADER_OPTIONS)
         .all()
     )
 
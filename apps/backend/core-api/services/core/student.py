@@ -21,7 +21,8 @@ from services.utility.auth import (
     get_student_authorization,
     get_student_committee_details,
 )
-from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_FILTER
+from services.utility.cache import invalidate_content_cache
+from utility.constants import AVAILABLE_LANGUAGES, DEFAULT_FILTER, ROUTES
 from utility.database import db
 from utility.gc import delete_file, upload_file
 
@@ -232,6 +233,7 @@ def update(request: Request, student: Student) -> Response:
             ), HTTPStatus.INTERNAL_SERVER_ERROR
 
     db.session.commit()
+    invalidate_content_cache(ROUTES.STUDENTS.value)
     response = make_response()
     access_token = create_access_token(identity=student, fresh=True)
     set_access_cookies(
@@ -1,6 +1,16 @@
 from .auth import get_student_authorization
 from .auth import get_student_committee_details
 
+from .cache import invalidate_content_cache
+
+from .loader_options import ALBUM_LOADER_OPTIONS
+from .loader_options import COMMITTEE_POSITION_LOADER_OPTIONS
+from .loader_options import MEMBERSHIP_LOADER_OPTIONS
+from .loader_options import RECRUITMENT_LOADER_OPTIONS
+from .loader_options import get_column_loader_options
+from .loader_options import get_committee_loader_options
+from .loader_options import get_item_loader_options
+
 from .discord import send_discord_message
 from .discord import delete_discord_message
 
@@ -12,12 +22,26 @@ from .messages import send_notification_topic
 
 from .search import update_search_cache
 from .search import get_search_data
+from .search import rebuild_search_index
+from .search import refresh_search_index
+from .search import update_search_index
 
 from .tasks import schedule_news
 
+from .warmers import get_warmers
+from .warmers import run_warmers
+
 __all__ = [
     "get_student_authorization",
     "get_student_committee_details",
+    "invalidate_content_cache",
+    "ALBUM_LOADER_OPTIONS",
+    "COMMITTEE_POSITION_LOADER_OPTIONS",
+    "MEMBERSHIP_LOADER_OPTIONS",
+    "RECRUITMENT_LOADER_OPTIONS",
+    "get_column_loader_options",
+    "get_committee_loader_options",
+    "get_item_loader_options",
     "TopicType",
     "send_discord_topic",
     "send_discord_message",
@@ -26,5 +50,10 @@ __all__ = [
     "send_expense_message",
     "update_search_cache",
     "get_search_data",
+    "rebuild_search_index",
+    "refresh_search_index",
+    "update_search_index",
     "schedule_news",
+    "get_warmers",
+    "run_warmers",
 ]
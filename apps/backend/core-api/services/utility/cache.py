@@ -0,0 +1,24 @@
+"""
+Cache invalidation service
+"""
+
+from utility.cache import CacheError, invalidate_cache
+from utility.logger import log_error
+
+
+def invalidate_content_cache(*tags: str) -> None:
+    """
+    Invalidates the cached responses depending on the given tags, in every worker.
+    Called after the write has been committed, so a cache failure is logged instead of failing the request.
+
+    Args:
+        *tags (str): The tags to invalidate, e.g. 'news' or 'committee:<id>'.
+    """
+
+    if not tags:
+        return
+
+    try:
+        invalidate_cache(*tags)
+    except CacheError as e:
+        log_error(f"Failed to invalidate cache: {str(e)}", tags=list(tags))
@@ -0,0 +1,181 @@
+"""
+Loader options service, the relationships each list endpoint reads while serializing, loaded up front so that a page
+renders in a constant number of queries instead of a few queries per row.
+"""
+
+from typing import Dict, Iterable, List, Tuple, Type
+from sqlalchemy import inspect
+from sqlalchemy.orm import (
+    joinedload,
+    lazyload,
+    load_only,
+    selectin_polymorphic,
+    selectinload,
+)
+from sqlalchemy.orm.interfaces import ORMOption
+from models.committees import (
+    Committee,
+    CommitteePosition,
+    CommitteePositionRecruitment,
+)
+from models.content import Album, Document, Event, Item, Media, News
+from models.core import Author, StudentMembership
+from utility.fieldsets import Fieldset, wants_relationship
+
+# Read by `CommitteePosition.to_dict(include_parent=True)`, the parent committee loads its translations by itself
+COMMITTEE_POSITION_LOADER_OPTIONS: Tuple[ORMOption, ...] = (
+    selectinload(CommitteePosition.translations),
+    selectinload(CommitteePosition.committee),
+)
+
+# Read by `CommitteePositionRecruitment.to_dict`, everything is joined so the recruitments load in a single query
+RECRUITMENT_LOADER_OPTIONS: Tuple[ORMOption, ...] = (
+    joinedload(CommitteePositionRecruitment.translations),
+    joinedload(CommitteePositionRecruitment.committee_position).options(
+        joinedload(CommitteePosition.translations),
+        joinedload(CommitteePosition.committee),
+    ),
+)
+
+# Read by the member listings, the student and the position of a membership are joined to its row
+MEMBERSHIP_LOADER_OPTIONS: Tuple[ORMOption, ...] = (
+    joinedload(StudentMembership.student),
+    joinedload(StudentMembership.committee_position).options(
+        *COMMITTEE_POSITION_LOADER_OPTIONS
+    ),
+)
+
+# Read by `Author.to_dict`, an author is exactly one of these so the other two loads are skipped for its row
+AUTHOR_LOADER_OPTIONS: Tuple[ORMOption, ...] = (
+    selectinload(Author.student),
+    selectinload(Author.committee),
+    selectinload(Author.committee_position).options(*COMMITTEE_POSITION_LOADER_OPTIONS),
+)
+
+ITEM_TYPES: Tuple[Type[Item], ...] = (News, Event, Document, Media)
+
+# Item type -> options of its list queries. The translations of every item type are joined by their relationship
+ITEM_LOADER_OPTIONS: Dict[Type[Item], Tuple[ORMOption, ...]] = {
+    item_table: (selectinload(item_table.author).options(*AUTHOR_LOADER_OPTIONS),)
+    for item_table in (Item, *ITEM_TYPES)
+}
+# Items of mixed types load the columns of each type in one query per type, instead of one per row
+ITEM_LOADER_OPTIONS[Item] += (selectin_polymorphic(Item, ITEM_TYPES),)
+
+# Read by `Album.to_dict`, the preview is serialized with its author like any media
+ALBUM_LOADER_OPTIONS: Tuple[ORMOption, ...] = (
+    selectinload(Album.preview_media).options(*ITEM_LOADER_OPTIONS[Media]),
+)
+
+
+# Read by `Item.to_dict` whatever the fieldset, to hide drafts, and by the keyset pagination
+ITEM_REQUIRED_COLUMNS = (
+    "type",
+    "is_public",
+    "published_status",
+    "is_pinned",
+    "created_at",
+)
+# Read by `Committee.to_dict` whatever the fieldset
+COMMITTEE_REQUIRED_COLUMNS = ("group_photo_url",)
+
+
+def get_column_loader_options(
+    model: type, fieldset: Fieldset | None, required: Iterable[str] = ()
+) -> Tuple[ORMOption, ...]:
+    """
+    Retrieves the options loading only the columns of a fieldset. Primary and foreign keys are always loaded,
+    so the relationships still load.
+
+    Args:
+        model (type): The mapped class queried.
+        fieldset (Fieldset | None): The selected attributes, None for all of them.
+        required (Iterable[str], optional): Columns read by `to_dict` whatever the fieldset. Defaults to ().
+
+    Returns:
+        Tuple[ORMOption, ...]: The options, empty if every column is selected.
+    """
+
+    if fieldset is None or fieldset.fields is None:
+        return ()
+
+    required = set(required)
+    keys: List[str] = [
+        key
+        for key, column_property in inspect(model).column_attrs.items()
+        if key in fieldset.fields
+        or key in required
+        or any(
+            column.primary_key or column.foreign_keys
+            for column in column_property.columns
+        )
+    ]
+
+    return (load_only(*(getattr(model, key) for key in keys)),)
+
+
+def get_item_loader_options(
+    item_table: Type[Item],
+    fieldset: Fieldset | None = None,
+    load_authors: bool = True,
+) -> Tuple[ORMOption, ...]:
+    """
+    Retrieves the loader options of the list queries of an item type.
+
+    Args:
+        item_table (Type[Item]): The item table queried.
+        fieldset (Fieldset | None, optional): The serialized attributes. Defaults to None, for all of them.
+        load_authors (bool, optional): Whether the authors are loaded with the items, False when they are
+            embedded from their summaries. Defaults to True.
+
+    Returns:
+        Tuple[ORMOption, ...]: The options, to pass to `Query.options`.
+    """
+
+    if load_authors and wants_relationship(fieldset, "author"):
+        options = ITEM_LOADER_OPTIONS.get(
+            item_table,
+            (selectinload(item_table.author).options(*AUTHOR_LOADER_OPTIONS),),
+        )
+    else:
+        options = (
+            (selectin_polymorphic(Item, ITEM_TYPES),) if item_table is Item else ()
+        )
+
+    if fieldset is None:
+        return options
+
+    # The translations of the item types are joined by default
+    if item_table is not Item and not wants_relationship(fieldset, "translations"):
+        options += (lazyload(item_table.translations),)
+
+    return options + get_column_loader_options(
+        item_table, fieldset, required=ITEM_REQUIRED_COLUMNS
+    )
+
+
+def get_committee_loader_options(
+    fieldset: Fieldset | None = None,
+) -> Tuple[ORMOption, ...]:
+    """
+    Retrieves the loader options of the committee list queries.
+
+    Args:
+        fieldset (Fieldset | None, optional): The serialized attributes. Defaults to None, for all of them.
+
+    Returns:
+        Tuple[ORMOption, ...]: The options, to pass to `Query.options`.
+    """
+
+    if fieldset is None:
+        return ()
+
+    options = get_column_loader_options(
+        Committee, fieldset, required=COMMITTEE_REQUIRED_COLUMNS
+    )
+
+    # Joined by default
+    if not wants_relationship(fieldset, "translations"):
+        options += (lazyload(Committee.translations),)
+
+    return options
@@ -3,25 +3,13 @@ Messages Service
 """
 
 import enum
-import json
-from datetime import datetime
 from os import environ
 from typing import Any, Dict, List
-from uuid import UUID
 from utility.gc import publisher, topic_path
+from utility.json_provider import json_dumps
 from utility.logger import log_error
 
 
-class UuidDatetimeJSONEncoder(json.JSONEncoder):
-    def default(self, o):
-        # Handle UUID and datetime objects
-        if isinstance(o, UUID):
-            return str(o)
-        if isinstance(o, datetime):
-            return o.isoformat()
-        return super().default(o)
-
-
 class TopicType(enum.Enum):
     """Enum class for the topic types."""
 
@@ -122,9 +110,7 @@ def send_discord_topic(type: TopicType, topic_data: Dict[str, Any]) -> None:
         case _:
             return
 
-    message_data = json.dumps(discord_task_data, cls=UuidDatetimeJSONEncoder).encode(
-        "utf-8"
-    )
+    message_data = json_dumps(discord_task_data)
 
     if environ.get("FLASK_ENV") == "production":
         try:
@@ -187,9 +173,7 @@ def send_notification_topic(type: TopicType, topic_data: Dict[str, Any]) -> None
         "news_id": news_id,
     }
 
-    message_data = json.dumps(notification_data, cls=UuidDatetimeJSONEncoder).encode(
-        "utf-8"
-    )
+    message_data = json_dumps(notification_data)
 
     if environ.get("FLASK_ENV") == "production":
         try:
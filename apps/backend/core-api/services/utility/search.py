@@ -1,12 +1,19 @@
 """
 Search service
+
+The search payload is assembled from an incremental index (`SearchDocument`), one pre-serialised entry per source row
+and language. Writes to the source tables are journaled in `SearchIndexChange`, once per language, and applied row by
+row by the scheduled refresh, which removes the entries it applied. Entries of transactions that commit late are applied
+by the following refresh. `rebuild_search_index` rebuilds the index from scratch, also on the first read of a language
+whose index was never built. Reads never apply the journal, they only compare the version stamp of the index.
 """
 
-import json
-from datetime import datetime
-from typing import List
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Set
 from uuid import UUID
 from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 from models.committees.committee import Committee
 from models.committees.committee_position import CommitteePosition
@@ -15,161 +22,461 @@ from models.content.base import Item
 from models.content.document import Document
 from models.content.media import Media
 from models.content.news import News
-from utility.cache import set_cache
+from models.utility.search import SearchDocument, SearchIndexChange, SearchIndexState
+from utility.cache import language_tag, single_flight
+from utility.constants import ROUTES
+from utility.database import db
+from utility.json_provider import json_dumps
 from utility.logger import log_error
+from utility.payload import CompressedPayload
+
+# Invalidated by writes to any of the searchable content types, so the entry can live long
+SEARCH_CACHE_TTL = 24 * 60 * 60
+# Served while a single worker rebuilds the expired payload
+SEARCH_CACHE_STALE_TTL = 60 * 60
+SEARCH_CACHE_TAGS = [
+    ROUTES.NEWS.value,
+    ROUTES.DOCUMENTS.value,
+    ROUTES.MEDIA.value,
+    ROUTES.ALBUMS.value,
+    ROUTES.COMMITTEES.value,
+    ROUTES.COMMITTEE_POSITIONS.value,
+]
+
+# Full rebuilds pick up changes the journal does not track, e.g. renamed authors
+SEARCH_INDEX_REBUILD_INTERVAL = timedelta(days=1)
+
+# Sections of the search payload, in order
+SEARCH_DOCUMENT_TYPES = [
+    "committees",
+    "committee_positions",
+    "albums",
+    "documents",
+    "media",
+    "news",
+]
+
+
+@single_flight(
+    key=lambda language: f"search_{language}",
+    ttl=SEARCH_CACHE_TTL,
+    stale_ttl=SEARCH_CACHE_STALE_TTL,
+    tags=lambda language: [*SEARCH_CACHE_TAGS, language_tag(language)],
+)
+def build_search_payload(language: str) -> bytes:
+    """
+    Builds the search payload, stored as the final response bytes with their gzip and brotli variants.
+    Cold rebuilds are coalesced, only one worker at a time rebuilds the payload of a language. An index that was
+    never built is built first, so that a fresh deploy does not cache empty sections until the scheduled refresh.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        bytes: The packed CompressedPayload.
+    """
+
+    if not SearchIndexState.query.get(language):
+        rebuild_search_index(language)
+
+    return CompressedPayload.from_body(get_search_data(language)).encode()
+
+
+def update_search_cache(language: str) -> CompressedPayload | None:
+    """
+    Rebuilds the cached search payload.
+
+    Args:
+        language (str): The language code.
 
+    Returns:
+        CompressedPayload | None: The payload, None if it could not be built.
+    """
 
-def update_search_cache(language: str) -> str | None:
-    data = {}
     try:
-        data = get_search_data(language)
-        set_cache(
-            f"search_{language}",
-            json.dumps(
-                {
-                    "updated_at": datetime.now().isoformat(),
-                    "data": data,
-                }
-            ),
-        )
+        return CompressedPayload.decode(build_search_payload.refresh(language))
     except Exception:
         log_error("Failed to update search cache", language=language)
         return None
 
-    return data
 
+def get_search_payload(language: str) -> CompressedPayload:
+    """
+    Retrieves the search payload from the cache, rebuilding it if it is missing or stale.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        CompressedPayload: The payload.
+    """
+
+    return CompressedPayload.decode(build_search_payload(language))
+
+
+def get_search_data(language: str) -> str:
+    """
+    Retrieves the search payload for a language, as of the last refresh of the index.
+
+    Args:
+        language (str): The language code, e.g. 'sv-SE'.
 
-def get_search_data(language: str):
-    committees: List[Committee] = (
-        Committee.query.options(joinedload(Committee.translations))
-        .filter(Committee.email.not_in(["info@kth.se", "ordf@ths.kth.se"]))
+    Returns:
+        str: The payload as a JSON object with the version stamp of the index and one list per section.
+    """
+
+    rows = (
+        db.session.query(SearchDocument.document_type, SearchDocument.data)
+        .filter(SearchDocument.language_code == language)
+        .order_by(
+            SearchDocument.sort_key.desc().nullslast(),
+            SearchDocument.document_id,
+        )
         .all()
     )
-    committee_positions: List[CommitteePosition] = (
-        CommitteePosition.query.options(joinedload(CommitteePosition.translations))
-        .filter(
-            and_(
-                CommitteePosition.role != "MEMBER",
-                CommitteePosition.active,
-            )
+
+    # The entries are already serialised, so the payload is assembled without decoding them
+    sections: Dict[str, List[str]] = {
+        document_type: [] for document_type in SEARCH_DOCUMENT_TYPES
+    }
+    for document_type, data in rows:
+        if document_type in sections:
+            sections[document_type].append(data)
+
+    return (
+        f'{{"version": {get_search_index_version(language)}, '
+        + ", ".join(
+            f'"{document_type}": [' + ", ".join(entries) + "]"
+            for document_type, entries in sections.items()
         )
+        + "}"
+    )
+
+
+def get_search_index_version(language: str) -> int:
+    """
+    Retrieves the version stamp of the search index.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        int: The version, 0 if the index was never built.
+    """
+
+    state: SearchIndexState | None = SearchIndexState.query.get(language)
+    return state.version if state else 0
+
+
+def refresh_search_index(language: str, now: datetime | None = None) -> int:
+    """
+    Applies the journaled changes to the search index, or rebuilds it from scratch if it was never built or its last
+    rebuild is older than `SEARCH_INDEX_REBUILD_INTERVAL`. Meant for the scheduled jobs only, the refresh and the cache warmers.
+
+    Args:
+        language (str): The language code.
+        now (datetime | None, optional): The time. Defaults to None, for the current time.
+
+    Returns:
+        int: The number of applied journal entries, or of indexed rows after a rebuild.
+    """
+
+    now = now or datetime.now()
+    state: SearchIndexState | None = SearchIndexState.query.get(language)
+
+    if (
+        not state
+        or not state.rebuilt_at
+        or state.rebuilt_at < now - SEARCH_INDEX_REBUILD_INTERVAL
+    ):
+        return rebuild_search_index(language)
+
+    return update_search_index(language)
+
+
+def update_search_index(language: str) -> int:
+    """
+    Applies the journaled changes to the search index, rebuilding only the changed rows.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        int: The number of applied journal entries.
+    """
+
+    state: SearchIndexState | None = (
+        SearchIndexState.query.filter_by(language_code=language)
+        .with_for_update()
+        .first()
+    )
+
+    if not state or not state.rebuilt_at:
+        db.session.rollback()
+        return rebuild_search_index(language)
+
+    # Every pending entry, not only the ones after the last applied, since ids are taken before their transactions commit
+    changes: List[SearchIndexChange] = (
+        SearchIndexChange.query.filter(SearchIndexChange.language_code == language)
+        .order_by(SearchIndexChange.search_index_change_id)
         .all()
     )
 
-    published_filter = [Item.is_public, Item.published_status == "PUBLISHED"]
+    if not changes:
+        db.session.rollback()
+        return 0
+
+    changed_ids: Dict[str, Set[UUID]] = defaultdict(set)
+    for change in changes:
+        changed_ids[change.document_type].add(change.document_id)
 
-    # Items
-    albums: List[Album] = Album.query.options(joinedload(Album.translations)).all()
-    documents: List[Document] = (
-        Document.query.options(
-            joinedload(Document.translations), joinedload(Document.author)
+    # Position entries embed the committee title and logo
+    if changed_ids.get("committees"):
+        changed_ids["committee_positions"].update(
+            position_id
+            for (position_id,) in db.session.query(
+                CommitteePosition.committee_position_id
+            ).filter(CommitteePosition.committee_id.in_(changed_ids["committees"]))
         )
-        .filter(*published_filter)
-        .order_by(Document.created_at.desc())
-        .all()
+
+    for document_type, document_ids in changed_ids.items():
+        if document_type not in _SEARCH_SOURCES:
+            continue
+
+        SearchDocument.query.filter(
+            SearchDocument.language_code == language,
+            SearchDocument.document_type == document_type,
+            SearchDocument.document_id.in_(document_ids),
+        ).delete(synchronize_session=False)
+
+        db.session.add_all(
+            _build_search_documents(document_type, language, document_ids)
+        )
+
+    _delete_search_changes(
+        [change.search_index_change_id for change in changes]
     )
-    media: List[Media] = (
-        Media.query.options(joinedload(Media.translations), joinedload(Media.author))
-        .filter(*published_filter)
-        .order_by(Media.created_at.desc())
-        .all()
+    state.version += 1
+    db.session.commit()
+
+    return len(changes)
+
+
+def rebuild_search_index(language: str) -> int:
+    """
+    Rebuilds the search index from scratch and removes the journal entries of the language it covers.
+    Run periodically to pick up changes the journal does not track, e.g. renamed authors.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        int: The number of indexed rows.
+    """
+
+    # Read before the source rows, so the rebuild covers these entries. Entries committed meanwhile are kept
+    # for the next update, applying them again is harmless
+    applied_change_ids = [
+        change_id
+        for (change_id,) in db.session.query(
+            SearchIndexChange.search_index_change_id
+        ).filter(SearchIndexChange.language_code == language)
+    ]
+
+    SearchDocument.query.filter(SearchDocument.language_code == language).delete(
+        synchronize_session=False
     )
 
-    news: List[News] = (
-        News.query.options(joinedload(News.translations), joinedload(News.author))
-        .filter(*published_filter)
-        .order_by(News.created_at.desc())
-        .all()
+    documents: List[SearchDocument] = []
+    for document_type in SEARCH_DOCUMENT_TYPES:
+        documents.extend(_build_search_documents(document_type, language))
+    db.session.add_all(documents)
+
+    state: SearchIndexState | None = SearchIndexState.query.get(language)
+    if not state:
+        state = SearchIndexState(language_code=language, version=0)
+        db.session.add(state)
+
+    state.version = (state.version or 0) + 1
+    state.rebuilt_at = datetime.now()
+    _delete_search_changes(applied_change_ids)
+
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another worker built the index at the same time
+        db.session.rollback()
+        return 0
+
+    return len(documents)
+
+
+def _delete_search_changes(change_ids: List[int]) -> None:
+    if not change_ids:
+        return
+
+    SearchIndexChange.query.filter(
+        SearchIndexChange.search_index_change_id.in_(change_ids)
+    ).delete(synchronize_session=False)
+
+
+def _build_search_documents(
+    document_type: str, language: str, document_ids: Iterable[UUID] | None = None
+) -> List[SearchDocument]:
+    query, id_attribute, serialize = _SEARCH_SOURCES[document_type]
+
+    entities = query(document_ids)
+
+    return [
+        SearchDocument(
+            language_code=language,
+            document_type=document_type,
+            document_id=getattr(entity, id_attribute),
+            sort_key=getattr(entity, "created_at", None),
+            data=json_dumps(serialize(entity, language)).decode("utf-8"),
+        )
+        for entity in entities
+    ]
+
+
+def _get_translation(obj, language):
+    translations = {t.language_code: t.to_dict() for t in obj.translations}
+    result = translations.get(language) or translations.get("en-GB") or None
+    if not result:
+        opposite_language = (
+            "en-GB" if language != "en-GB" else "sv-SE"
+        )  # TODO: Fix this
+        result = translations.get(opposite_language) or None
+    return result
+
+
+def _query_committees(committee_ids: Iterable[UUID] | None = None) -> List[Committee]:
+    query = Committee.query.options(joinedload(Committee.translations)).filter(
+        Committee.email.not_in(["info@kth.se", "ordf@ths.kth.se"])
     )
+    if committee_ids is not None:
+        query = query.filter(Committee.committee_id.in_(committee_ids))
+    return query.all()
+
+
+def _query_committee_positions(
+    committee_position_ids: Iterable[UUID] | None = None,
+) -> List[CommitteePosition]:
+    query = CommitteePosition.query.options(
+        joinedload(CommitteePosition.translations),
+        joinedload(CommitteePosition.committee).joinedload(Committee.translations),
+    ).filter(
+        and_(
+            CommitteePosition.role != "MEMBER",
+            CommitteePosition.active,
+        )
+    )
+    if committee_position_ids is not None:
+        query = query.filter(
+            CommitteePosition.committee_position_id.in_(committee_position_ids)
+        )
+    return query.all()
+
+
+def _query_albums(album_ids: Iterable[UUID] | None = None) -> List[Album]:
+    query = Album.query.options(joinedload(Album.translations))
+    if album_ids is not None:
+        query = query.filter(Album.album_id.in_(album_ids))
+    return query.all()
+
+
+def _query_items(item_table: type[Document] | type[Media] | type[News], id_column):
+    def query_items(item_ids: Iterable[UUID] | None = None) -> List[Item]:
+        query = item_table.query.options(
+            joinedload(item_table.translations), joinedload(item_table.author)
+        ).filter(Item.is_public, Item.published_status == "PUBLISHED")
+        if item_ids is not None:
+            query = query.filter(id_column.in_(item_ids))
+        return query.all()
+
+    return query_items
+
+
+def _serialize_committee(c: Committee, language: str) -> Dict[str, Any]:
+    return {
+        "email": c.email,
+        "logo_url": c.logo_url,
+        "translation": _get_translation(c, language),
+    }
+
+
+def _serialize_committee_position(
+    p: CommitteePosition, language: str
+) -> Dict[str, Any]:
+    return {
+        "email": p.email,
+        "committee": {
+            "email": p.committee.email,
+            "logo_url": p.committee.logo_url,
+            "title": _get_translation(p.committee, language).get("title", None),
+        }
+        if p.committee
+        else None,
+        "translation": _get_translation(
+            p,
+            language,
+        ),
+    }
+
+
+def _serialize_album(a: Album, language: str) -> Dict[str, Any]:
+    return {
+        "updated_at": a.updated_at,
+        "translation": _get_translation(a, language),
+    }
+
+
+def _serialize_item(i: Document | Media, language: str) -> Dict[str, Any]:
+    return {
+        "author": i.author.to_dict(provided_languages=language),
+        "last_updated": i.last_updated,
+        "created_at": i.created_at,
+        "translation": _get_translation(i, language),
+    }
+
 
-    def get_translation(obj, language):
-        translations = {t.language_code: t.to_dict() for t in obj.translations}
-        result = translations.get(language) or translations.get("en-GB") or None
-        if not result:
-            opposite_language = (
-                "en-GB" if language != "en-GB" else "sv-SE"
-            )  # TODO: Fix this
-            result = translations.get(opposite_language) or None
-        return result
-
-    data = {
-        "committees": [
-            {
-                "email": c.email,
-                "logo_url": c.logo_url,
-                "translation": get_translation(c, language),
-            }
-            for c in committees
-        ],
-        "committee_positions": [
-            {
-                "email": p.email,
-                "committee": {
-                    "email": p.committee.email,
-                    "logo_url": p.committee.logo_url,
-                    "title": get_translation(p.committee, language).get("title", None),
-                }
-                if p.committee
-                else None,
-                "translation": get_translation(
-                    p,
-                    language,
-                ),
-            }
-            for p in committee_positions
-        ],
-        "albums": [
-            {
-                "updated_at": a.updated_at,
-                "translation": get_translation(a, language),
-            }
-            for a in albums
-        ],
-        "documents": [
-            {
-                "author": d.author.to_dict(provided_languages=language),
-                "last_updated": d.last_updated,
-                "created_at": d.created_at,
-                "translation": get_translation(d, language),
-            }
-            for d in documents
-        ],
-        "media": [
-            {
-                "author": m.author.to_dict(provided_languages=language),
-                "last_updated": m.last_updated,
-                "created_at": m.created_at,
-                "translation": get_translation(m, language),
-            }
-            for m in media
-        ],
-        "news": [
-            {
-                "author": n.author.to_dict(provided_languages=language),
-                "url": n.url,
-                "last_updated": n.last_updated,
-                "created_at": n.created_at,
-                "translation": {
-                    "title": get_translation(n, language).get("title"),
-                    "main_image_url": get_translation(n, language).get("main_image_url")
-                    or None,
-                    "short_description": get_translation(n, language).get(
-                        "short_description"
-                    )
-                    or None,
-                    "language_code": get_translation(n, language).get("language_code"),
-                },
-            }
-            for n in news
-        ],
+def _serialize_news(n: News, language: str) -> Dict[str, Any]:
+    translation = _get_translation(n, language)
+    return {
+        "author": n.author.to_dict(provided_languages=language),
+        "url": n.url,
+        "last_updated": n.last_updated,
+        "created_at": n.created_at,
+        "translation": {
+            "title": translation.get("title"),
+            "main_image_url": translation.get("main_image_url") or None,
+            "short_description": translation.get("short_description") or None,
+            "language_code": translation.get("language_code"),
+        },
     }
 
-    class CustomJSONEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, UUID):
-                return str(obj)
-            return super().default(obj)
 
-    return json.dumps(data, cls=CustomJSONEncoder)
+# Document type -> (query by IDs, attribute holding the ID, serializer)
+_SEARCH_SOURCES: Dict[
+    str,
+    tuple[
+        Callable[[Iterable[UUID] | None], List[Any]],
+        str,
+        Callable[[Any, str], Dict[str, Any]],
+    ],
+] = {
+    "committees": (_query_committees, "committee_id", _serialize_committee),
+    "committee_positions": (
+        _query_committee_positions,
+        "committee_position_id",
+        _serialize_committee_position,
+    ),
+    "albums": (_query_albums, "album_id", _serialize_album),
+    "documents": (
+        _query_items(Document, Document.document_id),
+        "document_id",
+        _serialize_item,
+    ),
+    "media": (_query_items(Media, Media.media_id), "media_id", _serialize_item),
+    "news": (_query_items(News, News.news_id), "news_id", _serialize_news),
+}
@@ -0,0 +1,268 @@
+"""
+Search Index Service
+
+Ranked full-text search over the entries of the search index (`SearchDocument`). Each worker keeps an in-memory
+inverted index per language, rebuilt when the version stamp of the search index changes. Queries only read the stamp,
+the journal is applied by the scheduled refresh.
+"""
+
+import bisect
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+from models.utility.search import SearchDocument
+from services.utility.search import SEARCH_DOCUMENT_TYPES, get_search_index_version
+from utility.database import db
+from utility.json_provider import json_loads
+from utility.translation import normalize_to_ascii
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Title terms count this many times, so a match in the title outranks a match in the description
+TITLE_WEIGHT = 3
+
+# Terms only matching a query token as a prefix score this fraction of an exact match
+PREFIX_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+
+# Query results are cached per query string, so they expire sooner than the full payload
+SEARCH_QUERY_CACHE_TTL = 10 * 60
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a text into lowercase ASCII terms, so that e.g. 'Årsmöte' and 'arsmote' match.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        List[str]: The terms.
+    """
+
+    return _TOKEN_PATTERN.findall(normalize_to_ascii(text).lower())
+
+
+def _get_document_text(data: Dict[str, Any]) -> Tuple[str, str]:
+    translation: Dict[str, Any] = data.get("translation") or {}
+    title = translation.get("title") or ""
+
+    body = [
+        translation.get("description") or "",
+        translation.get("short_description") or "",
+        " ".join(translation.get("categories") or []),
+    ]
+
+    committee: Dict[str, Any] = data.get("committee") or {}
+    body.append(committee.get("title") or "")
+
+    author: Dict[str, Any] = data.get("author") or {}
+    body.append(author.get("first_name") or "")
+    body.append(author.get("last_name") or "")
+    for author_translation in author.get("translations") or []:
+        body.append(author_translation.get("title") or "")
+
+    return title, " ".join(body)
+
+
+class SearchIndex:
+    """
+    An inverted index ranking documents with BM25.
+
+    Attributes:
+        documents: The indexed documents as (document type, data) pairs
+        postings: Term -> {document position: weighted term frequency}
+        lengths: Weighted number of terms per document
+        average_length: Average of `lengths`
+        terms: All indexed terms, sorted for prefix lookups
+    """
+
+    def __init__(self, documents: List[Tuple[str, Dict[str, Any]]]):
+        self.documents = documents
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self.lengths: List[float] = []
+
+        for position, (_, data) in enumerate(documents):
+            title, body = _get_document_text(data)
+            frequencies: Dict[str, float] = defaultdict(float)
+
+            for term in tokenize(title):
+                frequencies[term] += TITLE_WEIGHT
+            for term in tokenize(body):
+                frequencies[term] += 1
+
+            for term, frequency in frequencies.items():
+                self.postings[term][position] = frequency
+            self.lengths.append(sum(frequencies.values()))
+
+        self.average_length = (
+            sum(self.lengths) / len(self.lengths) if self.lengths else 0
+        )
+        self.terms = sorted(self.postings)
+
+    def search(
+        self, query: str, types: List[str] | None = None, limit: int = 20
+    ) -> Tuple[List[Tuple[int, float]], Dict[str, int]]:
+        """
+        Ranks the documents matching every term of the query. The last term also matches as a prefix, for search as you type.
+
+        Args:
+            query (str): The query.
+            types (List[str], optional): Only return documents of these types. Defaults to all types.
+            limit (int, optional): Maximum number of results. Defaults to 20.
+
+        Returns:
+            Tuple[List[Tuple[int, float]], Dict[str, int]]: The (document position, score) pairs of the best matches,
+                and the number of matches per document type, regardless of `types`.
+        """
+
+        tokens = tokenize(query)
+        if not tokens or not self.documents:
+            return [], {}
+
+        scores: Dict[int, float] | None = None
+        for index, token in enumerate(tokens):
+            token_scores = self._score_token(token, prefix=index == len(tokens) - 1)
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    position: score + token_scores[position]
+                    for position, score in scores.items()
+                    if position in token_scores
+                }
+
+            if not scores:
+                return [], {}
+
+        facets: Dict[str, int] = defaultdict(int)
+        for position in scores:
+            facets[self.documents[position][0]] += 1
+
+        if types:
+            scores = {
+                position: score
+                for position, score in scores.items()
+                if self.documents[position][0] in types
+            }
+
+        ranked = sorted(scores.items(), key=lambda result: result[1], reverse=True)
+        return ranked[:limit], dict(facets)
+
+    def _score_token(self, token: str, prefix: bool) -> Dict[int, float]:
+        terms = [(token, 1.0)] if token in self.postings else []
+
+        if prefix:
+            start = bisect.bisect_left(self.terms, token)
+            for term in self.terms[start : start + MAX_PREFIX_EXPANSIONS + 1]:
+                if not term.startswith(token):
+                    break
+                if term != token:
+                    terms.append((term, PREFIX_WEIGHT))
+
+        scores: Dict[int, float] = {}
+        total = len(self.documents)
+
+        for term, weight in terms:
+            postings = self.postings[term]
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+
+            for position, frequency in postings.items():
+                length_norm = 1 - BM25_B + BM25_B * (
+                    self.lengths[position] / self.average_length
+                )
+                score = (
+                    weight
+                    * idf
+                    * frequency
+                    * (BM25_K1 + 1)
+                    / (frequency + BM25_K1 * length_norm)
+                )
+                # A document matching the token through several terms keeps its best match
+                scores[position] = max(scores.get(position, 0), score)
+
+        return scores
+
+
+# Language -> (version, index), one per worker
+_indexes: Dict[str, Tuple[int, SearchIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(language: str) -> SearchIndex:
+    """
+    Retrieves the inverted index for a language, rebuilding it if the search index changed.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        SearchIndex: The index.
+    """
+
+    # A plain read of the stamp, so concurrent queries neither wait on each other nor touch the caller's transaction
+    version = get_search_index_version(language)
+
+    cached = _indexes.get(language)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    with _indexes_lock:
+        cached = _indexes.get(language)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        rows = (
+            db.session.query(SearchDocument.document_type, SearchDocument.data)
+            .filter(SearchDocument.language_code == language)
+            .all()
+        )
+        index = SearchIndex(
+            [(document_type, json_loads(data)) for document_type, data in rows]
+        )
+        _indexes[language] = (version, index)
+
+    return index
+
+
+def search(
+    language: str, query: str, types: List[str] | None = None, limit: int = 20
+) -> Dict[str, Any]:
+    """
+    Searches the content of a language.
+
+    Args:
+        language (str): The language code.
+        query (str): The query.
+        types (List[str], optional): Only return these document types, e.g. ['news', 'documents']. Defaults to all types.
+        limit (int, optional): Maximum number of results. Defaults to 20.
+
+    Returns:
+        Dict[str, Any]: The ranked results, and the number of matches per document type.
+    """
+
+    index = get_search_index(language)
+    ranked, facets = index.search(query, types=types, limit=limit)
+
+    return {
+        "query": query,
+        "results": [
+            {
+                "type": index.documents[position][0],
+                "score": round(score, 4),
+                "data": index.documents[position][1],
+            }
+            for position, score in ranked
+        ],
+        "facets": {
+            document_type: facets.get(document_type, 0)
+            for document_type in SEARCH_DOCUMENT_TYPES
+        },
+    }
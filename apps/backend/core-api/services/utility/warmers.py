@@ -0,0 +1,123 @@
+"""
+Cache Warmer Service
+
+Registry of the cached public read-heavy endpoints, refreshed by the scheduler before their entries expire so that
+visitors never pay for a cold rebuild.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple
+from decorators.cached_response import refresh_response
+from services.utility.search import refresh_search_index, update_search_cache
+from utility.constants import AVAILABLE_LANGUAGES, PUBLIC_PATH
+from utility.database import db
+from utility.logger import log_error
+
+
+class Warmer(NamedTuple):
+    """
+    A cache entry to keep warm.
+
+    Attributes:
+        name: Unique name, e.g. 'news_latest:sv-SE'
+        refresh: Rebuilds and stores the entry, returns a falsy value on failure
+    """
+
+    name: str
+    refresh: Callable[[], object]
+
+
+def _response_warmer(name: str, path: str, query: Dict[str, str]) -> Warmer:
+    return Warmer(name, lambda: refresh_response(path, query))
+
+
+def _search_warmer(language: str) -> Warmer:
+    def refresh():
+        # Apply the journal first, the cache is packed from the index
+        refresh_search_index(language)
+        return update_search_cache(language)
+
+    return Warmer(f"search:{language}", refresh)
+
+
+def _recruitments_warmer(language: str) -> Warmer:
+    # The committee services depend on this package
+    from services.committees.public.recruitment import build_recruitments
+
+    return Warmer(
+        f"recruitments:{language}", lambda: build_recruitments.refresh((language,))
+    )
+
+
+def get_warmers() -> List[Warmer]:
+    """
+    Retrieves all registered warmers.
+
+    Returns:
+        List[Warmer]: The warmers, the calendar ones cover the current and the next month.
+    """
+
+    now = datetime.now()
+    months = [
+        now.strftime("%Y-%m"),
+        (
+            now.replace(year=now.year + 1, month=1, day=1)
+            if now.month == 12
+            else now.replace(month=now.month + 1, day=1)
+        ).strftime("%Y-%m"),
+    ]
+
+    warmers: List[Warmer] = []
+    for language in AVAILABLE_LANGUAGES:
+        query = {"language": language}
+
+        warmers.append(_search_warmer(language))
+        warmers.append(
+            _response_warmer(
+                f"news_latest:{language}", f"{PUBLIC_PATH}/news/latest", query
+            )
+        )
+        warmers.extend(
+            _response_warmer(
+                f"calendar_events:{month}:{language}",
+                f"{PUBLIC_PATH}/calendar/events",
+                {**query, "date": month},
+            )
+            for month in months
+        )
+        warmers.append(
+            _response_warmer(
+                f"committees:{language}", f"{PUBLIC_PATH}/committees", query
+            )
+        )
+        warmers.append(_recruitments_warmer(language))
+
+    return warmers
+
+
+def run_warmers(names: List[str] | None = None) -> Dict[str, bool]:
+    """
+    Refreshes the cache entries of the registered warmers. A failing warmer is logged and does not stop the others.
+
+    Args:
+        names (List[str], optional): Only run warmers whose name starts with one of these, e.g. ['search', 'committees'].
+            Defaults to all warmers.
+
+    Returns:
+        Dict[str, bool]: Whether each warmer that ran succeeded, by name.
+    """
+
+    results: Dict[str, bool] = {}
+
+    for warmer in get_warmers():
+        if names and not any(warmer.name.startswith(name) for name in names):
+            continue
+
+        try:
+            results[warmer.name] = bool(warmer.refresh())
+        except Exception as e:
+            db.session.rollback()
+            log_error(f"Error warming cache: {e}", warmer=warmer.name)
+            results[warmer.name] = False
+
+    return results
@@ -0,0 +1,26 @@
+"""
+Shared test setup.
+
+`utility.gc` creates its Google Cloud clients at import time from the service account file, which only exists in the
+deployed containers, and the models import it through `utility`. It is replaced before collection so that the tests
+run anywhere and never reach Google Cloud.
+"""
+
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+_gc = ModuleType("utility.gc")
+for name in (
+    "publisher",
+    "topic_path",
+    "tasks",
+    "parent",
+    "medieteknik_bucket",
+    "rgbank_bucket",
+    "upload_file",
+    "delete_file",
+):
+    setattr(_gc, name, MagicMock(name=f"utility.gc.{name}"))
+
+sys.modules["utility.gc"] = _gc
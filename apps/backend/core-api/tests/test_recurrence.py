@@ -0,0 +1,228 @@
+"""
+RFC 5545 conformance of the recurrence expansion, checked against `dateutil.rrule`.
+
+Run from apps/backend/core-api with `python -m pytest tests` (pytest is not part of requirements.txt).
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import List, Tuple
+import pytest
+from dateutil import rrule
+from models.content import Frequency
+from services.content.recurrence import expand_recurrence
+
+_RRULE_FREQUENCIES = {
+    Frequency.DAILY: rrule.DAILY,
+    Frequency.WEEKLY: rrule.WEEKLY,
+    Frequency.MONTHLY: rrule.MONTHLY,
+    Frequency.YEARLY: rrule.YEARLY,
+}
+
+
+def _expected(
+    start: datetime,
+    duration: int,
+    frequency: Frequency,
+    interval: int | None,
+    until: datetime | None,
+    count: int | None,
+    window_start: datetime,
+    window_end: datetime,
+) -> List[Tuple[datetime, datetime]]:
+    rule = rrule.rrule(
+        _RRULE_FREQUENCIES[frequency],
+        dtstart=start,
+        interval=interval or 1,
+        until=until,
+        count=count,
+    )
+
+    occurrences = []
+    for occurrence_start in rule:
+        if occurrence_start >= window_end:
+            break
+
+        occurrence_end = occurrence_start + timedelta(minutes=duration)
+        if occurrence_end >= window_start:
+            occurrences.append((occurrence_start, occurrence_end))
+
+    return occurrences
+
+
+def _assert_matches_rrule(*args) -> None:
+    assert list(expand_recurrence(*args)) == _expected(*args)
+
+
+@pytest.mark.parametrize("frequency", list(Frequency))
+@pytest.mark.parametrize("interval", [None, 1, 2, 3, 5])
+@pytest.mark.parametrize(
+    "until, count",
+    [
+        (None, None),
+        (None, 1),
+        (None, 7),
+        (datetime(2027, 3, 31, 18), None),
+        (datetime(2026, 12, 31, 18, 0), None),
+    ],
+)
+def test_rule_parts(frequency, interval, until, count):
+    start = datetime(2025, 11, 30, 18, 0)
+
+    for window_start, window_end in (
+        (datetime(2025, 11, 1), datetime(2026, 1, 1)),
+        (datetime(2026, 12, 1), datetime(2027, 2, 1)),
+        (datetime(2024, 1, 1), datetime(2030, 1, 1)),
+    ):
+        _assert_matches_rrule(
+            start, 90, frequency, interval, until, count, window_start, window_end
+        )
+
+
+@pytest.mark.parametrize("frequency", [Frequency.MONTHLY, Frequency.YEARLY])
+@pytest.mark.parametrize("day", [28, 29, 30, 31])
+@pytest.mark.parametrize("interval", [1, 2, 5])
+@pytest.mark.parametrize("count", [None, 4, 13])
+def test_month_days_after_the_28th(frequency, day, interval, count):
+    month = 2 if frequency == Frequency.YEARLY and day == 29 else 1
+    start = datetime(2024, month, day, 12, 0)
+
+    _assert_matches_rrule(
+        start,
+        60,
+        frequency,
+        interval,
+        None,
+        count,
+        datetime(2025, 1, 1),
+        datetime(2033, 1, 1),
+    )
+
+
+def test_monthly_skips_missing_days():
+    occurrences = expand_recurrence(
+        datetime(2026, 1, 31, 10),
+        30,
+        Frequency.MONTHLY,
+        1,
+        None,
+        None,
+        datetime(2026, 1, 1),
+        datetime(2026, 6, 1),
+    )
+
+    assert [start.date() for start, _ in occurrences] == [
+        datetime(2026, 1, 31).date(),
+        datetime(2026, 3, 31).date(),
+        datetime(2026, 5, 31).date(),
+    ]
+
+
+def test_count_counts_from_the_first_occurrence():
+    # Three occurrences in total, on Jan 31, Mar 31 and May 31, whatever the window
+    args = (
+        datetime(2026, 1, 31, 10),
+        30,
+        Frequency.MONTHLY,
+        1,
+        None,
+        3,
+    )
+
+    assert (
+        len(expand_recurrence(*args, datetime(2026, 4, 1), datetime(2027, 1, 1))) == 1
+    )
+    _assert_matches_rrule(*args, datetime(2026, 4, 1), datetime(2027, 1, 1))
+
+
+def test_until_is_inclusive():
+    until = datetime(2026, 3, 17, 18, 0)
+    occurrences = expand_recurrence(
+        datetime(2026, 3, 3, 18, 0),
+        60,
+        Frequency.WEEKLY,
+        1,
+        until,
+        None,
+        datetime(2026, 3, 1),
+        datetime(2026, 5, 1),
+    )
+
+    assert occurrences[-1][0] == until
+    assert len(occurrences) == 3
+
+
+@pytest.mark.parametrize("frequency", list(Frequency))
+@pytest.mark.parametrize("interval", [1, 2])
+def test_december_to_january_rollover(frequency, interval):
+    start = datetime(2025, 12, 31, 23, 0)
+
+    _assert_matches_rrule(
+        start,
+        120,
+        frequency,
+        interval,
+        None,
+        None,
+        datetime(2026, 12, 15),
+        datetime(2027, 1, 15),
+    )
+
+
+def test_occurrence_running_into_the_window_is_included():
+    # A week-long occurrence starting before the window still overlaps it
+    args = (
+        datetime(2026, 1, 28, 9),
+        7 * 24 * 60,
+        Frequency.MONTHLY,
+        1,
+        None,
+        None,
+        datetime(2026, 2, 1),
+        datetime(2026, 2, 2),
+    )
+
+    assert expand_recurrence(*args)[0][0] == datetime(2026, 1, 28, 9)
+    _assert_matches_rrule(*args)
+
+
+def test_random_rules():
+    generator = random.Random(5545)
+
+    for _ in range(2000):
+        start = datetime(
+            generator.randint(2019, 2026),
+            generator.randint(1, 12),
+            generator.randint(1, 28) if generator.random() < 0.6 else 1,
+            generator.randint(0, 23),
+            generator.choice([0, 15, 30, 45]),
+        )
+        if generator.random() < 0.4:
+            # A day after the 28th, in a month that has it
+            start = start.replace(month=generator.choice([1, 3, 5, 7, 8, 10, 12]))
+            start = start.replace(day=generator.randint(29, 31))
+
+        window_start = start + timedelta(days=generator.randint(-60, 3000))
+        window_end = window_start + timedelta(days=generator.randint(1, 400))
+        until = (
+            start + timedelta(days=generator.randint(0, 3000))
+            if generator.random() < 0.3
+            else None
+        )
+        # RFC 5545 does not allow both
+        count = (
+            generator.randint(1, 60)
+            if until is None and generator.random() < 0.3
+            else None
+        )
+
+        _assert_matches_rrule(
+            start,
+            generator.choice([0, 30, 90, 24 * 60, 10 * 24 * 60]),
+            generator.choice(list(Frequency)),
+            generator.choice([None, 1, 2, 3, 4, 7]),
+            until,
+            count,
+            window_start,
+            window_end,
+        )
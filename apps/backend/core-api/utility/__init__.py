@@ -28,17 +28,34 @@ from .gc import rgbank_bucket
 from .gc import upload_file
 from .gc import delete_file
 
+from .json_provider import ORJSONProvider
+from .json_provider import json_dumps
+from .json_provider import json_loads
+
 from .logger import log_error
 from .logger import log_warning
 from .logger import log_info
 
+from .pagination import InvalidCursorError
+from .pagination import get_cached_total
+from .pagination import keyset_paginate
+from .pagination import wants_total
+
+from .payload import CompressedPayload
+
 from .reception_mode import RECEPTION_MODE
 
 from .cache import get_cache
 from .cache import set_cache
+from .cache import delete_cache
+from .cache import invalidate_cache
+from .cache import single_flight
+
+from .serializer import serialize_columns
 
 from .translation import convert_iso_639_1_to_bcp_47
 from .translation import get_translation
+from .translation import get_translations
 from .translation import normalize_to_ascii
 from .translation import retrieve_languages
 from .translation import update_translation_or_create
@@ -65,16 +82,29 @@ __all__ = [
     "rgbank_bucket",
     "upload_file",
     "delete_file",
+    "ORJSONProvider",
+    "json_dumps",
+    "json_loads",
     "log_error",
     "log_warning",
     "log_info",
     "PUBLIC_PATH",
     "PROTECTED_PATH",
+    "InvalidCursorError",
+    "get_cached_total",
+    "keyset_paginate",
+    "wants_total",
+    "CompressedPayload",
     "RECEPTION_MODE",
     "get_cache",
     "set_cache",
+    "delete_cache",
+    "invalidate_cache",
+    "single_flight",
+    "serialize_columns",
     "convert_iso_639_1_to_bcp_47",
     "get_translation",
+    "get_translations",
     "normalize_to_ascii",
     "retrieve_languages",
     "update_translation_or_create",
@@ -0,0 +1,232 @@
+"""
+The cache package. A bounded per-worker LRU in front of a shared store, SQLite in WAL mode by default or Redis when `REDIS_URL` is set.
+
+Environment variables:
+ * `REDIS_URL` - Use Redis as the shared store
+ * `CACHE_DB_PATH` - Path to the SQLite file, defaults to `cache/cache.db`
+ * `CACHE_LOCAL_MAX_ENTRIES` - Maximum number of entries in the per-worker tier
+ * `CACHE_LOCAL_MAX_BYTES` - Maximum total size of the per-worker tier
+ * `CACHE_LOCAL_TTL` - Maximum lifetime (seconds) of an entry in the per-worker tier
+ * `CACHE_MAX_ENTRY_BYTES` - Largest value accepted by the shared store
+ * `CACHE_METRICS_DIR` - Directory where each worker writes its metrics, defaults to `cache/metrics`
+"""
+
+import os
+from typing import Any, Callable, Iterable, Tuple
+
+from .backends import CacheBackend, CacheEntry, CacheError, RedisCache, SQLiteCache
+from .invalidation import (
+    InvalidationBus,
+    RedisInvalidationBus,
+    SQLiteInvalidationBus,
+    committee_tag,
+    language_tag,
+)
+from .local import CacheValue, LocalCache
+from .metrics import CacheMetrics, key_family, render_prometheus
+from .singleflight import SingleFlight
+from .tiered import CacheStats, TieredCache
+
+CACHE_DB_PATH = os.environ.get("CACHE_DB_PATH", "cache/cache.db")
+CACHE_MAX_ENTRY_BYTES = int(os.environ.get("CACHE_MAX_ENTRY_BYTES", 32 * 1024 * 1024))
+CACHE_METRICS_DIR = os.environ.get("CACHE_METRICS_DIR", "cache/metrics")
+
+
+def _create_shared_backend() -> Tuple[CacheBackend, InvalidationBus]:
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url:
+        store = RedisCache(redis_url, max_entry_bytes=CACHE_MAX_ENTRY_BYTES)
+        return store, RedisInvalidationBus(store)
+
+    store = SQLiteCache(CACHE_DB_PATH, max_entry_bytes=CACHE_MAX_ENTRY_BYTES)
+    return store, SQLiteInvalidationBus(store)
+
+
+_shared, _bus = _create_shared_backend()
+
+# The cache used by the application, one per worker process
+cache = TieredCache(
+    local=LocalCache(
+        max_entries=int(os.environ.get("CACHE_LOCAL_MAX_ENTRIES", 1024)),
+        max_bytes=int(os.environ.get("CACHE_LOCAL_MAX_BYTES", 64 * 1024 * 1024)),
+        default_ttl=int(os.environ.get("CACHE_LOCAL_TTL", 30)),
+    ),
+    shared=_shared,
+    bus=_bus,
+    metrics=CacheMetrics(snapshot_dir=CACHE_METRICS_DIR),
+)
+
+
+def get_cache(key: str) -> CacheValue | None:
+    """
+    Retrieves a value from the cache.
+
+    :param key: The cache key
+    :type key: str
+    :return: The cached value or None if missing or expired
+    :rtype: str | bytes | None
+    :raises CacheError: If the shared store fails
+    """
+
+    return cache.get(key)
+
+
+def set_cache(
+    key: str,
+    value: CacheValue,
+    ttl: int | None = None,
+    tags: Iterable[str] | None = None,
+) -> None:
+    """
+    Stores a value in the cache.
+
+    :param key: The cache key
+    :type key: str
+    :param value: The value to store
+    :type value: str | bytes
+    :param ttl: Time to live in seconds, None to never expire
+    :type ttl: int, optional
+    :param tags: Tags the entry depends on, e.g. 'news', 'committee:<id>' or 'lang:sv-SE'
+    :type tags: Iterable[str], optional
+    :raises CacheError: If the shared store fails or the value is too large
+    """
+
+    cache.set(key, value, ttl=ttl, tags=tags)
+
+
+def delete_cache(key: str) -> None:
+    """
+    Removes a value from the cache.
+
+    :param key: The cache key
+    :type key: str
+    :raises CacheError: If the shared store fails
+    """
+
+    cache.delete(key)
+
+
+def invalidate_cache(*tags: str) -> int:
+    """
+    Removes every entry carrying at least one of the tags, in the shared store and in the local tier of every worker.
+
+    :param tags: The tags to invalidate, e.g. 'news', 'committee:<id>' or 'lang:sv-SE'
+    :type tags: str
+    :return: The number of entries removed from the shared store
+    :rtype: int
+    :raises CacheError: If the shared store fails
+    """
+
+    removed = cache.invalidate_tags(tags)
+
+    # The old versions were tagged with their own tag and are gone, store the new ones after the entries are removed
+    cache.renew_tag_versions(tags)
+
+    return removed
+
+
+def get_tag_version(tag: str) -> int:
+    """
+    Retrieves the version of a tag, which changes every time the tag is invalidated.
+
+    :param tag: The tag, e.g. 'news'
+    :type tag: str
+    :return: The time of the last invalidation in nanoseconds, or of the first lookup if it was never invalidated
+    :rtype: int
+    :raises CacheError: If the shared store fails
+    """
+
+    return cache.get_tag_version(tag)
+
+
+def purge_expired_cache() -> int:
+    """
+    Removes the expired entries of the shared store. Expired entries are otherwise only removed when they are read, so
+    keys that are never read again, e.g. of past queries or months, would stay in the store.
+
+    :return: The number of removed entries
+    :rtype: int
+    :raises CacheError: If the shared store fails
+    """
+
+    return cache.purge_expired()
+
+
+def get_cache_metrics() -> str:
+    """
+    Retrieves the cache metrics of all workers on this host.
+
+    :return: The metrics in the Prometheus text exposition format
+    :rtype: str
+    """
+
+    return render_prometheus(cache.metrics.collect())
+
+
+def single_flight(
+    key: Callable[..., str],
+    ttl: int,
+    stale_ttl: int = 0,
+    tags: Callable[..., Iterable[str]] | None = None,
+    **options: Any,
+) -> Callable[[Callable[..., CacheValue | None]], SingleFlight]:
+    """
+    Decorator caching the result of a function, with at most one rebuild per key running across all workers.
+    Callers that find the entry missing wait for the rebuild, callers that find it stale get the stale value meanwhile.
+    `refresh(...)` on the decorated function forces a rebuild.
+
+    :param key: Builds the cache key from the function arguments
+    :type key: Callable[..., str]
+    :param ttl: Seconds the value is fresh
+    :type ttl: int
+    :param stale_ttl: Seconds the value is served stale after `ttl` while it is rebuilt
+    :type stale_ttl: int
+    :param tags: Builds the cache tags from the function arguments
+    :type tags: Callable[..., Iterable[str]], optional
+    :param options: `lock_ttl` and `poll_interval`, see SingleFlight
+    :return: The decorator
+    :rtype: Callable[[Callable[..., str | bytes | None]], SingleFlight]
+    """
+
+    def decorator(compute: Callable[..., CacheValue | None]) -> SingleFlight:
+        return SingleFlight(
+            cache,
+            compute,
+            key=key,
+            ttl=ttl,
+            stale_ttl=stale_ttl,
+            tags=tags,
+            **options,
+        )
+
+    return decorator
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheEntry",
+    "CacheError",
+    "CacheMetrics",
+    "CacheStats",
+    "CacheValue",
+    "InvalidationBus",
+    "LocalCache",
+    "RedisCache",
+    "RedisInvalidationBus",
+    "SQLiteCache",
+    "SQLiteInvalidationBus",
+    "SingleFlight",
+    "TieredCache",
+    "cache",
+    "committee_tag",
+    "key_family",
+    "language_tag",
+    "get_cache",
+    "set_cache",
+    "delete_cache",
+    "invalidate_cache",
+    "get_tag_version",
+    "get_cache_metrics",
+    "purge_expired_cache",
+    "single_flight",
+]
@@ -0,0 +1,446 @@
+"""
+Shared cache stores, visible to every gunicorn worker. SQLite (WAL mode) is used by default, Redis when `REDIS_URL` is set.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Iterable, NamedTuple, Tuple
+
+from .local import CacheValue
+
+
+class CacheError(Exception):
+    """
+    Raised when the shared cache store fails to read or write an entry.
+    """
+
+
+class CacheEntry(NamedTuple):
+    """
+    A value read from the shared store.
+
+    Attributes:
+        value: The cached value
+        expires_at: Unix timestamp when the entry expires, None if it never expires
+        tags: The tags the entry was stored with
+    """
+
+    value: CacheValue
+    expires_at: float | None
+    tags: Tuple[str, ...] = ()
+
+    def remaining_ttl(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.time(), 0)
+
+
+# Values are stored as bytes: a one byte type marker, the tags separated by newlines, a NUL separator and the payload.
+# This way both text and binary payloads survive the round trip, and workers learn the tags of entries they did not write.
+_TEXT_MARKER = b"s"
+_BYTES_MARKER = b"b"
+
+
+def encode_value(value: CacheValue, tags: Iterable[str] | None = None) -> bytes:
+    header = "\n".join(tags or ()).encode("utf-8") + b"\0"
+    if isinstance(value, bytes):
+        return _BYTES_MARKER + header + value
+    return _TEXT_MARKER + header + value.encode("utf-8")
+
+
+def decode_value(raw: bytes) -> Tuple[CacheValue, Tuple[str, ...]]:
+    raw = bytes(raw)
+    separator = raw.index(b"\0", 1)
+    header = raw[1:separator].decode("utf-8")
+    tags = tuple(header.split("\n")) if header else ()
+    payload = raw[separator + 1 :]
+
+    if raw[:1] == _BYTES_MARKER:
+        return payload, tags
+    return payload.decode("utf-8"), tags
+
+
+class CacheBackend:
+    """
+    Interface for the shared cache stores.
+    """
+
+    def get(self, key: str) -> CacheEntry | None:
+        raise NotImplementedError
+
+    def set(
+        self,
+        key: str,
+        value: CacheValue,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Removes every entry carrying at least one of the tags.
+
+        :return: The number of removed entries
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    def acquire_lock(self, name: str, ttl: float) -> str | None:
+        """
+        Tries to acquire a lock shared by all workers, without blocking. The lock is released automatically after `ttl` seconds.
+
+        :return: A token for `release_lock`, None if the lock is held by someone else
+        :rtype: str | None
+        """
+        raise NotImplementedError
+
+    def release_lock(self, name: str, token: str) -> None:
+        """
+        Releases a lock, unless it expired and was acquired by someone else in the meantime.
+        """
+        raise NotImplementedError
+
+    def purge_expired(self) -> int:
+        """
+        Removes all expired entries. Stores that expire entries on their own have nothing to remove.
+
+        :return: The number of removed entries
+        :rtype: int
+        """
+        return 0
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Shared store backed by a SQLite file in WAL mode, so readers never block on the writer. Each thread keeps one pooled connection instead of connecting per call.
+
+    Attributes:
+        path: Path to the SQLite database file
+        max_entry_bytes: Largest value accepted by the store
+    """
+
+    def __init__(self, path: str, max_entry_bytes: int = 32 * 1024 * 1024):
+        self.path = path
+        self.max_entry_bytes = max_entry_bytes
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            self._create_table()
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache initialization error: {str(e)}")
+
+    def connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so they are keyed on the process id as well as the thread
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _create_table(self) -> None:
+        conn = self.connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entry ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_tag ("
+            "tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_tag_key ON cache_tag (key)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_lock ("
+            "name TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            row = (
+                self.connection()
+                .execute(
+                    "SELECT value, expires_at FROM cache_entry WHERE key = ?", (key,)
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache retrieval error: {str(e)}")
+
+        if not row:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return None
+
+        payload, tags = decode_value(value)
+        return CacheEntry(payload, expires_at, tags)
+
+    def set(
+        self,
+        key: str,
+        value: CacheValue,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> None:
+        tags = list(tags or ())
+        encoded = encode_value(value, tags)
+        if len(encoded) > self.max_entry_bytes:
+            raise CacheError(
+                f"Cache storage error: value for {key} exceeds {self.max_entry_bytes} bytes"
+            )
+
+        expires_at = time.time() + ttl if ttl else None
+
+        try:
+            conn = self.connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entry (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, encoded, expires_at),
+                )
+                conn.execute("DELETE FROM cache_tag WHERE key = ?", (key,))
+                if tags:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO cache_tag (tag, key) VALUES (?, ?)",
+                        [(tag, key) for tag in tags],
+                    )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache storage error: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        try:
+            conn = self.connection()
+            conn.execute("DELETE FROM cache_entry WHERE key = ?", (key,))
+            conn.execute("DELETE FROM cache_tag WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache deletion error: {str(e)}")
+
+    def clear(self) -> None:
+        try:
+            conn = self.connection()
+            conn.execute("DELETE FROM cache_entry")
+            conn.execute("DELETE FROM cache_tag")
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache deletion error: {str(e)}")
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if not tags:
+            return 0
+
+        placeholders = ", ".join("?" for _ in tags)
+        try:
+            conn = self.connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.execute(
+                    f"DELETE FROM cache_entry WHERE key IN (SELECT key FROM cache_tag WHERE tag IN ({placeholders}))",
+                    tags,
+                )
+                conn.execute(
+                    f"DELETE FROM cache_tag WHERE key IN (SELECT key FROM cache_tag WHERE tag IN ({placeholders}))",
+                    tags,
+                )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache invalidation error: {str(e)}")
+
+        return cursor.rowcount
+
+    def acquire_lock(self, name: str, ttl: float) -> str | None:
+        token = uuid.uuid4().hex
+        now = time.time()
+
+        try:
+            conn = self.connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "DELETE FROM cache_lock WHERE name = ? AND expires_at <= ?",
+                    (name, now),
+                )
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO cache_lock (name, token, expires_at) VALUES (?, ?, ?)",
+                    (name, token, now + ttl),
+                )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache lock error: {str(e)}")
+
+        return token if cursor.rowcount == 1 else None
+
+    def release_lock(self, name: str, token: str) -> None:
+        try:
+            self.connection().execute(
+                "DELETE FROM cache_lock WHERE name = ? AND token = ?", (name, token)
+            )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache lock error: {str(e)}")
+
+    def purge_expired(self) -> int:
+        """
+        Removes all expired entries.
+
+        :return: The number of removed entries
+        :rtype: int
+        """
+
+        try:
+            conn = self.connection()
+            cursor = conn.execute(
+                "DELETE FROM cache_entry WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            conn.execute(
+                "DELETE FROM cache_tag WHERE key NOT IN (SELECT key FROM cache_entry)"
+            )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache deletion error: {str(e)}")
+
+        return cursor.rowcount
+
+
+class RedisCache(CacheBackend):
+    """
+    Shared store backed by Redis. The client keeps its own thread-safe connection pool.
+
+    Attributes:
+        prefix: Prefix for all keys, to keep cache entries apart from the rate limiter
+        max_entry_bytes: Largest value accepted by the store
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "cache:",
+        max_entry_bytes: int = 32 * 1024 * 1024,
+    ):
+        import redis
+
+        self.prefix = prefix
+        self.max_entry_bytes = max_entry_bytes
+        self.errors = (redis.RedisError,)
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            pipeline.get(self.prefix + key)
+            pipeline.pttl(self.prefix + key)
+            value, pttl = pipeline.execute()
+        except self.errors as e:
+            raise CacheError(f"Cache retrieval error: {str(e)}")
+
+        if value is None:
+            return None
+
+        expires_at = time.time() + pttl / 1000 if pttl and pttl > 0 else None
+        payload, tags = decode_value(value)
+        return CacheEntry(payload, expires_at, tags)
+
+    def set(
+        self,
+        key: str,
+        value: CacheValue,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> None:
+        tags = list(tags or ())
+        encoded = encode_value(value, tags)
+        if len(encoded) > self.max_entry_bytes:
+            raise CacheError(
+                f"Cache storage error: value for {key} exceeds {self.max_entry_bytes} bytes"
+            )
+
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            pipeline.set(self.prefix + key, encoded, ex=ttl if ttl else None)
+            for tag in tags:
+                # Tag sets may hold keys that already expired, invalidating them is a no-op
+                pipeline.sadd(self._tag_key(tag), key)
+            pipeline.execute()
+        except self.errors as e:
+            raise CacheError(f"Cache storage error: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(self.prefix + key)
+        except self.errors as e:
+            raise CacheError(f"Cache deletion error: {str(e)}")
+
+    def clear(self) -> None:
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.prefix}*", count=500))
+            if keys:
+                self.client.delete(*keys)
+        except self.errors as e:
+            raise CacheError(f"Cache deletion error: {str(e)}")
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return 0
+
+        try:
+            keys = self.client.sunion(tag_keys)
+            pipeline = self.client.pipeline(transaction=False)
+            if keys:
+                pipeline.delete(*[self.prefix + key.decode("utf-8") for key in keys])
+            pipeline.delete(*tag_keys)
+            results = pipeline.execute()
+        except self.errors as e:
+            raise CacheError(f"Cache invalidation error: {str(e)}")
+
+        return results[0] if keys else 0
+
+    def acquire_lock(self, name: str, ttl: float) -> str | None:
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.client.set(
+                self._lock_key(name), token, nx=True, px=int(ttl * 1000)
+            )
+        except self.errors as e:
+            raise CacheError(f"Cache lock error: {str(e)}")
+
+        return token if acquired else None
+
+    def release_lock(self, name: str, token: str) -> None:
+        try:
+            self.client.eval(_RELEASE_LOCK_SCRIPT, 1, self._lock_key(name), token)
+        except self.errors as e:
+            raise CacheError(f"Cache lock error: {str(e)}")
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _lock_key(self, name: str) -> str:
+        return f"{self.prefix}lock:{name}"
+
+
+# Deletes the lock only if it still holds our token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
@@ -0,0 +1,181 @@
+"""
+Cross-worker invalidation bus. Every worker keeps its own local cache tier, so invalidating a tag has to reach all of them, not just the worker that handled the write.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterable, List
+
+from .backends import CacheError, RedisCache, SQLiteCache
+
+InvalidationCallback = Callable[[Iterable[str]], Any]
+
+
+def committee_tag(committee_id: Any) -> str:
+    """
+    Tag for cache entries that depend on a single committee.
+
+    :param committee_id: The committee ID
+    :type committee_id: Any
+    :return: The tag, e.g. 'committee:<id>'
+    :rtype: str
+    """
+
+    return f"committee:{committee_id}"
+
+
+def language_tag(language_code: str) -> str:
+    """
+    Tag for cache entries rendered in a single language.
+
+    :param language_code: The language code, e.g. 'sv-SE'
+    :type language_code: str
+    :return: The tag, e.g. 'lang:sv-SE'
+    :rtype: str
+    """
+
+    return f"lang:{language_code}"
+
+
+class InvalidationBus:
+    """
+    Interface for broadcasting invalidated tags to all workers.
+    """
+
+    def publish(self, tags: List[str]) -> None:
+        raise NotImplementedError
+
+    def sync(self, callback: InvalidationCallback) -> None:
+        """
+        Delivers tags invalidated by other workers to `callback`. Called on every cache read, so it must be cheap.
+        """
+        raise NotImplementedError
+
+
+class SQLiteInvalidationBus(InvalidationBus):
+    """
+    Invalidation log stored next to the SQLite cache. Workers poll the log at most once per `poll_interval`, and always before serving a local entry, so stale local values are dropped within milliseconds.
+
+    Attributes:
+        poll_interval: Minimum time in seconds between two polls of the log
+        retention: How long in seconds log rows are kept
+    """
+
+    def __init__(
+        self, store: SQLiteCache, poll_interval: float = 0.05, retention: int = 3600
+    ):
+        self.store = store
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._last_id: int | None = None
+        self._last_poll = 0.0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+        try:
+            self.store.connection().execute(
+                "CREATE TABLE IF NOT EXISTS cache_invalidation ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, tag TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache initialization error: {str(e)}")
+
+    def publish(self, tags: List[str]) -> None:
+        now = time.time()
+        try:
+            conn = self.store.connection()
+            conn.executemany(
+                "INSERT INTO cache_invalidation (tag, created_at) VALUES (?, ?)",
+                [(tag, now) for tag in tags],
+            )
+            conn.execute(
+                "DELETE FROM cache_invalidation WHERE created_at < ?",
+                (now - self.retention,),
+            )
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache invalidation error: {str(e)}")
+
+    def sync(self, callback: InvalidationCallback) -> None:
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval and self._pid == os.getpid():
+            return
+
+        # Only one thread per worker polls, the others keep serving
+        if not self._lock.acquire(blocking=False):
+            return
+
+        try:
+            self._last_poll = now
+            conn = self.store.connection()
+
+            if self._last_id is None or self._pid != os.getpid():
+                # Everything logged before this worker started is already reflected in the shared store
+                self._pid = os.getpid()
+                row = conn.execute("SELECT MAX(id) FROM cache_invalidation").fetchone()
+                self._last_id = row[0] or 0
+                return
+
+            rows = conn.execute(
+                "SELECT id, tag FROM cache_invalidation WHERE id > ? ORDER BY id",
+                (self._last_id,),
+            ).fetchall()
+
+            if rows:
+                self._last_id = rows[-1][0]
+                callback({tag for _, tag in rows})
+        except sqlite3.Error as e:
+            raise CacheError(f"Cache invalidation error: {str(e)}")
+        finally:
+            self._lock.release()
+
+
+class RedisInvalidationBus(InvalidationBus):
+    """
+    Invalidation over Redis pub/sub. Each worker runs one daemon listener thread that drops local entries as soon as a message arrives.
+
+    Attributes:
+        channel: The pub/sub channel
+    """
+
+    def __init__(self, store: RedisCache, channel: str = "cache:invalidate"):
+        self.client = store.client
+        self.channel = channel
+        self.errors = store.errors
+        self._thread = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def publish(self, tags: List[str]) -> None:
+        try:
+            self.client.publish(self.channel, "\n".join(tags))
+        except self.errors as e:
+            raise CacheError(f"Cache invalidation error: {str(e)}")
+
+    def sync(self, callback: InvalidationCallback) -> None:
+        if (
+            self._pid == os.getpid()
+            and self._thread is not None
+            and self._thread.is_alive()
+        ):
+            return
+
+        with self._lock:
+            if (
+                self._pid == os.getpid()
+                and self._thread is not None
+                and self._thread.is_alive()
+            ):
+                return
+
+            def handle_message(message):
+                callback(message["data"].decode("utf-8").split("\n"))
+
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{self.channel: handle_message})
+                self._thread = pubsub.run_in_thread(sleep_time=1, daemon=True)
+                self._pid = os.getpid()
+            except self.errors as e:
+                raise CacheError(f"Cache invalidation error: {str(e)}")
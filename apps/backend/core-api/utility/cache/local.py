@@ -0,0 +1,191 @@
+"""
+In-process (per worker) cache tier. A bounded LRU that sits in front of the shared store.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Set, Tuple
+
+CacheValue = str | bytes
+
+
+def entry_size(value: CacheValue) -> int:
+    """
+    Returns the approximate size of a cache value in bytes. Strings are counted per character to avoid encoding large payloads just to measure them.
+
+    :param value: The cached value
+    :type value: str | bytes
+    :return: The approximate size in bytes
+    :rtype: int
+    """
+
+    return len(value)
+
+
+class LocalCache:
+    """
+    A thread-safe, bounded LRU cache living inside a single worker process.
+
+    Attributes:
+        max_entries: Maximum number of entries kept before the least recently used is evicted
+        max_bytes: Maximum total size of all entries in bytes
+        max_entry_bytes: Entries larger than this are never kept locally
+        default_ttl: TTL in seconds used when no TTL is given
+        evictions: Number of entries evicted because of the size limits
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 16 * 1024 * 1024,
+        default_ttl: int = 30,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.default_ttl = default_ttl
+        self.evictions = 0
+
+        # key -> (value, expires_at, size, tags)
+        self._entries: OrderedDict[
+            str, Tuple[CacheValue, float, int, FrozenSet[str]]
+        ] = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheValue | None:
+        """
+        Retrieves a value, marking it as most recently used.
+
+        :param key: The cache key
+        :type key: str
+        :return: The value or None if missing or expired
+        :rtype: str | bytes | None
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at, _, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(
+        self,
+        key: str,
+        value: CacheValue,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> bool:
+        """
+        Stores a value, evicting the least recently used entries if the limits are exceeded.
+
+        :param key: The cache key
+        :type key: str
+        :param value: The value to store
+        :type value: str | bytes
+        :param ttl: Time to live in seconds, defaults to `default_ttl`
+        :type ttl: int, optional
+        :param tags: Tags used to invalidate the entry together with related entries
+        :type tags: Iterable[str], optional
+        :return: True if the value was stored, False if it was too large to keep locally
+        :rtype: bool
+        """
+
+        size = entry_size(value)
+        if size > self.max_entry_bytes or size > self.max_bytes:
+            self.delete(key)
+            return False
+
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            self.delete(key)
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            tags = frozenset(tags or ())
+            self._entries[key] = (value, time.monotonic() + ttl, size, tags)
+            self._total_bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self._total_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+        return True
+
+    def delete(self, key: str) -> None:
+        """
+        Removes a value if present.
+
+        :param key: The cache key
+        :type key: str
+        """
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Removes every value carrying at least one of the tags.
+
+        :param tags: The tags to invalidate
+        :type tags: Iterable[str]
+        :return: The number of removed values
+        :rtype: int
+        """
+
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes all values.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        # Caller must hold the lock
+        _, _, size, tags = self._entries.pop(key)
+        self._total_bytes -= size
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
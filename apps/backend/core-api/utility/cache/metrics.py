@@ -0,0 +1,316 @@
+"""
+Cache metrics grouped by key family, exported in the Prometheus text format. Every worker periodically writes its
+metrics to a snapshot file, so that any worker can report the totals of all workers on the host.
+"""
+
+import bisect
+import json
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Upper bounds of the histogram buckets
+REBUILD_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+ENTRY_BYTES_BUCKETS = tuple(2**exponent for exponent in range(10, 26, 2))
+
+METRIC_HELP: Dict[str, Tuple[str, str]] = {
+    "cache_requests_total": ("counter", "Cache reads by key family and result"),
+    "cache_stale_total": ("counter", "Reads that found an entry past its fresh TTL"),
+    "cache_sets_total": ("counter", "Cache writes by key family"),
+    "cache_invalidated_entries_total": (
+        "counter",
+        "Entries removed from the shared store by tag invalidation",
+    ),
+    "cache_local_evictions_total": (
+        "counter",
+        "Entries evicted from the per-worker tier because of its size limits",
+    ),
+    "cache_rebuild_seconds": ("histogram", "Time spent rebuilding an entry"),
+    "cache_rebuild_discarded_total": (
+        "counter",
+        "Rebuilt entries not stored because their tags were invalidated during the rebuild",
+    ),
+    "cache_entry_bytes": ("histogram", "Size of the written entries"),
+    "cache_local_entries": ("gauge", "Entries in the per-worker tier"),
+    "cache_local_bytes": ("gauge", "Size of the per-worker tier"),
+    # Recorded by utility/query_stats.py
+    "db_requests_total": ("counter", "Requests by blueprint"),
+    "db_queries_total": ("counter", "SQL statements run by requests, by blueprint"),
+    "db_query_seconds_total": (
+        "counter",
+        "Execution time of the SQL statements run by requests, by blueprint",
+    ),
+    "db_request_queries": ("histogram", "SQL statements per request"),
+    "db_request_seconds": (
+        "histogram",
+        "Execution time of the SQL statements per request",
+    ),
+    "db_query_budget_exceeded_total": (
+        "counter",
+        "Requests exceeding the query budget of their route, by endpoint",
+    ),
+}
+
+_HASH_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,}"
+)
+
+# (metric name, sorted label pairs)
+Series = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def key_family(key: str) -> str:
+    """
+    Groups cache keys for metrics, dropping query strings and replacing hashes and UUIDs so the number of families stays bounded.
+    E.g. 'search_sv-SE_query_<sha1>' -> 'search_sv-SE_query_*', 'response:/api/v1/public/news/latest?language=sv-SE' -> 'response:/api/v1/public/news/latest'.
+
+    :param key: The cache key
+    :type key: str
+    :return: The key family
+    :rtype: str
+    """
+
+    return _HASH_PATTERN.sub("*", key.split("?", 1)[0])
+
+
+def _series(name: str, labels: Dict[str, str]) -> Series:
+    return name, tuple(sorted(labels.items()))
+
+
+class CacheMetrics:
+    """
+    Thread-safe counters, gauges and histograms of a single worker.
+
+    Attributes:
+        snapshot_dir: Directory of the per-worker snapshot files, None to keep the metrics in this worker only
+        flush_interval: Minimum number of seconds between two snapshots of this worker
+        collectors: Called before each snapshot, to update metrics read from elsewhere (e.g. gauges)
+    """
+
+    def __init__(self, snapshot_dir: str | None = None, flush_interval: float = 10):
+        self.snapshot_dir = snapshot_dir
+        self.flush_interval = flush_interval
+        self.collectors: List[Callable[["CacheMetrics"], None]] = []
+
+        self._counters: Dict[Series, float] = {}
+        self._gauges: Dict[Series, float] = {}
+        # series -> (bucket bounds, bucket counts, sum, count)
+        self._histograms: Dict[Series, Tuple[Tuple[float, ...], List[int], float, int]] = {}
+        self._lock = threading.Lock()
+        self._flushed_at = 0.0
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        series = _series(name, labels)
+        with self._lock:
+            self._counters[series] = self._counters.get(series, 0) + amount
+
+    def set_counter(self, name: str, value: float, **labels: str) -> None:
+        """
+        Sets a counter kept elsewhere, e.g. the evictions of the local tier.
+        """
+
+        with self._lock:
+            self._counters[_series(name, labels)] = value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        with self._lock:
+            self._gauges[_series(name, labels)] = value
+
+    def observe(
+        self, name: str, value: float, buckets: Tuple[float, ...], **labels: str
+    ) -> None:
+        series = _series(name, labels)
+        with self._lock:
+            bounds, counts, total, count = self._histograms.get(
+                series, (buckets, [0] * (len(buckets) + 1), 0.0, 0)
+            )
+            counts[bisect.bisect_left(bounds, value)] += 1
+            self._histograms[series] = (bounds, counts, total + value, count + 1)
+
+    def snapshot(self) -> Dict[str, list]:
+        """
+        Copies the metrics into a JSON serializable value.
+
+        :return: The counters, gauges and histograms of this worker
+        :rtype: Dict[str, list]
+        """
+
+        for collector in self.collectors:
+            collector(self)
+
+        with self._lock:
+            return {
+                "counters": [
+                    [name, dict(labels), value]
+                    for (name, labels), value in self._counters.items()
+                ],
+                "gauges": [
+                    [name, dict(labels), value]
+                    for (name, labels), value in self._gauges.items()
+                ],
+                "histograms": [
+                    [name, dict(labels), list(bounds), list(counts), total, count]
+                    for (name, labels), (
+                        bounds,
+                        counts,
+                        total,
+                        count,
+                    ) in self._histograms.items()
+                ],
+            }
+
+    def maybe_flush(self) -> None:
+        """
+        Writes the snapshot of this worker if the last one is older than `flush_interval`.
+        """
+
+        if (
+            self.snapshot_dir
+            and time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            try:
+                self.flush()
+            except OSError:
+                # Metrics must never fail a cache read, the next interval tries again
+                pass
+
+    def flush(self) -> None:
+        """
+        Writes the snapshot of this worker, replacing its previous one.
+        """
+
+        self._flushed_at = time.monotonic()
+        if not self.snapshot_dir:
+            return
+
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        path = os.path.join(self.snapshot_dir, f"{os.getpid()}.json")
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file)
+        os.replace(temporary_path, path)
+
+    def collect(self) -> List[Dict[str, list]]:
+        """
+        Retrieves the snapshots of all workers, this worker's one being current.
+
+        :return: The snapshots
+        :rtype: List[Dict[str, list]]
+        """
+
+        if not self.snapshot_dir:
+            return [self.snapshot()]
+
+        self.flush()
+        snapshots = []
+
+        for file_name in os.listdir(self.snapshot_dir):
+            pid, extension = os.path.splitext(file_name)
+            if extension != ".json" or not pid.isdigit():
+                continue
+
+            path = os.path.join(self.snapshot_dir, file_name)
+            if not _is_alive(int(pid)):
+                # Counters of dead workers are dropped, Prometheus sees them as a counter reset
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+
+            try:
+                with open(path, encoding="utf-8") as file:
+                    snapshots.append(json.load(file))
+            except (OSError, ValueError):
+                # Being replaced by its worker
+                continue
+
+        return snapshots
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = [
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in labels
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(snapshots: List[Dict[str, list]]) -> str:
+    """
+    Sums the snapshots of all workers and formats them in the Prometheus text exposition format.
+
+    :param snapshots: The snapshots, see `CacheMetrics.snapshot`
+    :type snapshots: List[Dict[str, list]]
+    :return: The metrics
+    :rtype: str
+    """
+
+    samples: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {}
+    histograms: Dict[
+        str, Dict[Tuple[Tuple[str, str], ...], Tuple[List[float], List[int], float, int]]
+    ] = {}
+
+    for snapshot in snapshots:
+        for kind in ("counters", "gauges"):
+            for name, labels, value in snapshot.get(kind, []):
+                series = samples.setdefault(name, {})
+                key = tuple(sorted(labels.items()))
+                series[key] = series.get(key, 0) + value
+
+        for name, labels, bounds, counts, total, count in snapshot.get(
+            "histograms", []
+        ):
+            series = histograms.setdefault(name, {})
+            key = tuple(sorted(labels.items()))
+            if key in series:
+                _, merged_counts, merged_total, merged_count = series[key]
+                counts = [a + b for a, b in zip(merged_counts, counts)]
+                total += merged_total
+                count += merged_count
+            series[key] = (bounds, counts, total, count)
+
+    lines: List[str] = []
+
+    for name in sorted(set(samples) | set(histograms)):
+        kind, description = METRIC_HELP.get(name, ("untyped", name))
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+
+        for labels, value in sorted(samples.get(name, {}).items()):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for labels, (bounds, counts, total, count) in sorted(
+            histograms.get(name, {}).items()
+        ):
+            cumulative = 0
+            for bound, bucket_count in zip([*bounds, "+Inf"], counts):
+                cumulative += bucket_count
+                bucket_labels = (*labels, ("le", str(bound)))
+                lines.append(
+                    f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                )
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,165 @@
+"""
+Request coalescing for expensive cache rebuilds. Only one caller per key, across all threads and workers, rebuilds a
+missing or stale entry; the others wait for its result or keep serving the stale value (stale-while-revalidate).
+A rebuild is only stored if none of its tags was invalidated while it ran, so it never outlives a concurrent write.
+"""
+
+import functools
+import time
+from typing import Any, Callable, Iterable, List, Tuple
+
+from .backends import decode_value, encode_value
+from .local import CacheValue
+from .metrics import REBUILD_SECONDS_BUCKETS, key_family
+from .tiered import TieredCache
+
+# Entries are stored with a header line holding the time until which they are fresh, followed by the encoded value
+_FRESH_SEPARATOR = b"\n"
+
+
+def _pack(value: CacheValue, fresh_until: float) -> bytes:
+    return f"{fresh_until:.3f}".encode("ascii") + _FRESH_SEPARATOR + encode_value(value)
+
+
+def _unpack(raw: CacheValue) -> Tuple[CacheValue, float] | None:
+    if not isinstance(raw, bytes):
+        return None
+
+    try:
+        separator = raw.index(_FRESH_SEPARATOR)
+        fresh_until = float(raw[:separator])
+        value, _ = decode_value(raw[separator + 1 :])
+    except ValueError:
+        return None
+
+    return value, fresh_until
+
+
+class SingleFlight:
+    """
+    Coalesces rebuilds of one kind of cache entry.
+
+    Attributes:
+        cache: The cache holding the entries and the locks
+        compute: Builds the value for the given arguments, may return None to skip caching
+        key: Builds the cache key from the arguments
+        ttl: Seconds an entry is fresh
+        stale_ttl: Seconds an entry is served stale after `ttl` while one caller rebuilds it
+        tags: Builds the tags of the entry from the arguments
+        lock_ttl: Seconds after which the rebuild lock expires, in case the rebuilding worker dies. Also bounds how long
+            a caller waits for another caller's rebuild
+        poll_interval: Seconds between two checks while waiting
+    """
+
+    def __init__(
+        self,
+        cache: TieredCache,
+        compute: Callable[..., CacheValue | None],
+        key: Callable[..., str],
+        ttl: int,
+        stale_ttl: int = 0,
+        tags: Callable[..., Iterable[str]] | None = None,
+        lock_ttl: float = 60,
+        poll_interval: float = 0.05,
+    ):
+        self.cache = cache
+        self.compute = compute
+        self.key = key
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.tags = tags
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        functools.update_wrapper(self, compute)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> CacheValue | None:
+        """
+        Retrieves the cached value, rebuilding it if it is missing or stale.
+        """
+
+        key = self.key(*args, **kwargs)
+        entry = _unpack(self.cache.get(key))
+
+        if entry is not None:
+            value, fresh_until = entry
+            if fresh_until > time.time():
+                return value
+
+            # Stale: one caller rebuilds, everyone else keeps the stale value meanwhile
+            self.cache.metrics.inc("cache_stale_total", family=key_family(key))
+            token = self.cache.acquire_lock(key, self.lock_ttl)
+            if token is None:
+                return value
+            return self._rebuild(key, token, args, kwargs)
+
+        # Missing: only the holder of the lock rebuilds. A rebuild that was not stored releases the lock to the next
+        # waiter, and the lock of a worker that died expires after `lock_ttl`
+        while True:
+            token = self.cache.acquire_lock(key, self.lock_ttl)
+            if token is not None:
+                return self._rebuild(key, token, args, kwargs)
+
+            time.sleep(self.poll_interval)
+
+            entry = _unpack(self.cache.get(key))
+            if entry is not None:
+                return entry[0]
+
+    def refresh(self, *args: Any, **kwargs: Any) -> CacheValue | None:
+        """
+        Rebuilds and stores the value, regardless of what is cached.
+        """
+
+        key = self.key(*args, **kwargs)
+        tags = list(self.tags(*args, **kwargs)) if self.tags else []
+
+        # Read before the data, a write invalidating the tags during the rebuild renews them
+        versions = self._get_tag_versions(tags)
+
+        started_at = time.perf_counter()
+        value = self.compute(*args, **kwargs)
+        self.cache.metrics.observe(
+            "cache_rebuild_seconds",
+            time.perf_counter() - started_at,
+            REBUILD_SECONDS_BUCKETS,
+            family=key_family(key),
+        )
+
+        if value is not None:
+            self._store(key, value, tags, versions)
+        return value
+
+    def _rebuild(
+        self, key: str, token: str, args: Tuple[Any, ...], kwargs: dict
+    ) -> CacheValue | None:
+        try:
+            # Another caller may have finished a rebuild between our read and acquiring the lock
+            entry = _unpack(self.cache.get(key))
+            if entry is not None and entry[1] > time.time():
+                return entry[0]
+
+            return self.refresh(*args, **kwargs)
+        finally:
+            self.cache.release_lock(key, token)
+
+    def _get_tag_versions(self, tags: List[str]) -> List[int]:
+        return [self.cache.get_tag_version(tag) for tag in tags]
+
+    def _store(
+        self, key: str, value: CacheValue, tags: List[str], versions: List[int]
+    ) -> None:
+        # The value may predate a write made during the rebuild, it is returned to the caller but not kept
+        if self._get_tag_versions(tags) != versions:
+            self.cache.metrics.inc("cache_rebuild_discarded_total", family=key_family(key))
+            return
+
+        self.cache.set(
+            key,
+            _pack(value, time.time() + self.ttl),
+            ttl=self.ttl + self.stale_ttl,
+            tags=tags or None,
+        )
+
+        # An invalidation between the check and the store removed the entries before this one was written
+        if self._get_tag_versions(tags) != versions:
+            self.cache.delete(key)
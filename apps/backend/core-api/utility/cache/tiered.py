@@ -0,0 +1,200 @@
+"""
+Two-tier cache: a per-worker LRU in front of the shared store.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable
+
+from .backends import CacheBackend
+from .invalidation import InvalidationBus
+from .local import CacheValue, LocalCache, entry_size
+from .metrics import ENTRY_BYTES_BUCKETS, CacheMetrics, key_family
+
+# Every tag has a version, a timestamp in nanoseconds renewed on each invalidation of the tag
+TAG_VERSION_PREFIX = "tag_version:"
+
+# CacheStats counter -> `result` label of the read metrics
+_READ_RESULTS = {"local_hits": "local_hit", "shared_hits": "shared_hit", "misses": "miss"}
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit and miss counters for a single worker.
+
+    Attributes:
+        local_hits: Reads answered by the in-process tier
+        shared_hits: Reads answered by the shared store
+        misses: Reads that found nothing in either tier
+        sets: Writes
+        deletes: Deletions
+        invalidations: Entries removed from the shared store by tag invalidation
+    """
+
+    local_hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    deletes: int = 0
+    invalidations: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.local_hits + self.shared_hits
+
+
+class TieredCache:
+    """
+    Reads go to the local tier first and fall through to the shared store, writes go to both.
+    Tag invalidations are broadcast over the bus so that every worker drops its local copies, and
+    local entries live at most `local.default_ttl` seconds as a safety net.
+
+    Attributes:
+        local: The in-process tier
+        shared: The shared store
+        bus: Broadcasts invalidated tags to the other workers
+        stats: Hit and miss counters for this worker
+        metrics: Counters and histograms per key family, exported for Prometheus
+    """
+
+    def __init__(
+        self,
+        local: LocalCache,
+        shared: CacheBackend,
+        bus: InvalidationBus,
+        metrics: CacheMetrics | None = None,
+    ):
+        self.local = local
+        self.shared = shared
+        self.bus = bus
+        self.stats = CacheStats()
+        self.metrics = metrics or CacheMetrics()
+        self.metrics.collectors.append(self._collect_metrics)
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> CacheValue | None:
+        self.bus.sync(self.local.invalidate_tags)
+        self.metrics.maybe_flush()
+
+        value = self.local.get(key)
+        if value is not None:
+            self._count("local_hits", key)
+            return value
+
+        entry = self.shared.get(key)
+        if entry is None:
+            self._count("misses", key)
+            return None
+
+        self._count("shared_hits", key)
+        self.local.set(
+            key,
+            entry.value,
+            ttl=self._local_ttl(entry.remaining_ttl()),
+            tags=entry.tags,
+        )
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: CacheValue,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> None:
+        tags = list(tags or ())
+        self.shared.set(key, value, ttl=ttl, tags=tags)
+        self.local.set(key, value, ttl=self._local_ttl(ttl), tags=tags)
+        self._count("sets")
+
+        family = key_family(key)
+        self.metrics.inc("cache_sets_total", family=family)
+        self.metrics.observe(
+            "cache_entry_bytes", entry_size(value), ENTRY_BYTES_BUCKETS, family=family
+        )
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        self.shared.delete(key)
+        self._count("deletes")
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if not tags:
+            return 0
+
+        removed = self.shared.invalidate_tags(tags)
+        self.local.invalidate_tags(tags)
+        self.bus.publish(tags)
+
+        with self._stats_lock:
+            self.stats.invalidations += removed
+        self.metrics.inc("cache_invalidated_entries_total", removed)
+        return removed
+
+    def get_tag_version(self, tag: str) -> int:
+        key = TAG_VERSION_PREFIX + tag
+        value = self.get(key)
+
+        if value is not None:
+            try:
+                return int(value)
+            except ValueError:
+                pass
+
+        # Tagged with its own tag, so an invalidation removes it in every tier before the new version is stored
+        version = time.time_ns()
+        self.set(key, str(version), tags=[tag])
+        return version
+
+    def renew_tag_versions(self, tags: Iterable[str]) -> None:
+        version = str(time.time_ns())
+        for tag in tags:
+            self.set(TAG_VERSION_PREFIX + tag, version, tags=[tag])
+
+    def clear(self) -> None:
+        self.local.clear()
+        self.shared.clear()
+
+    def acquire_lock(self, name: str, ttl: float) -> str | None:
+        return self.shared.acquire_lock(name, ttl)
+
+    def release_lock(self, name: str, token: str) -> None:
+        self.shared.release_lock(name, token)
+
+    def purge_expired(self) -> int:
+        return self.shared.purge_expired()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = asdict(self.stats)
+            stats["hits"] = self.stats.hits
+
+        stats["local_entries"] = len(self.local)
+        stats["local_bytes"] = self.local.total_bytes
+        stats["local_evictions"] = self.local.evictions
+        stats["backend"] = type(self.shared).__name__
+        return stats
+
+    def _local_ttl(self, ttl: float | None) -> int:
+        if ttl is None:
+            return self.local.default_ttl
+        return int(min(ttl, self.local.default_ttl))
+
+    def _count(self, counter: str, key: str | None = None) -> None:
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+        if key is not None:
+            self.metrics.inc(
+                "cache_requests_total",
+                family=key_family(key),
+                result=_READ_RESULTS[counter],
+            )
+
+    def _collect_metrics(self, metrics: CacheMetrics) -> None:
+        metrics.set_gauge("cache_local_entries", len(self.local))
+        metrics.set_gauge("cache_local_bytes", self.local.total_bytes)
+        metrics.set_counter("cache_local_evictions_total", self.local.evictions)
@@ -0,0 +1,208 @@
+"""
+Sparse fieldsets for the public read endpoints. Clients name the attributes they use with `fields`, dotted for nested
+objects (e.g. `fields=url,created_at,translations.title,author.author_type`), and the relationships to embed with
+`include` (e.g. `include=author`). Without either parameter responses are unchanged.
+
+The models serialize only the selected columns and skip the relationships left out, and the list queries load only
+what is serialized, see `services.utility.loader_options.get_item_loader_options`.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, Mapping
+from werkzeug.datastructures import MultiDict
+
+# Bounds of the parameters, longer lists are cut
+FIELDSET_MAX_FIELDS = 64
+FIELDSET_MAX_DEPTH = 3
+
+
+class Fieldset:
+    """
+    The selected attributes of an object.
+
+    Attributes:
+        fields: Attribute name -> fieldset of the nested object (None for all its attributes), None for all attributes
+        include: The relationships to embed, None for the default ones
+    """
+
+    __slots__ = ("fields", "include")
+
+    def __init__(
+        self,
+        fields: Dict[str, "Fieldset | None"] | None = None,
+        include: FrozenSet[str] | None = None,
+    ):
+        self.fields = fields
+        self.include = include
+
+    def __repr__(self) -> str:
+        return f"<Fieldset fields={self.fields!r} include={self.include!r}>"
+
+
+def _add_path(fields: Dict[str, Fieldset | None], path: Iterable[str]) -> None:
+    name, *rest = path
+    if not rest:
+        # A bare name selects the whole object, even if some of its attributes were named too
+        fields[name] = None
+        return
+
+    if name in fields and fields[name] is None:
+        return
+
+    nested = fields.get(name) or Fieldset(fields={})
+    fields[name] = nested
+    _add_path(nested.fields, rest)
+
+
+def _split(values: Iterable[str]) -> list[str]:
+    names = [
+        name.strip()
+        for value in values
+        for name in value.split(",")
+        if name.strip()
+    ]
+    return names[:FIELDSET_MAX_FIELDS]
+
+
+def parse_fieldset(args: MultiDict[str, str] | Mapping[str, str]) -> Fieldset | None:
+    """
+    Parses the `fields` and `include` parameters of a request.
+
+    :param args: The request arguments
+    :type args: MultiDict[str, str]
+    :return: The fieldset, None if neither parameter is given
+    :rtype: Fieldset | None
+    """
+
+    getlist = args.getlist if isinstance(args, MultiDict) else lambda key: [args[key]]
+
+    fields = None
+    if "fields" in args:
+        fields = {}
+        for name in _split(getlist("fields")):
+            _add_path(fields, name.split(".")[:FIELDSET_MAX_DEPTH])
+
+    include = None
+    if "include" in args:
+        include = frozenset(_split(getlist("include")))
+
+    if fields is None and include is None:
+        return None
+
+    return Fieldset(fields=fields, include=include)
+
+
+def wants(fieldset: Fieldset | None, name: str) -> bool:
+    """
+    Checks whether an attribute is selected.
+
+    :param fieldset: The fieldset, None for all attributes
+    :type fieldset: Fieldset | None
+    :param name: The attribute name
+    :type name: str
+    :return: True if the attribute is serialized
+    :rtype: bool
+    """
+
+    return fieldset is None or fieldset.fields is None or name in fieldset.fields
+
+
+def wants_relationship(fieldset: Fieldset | None, name: str) -> bool:
+    """
+    Checks whether a relationship is embedded. It is if it is named in `fields` or `include`, or if neither
+    parameter restricts the relationships.
+
+    :param fieldset: The fieldset, None for all attributes
+    :type fieldset: Fieldset | None
+    :param name: The relationship name, e.g. 'author'
+    :type name: str
+    :return: True if the relationship is serialized
+    :rtype: bool
+    """
+
+    if fieldset is None or (fieldset.fields is None and fieldset.include is None):
+        return True
+
+    return (fieldset.fields is not None and name in fieldset.fields) or (
+        fieldset.include is not None and name in fieldset.include
+    )
+
+
+def nested(fieldset: Fieldset | None, name: str) -> Fieldset | None:
+    """
+    Retrieves the fieldset of a nested object.
+
+    :param fieldset: The fieldset, None for all attributes
+    :type fieldset: Fieldset | None
+    :param name: The attribute name of the nested object
+    :type name: str
+    :return: The fieldset of the nested object, None for all its attributes
+    :rtype: Fieldset | None
+    """
+
+    if fieldset is None or fieldset.fields is None:
+        return None
+
+    return fieldset.fields.get(name)
+
+
+def column_exclude(
+    fieldset: Fieldset | None, keys: Iterable[str], exclude: Iterable[str] = ()
+) -> FrozenSet[str]:
+    """
+    Retrieves the columns left out of a serialization.
+
+    :param fieldset: The fieldset, None for all attributes
+    :type fieldset: Fieldset | None
+    :param keys: The column attributes of the model
+    :type keys: Iterable[str]
+    :param exclude: Columns always left out
+    :type exclude: Iterable[str], optional
+    :return: The excluded columns
+    :rtype: FrozenSet[str]
+    """
+
+    if fieldset is None or fieldset.fields is None:
+        return frozenset(exclude)
+
+    return frozenset(exclude).union(
+        key for key in keys if key not in fieldset.fields
+    )
+
+
+def _project_nested(value: Any, fieldset: Fieldset) -> Any:
+    if isinstance(value, dict):
+        return project(value, fieldset)
+    if isinstance(value, list):
+        return [_project_nested(element, fieldset) for element in value]
+    return value
+
+
+def project(data: Dict[str, Any], fieldset: Fieldset | None) -> Dict[str, Any]:
+    """
+    Removes the attributes that are not selected from a serialized object, for the values computed by `to_dict`
+    and the objects serialized ahead of time. Nested objects and lists of objects are projected too.
+
+    :param data: The serialized object
+    :type data: Dict[str, Any]
+    :param fieldset: The fieldset, None for all attributes
+    :type fieldset: Fieldset | None
+    :return: The object with the selected attributes only
+    :rtype: Dict[str, Any]
+    """
+
+    if fieldset is None or fieldset.fields is None:
+        return data
+
+    projected = {}
+    for key, value in data.items():
+        if key in fieldset.fields:
+            nested_fieldset = fieldset.fields[key]
+            projected[key] = (
+                value
+                if nested_fieldset is None
+                else _project_nested(value, nested_fieldset)
+            )
+        elif fieldset.include is not None and key in fieldset.include:
+            projected[key] = value
+
+    return projected
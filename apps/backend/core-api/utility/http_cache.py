@@ -0,0 +1,170 @@
+"""
+HTTP freshness and validation for the public routes. Responses get a Cache-Control header from the policy of their
+blueprint, an ETag and a Last-Modified header. Routes whose data is covered by cache tags are validated from the tag
+versions, so a conditional request is answered with 304 before the view runs; other routes fall back to hashing the body.
+"""
+
+import hashlib
+import os
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import Dict, NamedTuple, Tuple
+from flask import Response, g, request
+from .cache import CacheError, get_tag_version
+from .constants import PUBLIC_PATH
+from .logger import log_error
+
+# Part of every validator, so that a release changing the response format does not answer 304 to old copies
+HTTP_CACHE_RELEASE = os.environ.get("RELEASE_VERSION") or os.environ.get(
+    "K_REVISION", ""
+)
+
+_CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+class CachePolicy(NamedTuple):
+    """
+    How long the responses of a route may be reused, and what they are validated against.
+
+    Attributes:
+        max_age: Seconds browsers and shared caches may reuse a response without revalidating
+        tags: The cache tags the responses depend on, their versions are the validators. Without tags, the validator
+            is the hash of the rendered body
+    """
+
+    max_age: int
+    tags: Tuple[str, ...] = ()
+
+    @property
+    def cache_control(self) -> str:
+        return f"public, max-age={self.max_age}"
+
+
+DEFAULT_CACHE_POLICY = CachePolicy(max_age=60)
+
+
+def get_cache_policy(policies: Dict[str, CachePolicy]) -> CachePolicy | None:
+    """
+    Retrieves the policy of the current request, by endpoint first and then by blueprint.
+
+    :param policies: The policies by endpoint (e.g. 'public.search_content') or blueprint name (e.g. 'public_news')
+    :type policies: Dict[str, CachePolicy]
+    :return: The policy, DEFAULT_CACHE_POLICY for public routes without one, None for other routes
+    :rtype: CachePolicy | None
+    """
+
+    if not request.path.startswith(PUBLIC_PATH):
+        return None
+
+    return (
+        policies.get(request.endpoint or "")
+        or policies.get(request.blueprint or "")
+        or DEFAULT_CACHE_POLICY
+    )
+
+
+def get_validators(policy: CachePolicy) -> Tuple[str, datetime] | None:
+    """
+    Derives the ETag and Last-Modified of the current request from the versions of the policy tags.
+
+    :param policy: The policy of the request
+    :type policy: CachePolicy
+    :return: The ETag and the last modification time, None if the policy has no tags or the cache is unavailable
+    :rtype: Tuple[str, datetime] | None
+    """
+
+    if not policy.tags:
+        return None
+
+    try:
+        versions = [get_tag_version(tag) for tag in policy.tags]
+    except CacheError as e:
+        log_error(f"Failed to retrieve tag versions: {str(e)}", tags=list(policy.tags))
+        return None
+
+    key = f"{HTTP_CACHE_RELEASE}\n{request.full_path}\n{versions}"
+    etag = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    last_modified = datetime.fromtimestamp(max(versions) // 10**9, tz=timezone.utc)
+
+    return etag, last_modified
+
+
+def check_not_modified(policies: Dict[str, CachePolicy]) -> Response | None:
+    """
+    Answers a conditional request with 304 if the client copy is current, without running the view.
+    Meant as a `before_request` hook, the validators are kept on `g` for `apply_cache_headers`.
+
+    :param policies: The policies by endpoint or blueprint name
+    :type policies: Dict[str, CachePolicy]
+    :return: The 304 response, or None to run the view
+    :rtype: flask.Response | None
+    """
+
+    if request.method not in _CACHEABLE_METHODS:
+        return None
+
+    policy = get_cache_policy(policies)
+    validators = get_validators(policy) if policy else None
+    if validators is None:
+        return None
+
+    g.http_validators = validators
+    etag, last_modified = validators
+
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag)
+    else:
+        not_modified = bool(
+            request.if_modified_since and last_modified <= request.if_modified_since
+        )
+
+    if not not_modified:
+        return None
+
+    return Response(status=HTTPStatus.NOT_MODIFIED)
+
+
+def apply_cache_headers(
+    response: Response, policies: Dict[str, CachePolicy]
+) -> Response:
+    """
+    Sets the Cache-Control, ETag and Last-Modified headers of a public response. An existing Cache-Control header or
+    ETag is kept.
+    Meant as an `after_request` hook.
+
+    :param response: The response
+    :type response: flask.Response
+    :param policies: The policies by endpoint or blueprint name
+    :type policies: Dict[str, CachePolicy]
+    :return: The response, turned into a 304 if the client copy matches the body hash
+    :rtype: flask.Response
+    """
+
+    policy = get_cache_policy(policies)
+    if policy is None:
+        return response
+
+    if not response.headers.get("Cache-Control"):
+        response.headers["Cache-Control"] = policy.cache_control
+
+    if request.method not in _CACHEABLE_METHODS or response.status_code not in (
+        HTTPStatus.OK,
+        HTTPStatus.NOT_MODIFIED,
+    ):
+        return response
+
+    validators = g.get("http_validators")
+    # Responses validated by the view itself keep their ETag, e.g. the precompressed payloads
+    if validators is not None and not response.headers.get("ETag"):
+        # Replaces the body hash of cached responses, so the next conditional request is answered before the view
+        etag, last_modified = validators
+        response.set_etag(etag, weak=True)
+        response.last_modified = last_modified
+        return response
+
+    if response.status_code == HTTPStatus.OK and not response.is_streamed:
+        if not response.headers.get("ETag"):
+            response.add_etag(weak=True)
+        response.make_conditional(request)
+
+    return response
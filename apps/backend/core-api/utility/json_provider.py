@@ -0,0 +1,160 @@
+"""
+JSON encoding backed by orjson, for the responses (`app.json`, used by `jsonify`), the cached payloads and the Pub/Sub
+messages. UUIDs, enums, dataclasses, dates and datetimes are encoded without going through Python, decimals as strings.
+
+Responses keep the format of Flask's default provider, dates as HTTP dates and sorted keys, so clients and cached
+validators see the same documents. Other payloads use ISO 8601 dates.
+"""
+
+import decimal
+from datetime import date, datetime, time, timezone
+from typing import Any
+import orjson
+from flask.json.provider import JSONProvider
+
+# Keys may be UUIDs, enums or numbers, like with the standard library
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+def http_date(value: date) -> str:
+    """
+    Formats a date as an HTTP date, like `werkzeug.http.http_date` without going through `email.utils`.
+    Naive datetimes are taken as UTC.
+
+    :param value: The date or datetime
+    :type value: datetime.date
+    :return: The HTTP date, e.g. 'Sun, 18 Oct 2026 16:25:17 GMT'
+    :rtype: str
+    """
+
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        hour, minute, second = value.hour, value.minute, value.second
+    else:
+        hour = minute = second = 0
+
+    return (
+        f"{_WEEKDAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} "
+        f"{value.year:04d} {hour:02d}:{minute:02d}:{second:02d} GMT"
+    )
+
+
+def _default_http_dates(obj: Any) -> Any:
+    # Only reached by dates and times, with OPT_PASSTHROUGH_DATETIME
+    if isinstance(obj, date):
+        return http_date(obj)
+    if isinstance(obj, time):
+        return obj.isoformat()
+    return _default(obj)
+
+
+def json_dumps(
+    obj: Any, http_dates: bool = False, sort_keys: bool = False, indent: bool = False
+) -> bytes:
+    """
+    Encodes a value as JSON.
+
+    :param obj: The value
+    :type obj: Any
+    :param http_dates: Whether dates are encoded as HTTP dates (e.g. 'Sun, 18 Oct 2026 16:25:17 GMT') instead of ISO 8601
+    :type http_dates: bool, optional
+    :param sort_keys: Whether the keys of objects are sorted
+    :type sort_keys: bool, optional
+    :param indent: Whether the output is indented with two spaces
+    :type indent: bool, optional
+    :return: The UTF-8 encoded JSON
+    :rtype: bytes
+    :raises TypeError: If the value contains an unsupported type
+    """
+
+    options = _OPTIONS
+    if http_dates:
+        options |= orjson.OPT_PASSTHROUGH_DATETIME
+    if sort_keys:
+        options |= orjson.OPT_SORT_KEYS
+    if indent:
+        options |= orjson.OPT_INDENT_2
+
+    try:
+        return orjson.dumps(
+            obj,
+            default=_default_http_dates if http_dates else _default,
+            option=options,
+        )
+    except orjson.JSONEncodeError as e:
+        # Same exception as the standard library, for the callers handling it
+        raise TypeError(str(e)) from e
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Decodes JSON.
+
+    :param data: The JSON
+    :type data: str | bytes
+    :return: The value
+    :rtype: Any
+    :raises ValueError: If the data is not valid JSON
+    """
+
+    return orjson.loads(data)
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider of the application, compatible with the output of Flask's default provider.
+
+    Attributes:
+        sort_keys: Whether the keys of objects are sorted
+        compact: Whether responses are compact, None to indent them in debug mode only
+        mimetype: The mimetype of the responses
+    """
+
+    sort_keys = True
+    compact: bool | None = None
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return json_dumps(
+            obj,
+            http_dates=True,
+            sort_keys=kwargs.get("sort_keys", self.sort_keys),
+            indent=bool(kwargs.get("indent")),
+        ).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return json_loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+
+        # The encoded bytes are used as the body as they are, without a round trip through str
+        body = json_dumps(obj, http_dates=True, sort_keys=self.sort_keys, indent=indent)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,240 @@
+"""
+Keyset (cursor) pagination. A page is the rows following the last row of the previous page in a fixed order, found
+through the index on the sort keys, so page 100 costs the same as page 1 and no `COUNT(*)` is run per request.
+Cursors are opaque tokens holding the sort keys of the last row of a page.
+
+Endpoints opt in: a request with a `cursor` argument (empty for the first page) gets a keyset page, other requests
+keep the page numbers of `Query.paginate`. The total, when asked for with `include_total`, comes from a cached count.
+"""
+
+import base64
+import hashlib
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Sequence, Tuple
+from uuid import UUID
+from flask import request
+from flask_sqlalchemy.query import Query
+from sqlalchemy import tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from .cache import CacheError, get_cache, set_cache
+from .json_provider import json_dumps, json_loads
+from .logger import log_error
+
+DEFAULT_PER_PAGE = 20
+# Upper bound of `per_page` unless the endpoint sets a lower one, so a request cannot load a whole table
+MAX_PER_PAGE = 100
+# Seconds a total is cached, the tags of the endpoint invalidate it sooner on writes
+TOTAL_CACHE_TTL = 5 * 60
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a cursor was not issued for the order of the endpoint it is sent to.
+    """
+
+
+class KeysetPage(NamedTuple):
+    """
+    A page of rows.
+
+    Attributes:
+        items: The rows of the page
+        per_page: The maximum number of rows in a page
+        next_cursor: The cursor of the next page, None on the last page
+    """
+
+    items: List[Any]
+    per_page: int
+    next_cursor: str | None
+
+    def to_dict(self, items: List[Any], total: int | None = None) -> Dict[str, Any]:
+        """
+        Builds the response body of the page.
+
+        :param items: The serialized rows
+        :type items: List[Any]
+        :param total: The total number of rows, left out if None
+        :type total: int | None, optional
+        :return: The items, per_page, next_cursor and, if given, total_items
+        :rtype: Dict[str, Any]
+        """
+
+        page = {
+            "items": items,
+            "per_page": self.per_page,
+            "next_cursor": self.next_cursor,
+        }
+        if total is not None:
+            page["total_items"] = total
+        return page
+
+
+def wants_total(args: Mapping[str, str] | None = None) -> bool:
+    """
+    Checks whether a request asks for the total number of rows of a keyset paginated list.
+
+    :param args: The query arguments, defaults to those of the current request
+    :type args: Mapping[str, str], optional
+    :return: True if `include_total` is 'true' or '1'
+    :rtype: bool
+    """
+
+    args = request.args if args is None else args
+    return args.get("include_total", "false").lower() in ("true", "1")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encodes the sort keys of a row as a cursor.
+
+    :param values: The sort keys, JSON serializable
+    :type values: Sequence[Any]
+    :return: The URL safe cursor
+    :rtype: str
+    """
+
+    return (
+        base64.urlsafe_b64encode(json_dumps(list(values))).decode("ascii").rstrip("=")
+    )
+
+
+def _decode_value(key: InstrumentedAttribute, value: Any) -> Any:
+    if value is None:
+        return None
+
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        return value
+
+    # Encoded as ISO 8601 and strings by `json_dumps`
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return value
+
+
+def decode_cursor(
+    cursor: str, keys: Sequence[InstrumentedAttribute]
+) -> Tuple[Any, ...]:
+    """
+    Decodes a cursor into the sort keys of a row.
+
+    :param cursor: The cursor
+    :type cursor: str
+    :param keys: The sort key columns, in order
+    :type keys: Sequence[sqlalchemy.orm.InstrumentedAttribute]
+    :return: The sort keys, converted to the types of the columns
+    :rtype: Tuple[Any, ...]
+    :raises InvalidCursorError: If the cursor is malformed or was issued for other sort keys
+    """
+
+    try:
+        values = json_loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("Wrong number of sort keys")
+        return tuple(_decode_value(key, value) for key, value in zip(keys, values))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def _per_page(per_page: int | None, max_per_page: int) -> int:
+    if per_page is None:
+        per_page = request.args.get("per_page", DEFAULT_PER_PAGE, type=int)
+
+    return min(max(per_page or DEFAULT_PER_PAGE, 1), max_per_page)
+
+
+def keyset_paginate(
+    query: Query,
+    keys: Sequence[InstrumentedAttribute],
+    cursor: str | None = None,
+    per_page: int | None = None,
+    max_per_page: int = MAX_PER_PAGE,
+    descending: bool = True,
+) -> KeysetPage:
+    """
+    Retrieves a page of a query in the order of the given keys, replacing any order of the query.
+    The keys must end with a unique column, e.g. `(created_at, id)`, must not be null and should be covered by an index.
+
+    :param query: The query, with its filters and loader options
+    :type query: flask_sqlalchemy.query.Query
+    :param keys: The sort key columns, all sorted in the same direction
+    :type keys: Sequence[sqlalchemy.orm.InstrumentedAttribute]
+    :param cursor: The cursor of the page, None or empty for the first page
+    :type cursor: str | None, optional
+    :param per_page: The maximum number of rows, defaults to the `per_page` argument of the request or 20
+    :type per_page: int | None, optional
+    :param max_per_page: The upper bound of `per_page`, defaults to 100
+    :type max_per_page: int, optional
+    :param descending: Whether the rows are sorted in descending order, e.g. newest first
+    :type descending: bool, optional
+    :return: The page
+    :rtype: KeysetPage
+    :raises InvalidCursorError: If the cursor was not issued for these keys
+    """
+
+    per_page = _per_page(per_page, max_per_page)
+
+    query = query.order_by(None).order_by(
+        *(key.desc() if descending else key.asc() for key in keys)
+    )
+    if cursor:
+        after = decode_cursor(cursor, keys)
+        row = tuple_(*keys)
+        query = query.filter(row < after if descending else row > after)
+
+    # One extra row tells whether there is a next page
+    rows = query.limit(per_page + 1).all()
+    items = rows[:per_page]
+
+    next_cursor = None
+    if len(rows) > per_page:
+        next_cursor = encode_cursor([getattr(items[-1], key.key) for key in keys])
+
+    return KeysetPage(items=items, per_page=per_page, next_cursor=next_cursor)
+
+
+def get_cached_total(
+    query: Query, tags: Iterable[str] | None = None, ttl: int = TOTAL_CACHE_TTL
+) -> int:
+    """
+    Retrieves the number of rows of a query, counted at most once per `ttl` or until one of the tags is invalidated.
+
+    :param query: The query, with its filters
+    :type query: flask_sqlalchemy.query.Query
+    :param tags: The cache tags of the rows, e.g. 'news'
+    :type tags: Iterable[str] | None, optional
+    :param ttl: Seconds the count is reused
+    :type ttl: int, optional
+    :return: The number of rows, possibly slightly out of date
+    :rtype: int
+    """
+
+    query = query.order_by(None)
+    compiled = query.statement.compile()
+    key = (
+        "total_"
+        + hashlib.sha1(
+            f"{compiled}|{sorted(compiled.params.items())!r}".encode("utf-8")
+        ).hexdigest()
+    )
+
+    try:
+        cached = get_cache(key)
+        if cached is not None:
+            return int(cached)
+    except (CacheError, ValueError) as e:
+        log_error(f"Failed to retrieve total from cache: {str(e)}")
+
+    total = query.count()
+
+    try:
+        set_cache(key, str(total), ttl=ttl, tags=tags)
+    except CacheError as e:
+        log_error(f"Failed to cache total: {str(e)}")
+
+    return total
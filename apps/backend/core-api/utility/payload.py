@@ -0,0 +1,118 @@
+"""
+Pre-serialised response bodies, stored in the cache together with their compressed variants and ETag so that serving them needs no encoding work.
+"""
+
+import gzip
+import hashlib
+from http import HTTPStatus
+from typing import NamedTuple
+from flask import Request, Response
+
+try:
+    import brotli
+except ImportError:  # Optional, only gzip variants are served without it
+    brotli = None
+
+
+class CompressedPayload(NamedTuple):
+    """
+    A response body with its precomputed gzip and brotli variants.
+
+    Attributes:
+        etag: Weak ETag derived from the content hash, shared by all encodings
+        identity: The uncompressed body
+        gzip: The gzip compressed body
+        br: The brotli compressed body, empty if brotli is not installed
+    """
+
+    etag: str
+    identity: bytes
+    gzip: bytes
+    br: bytes = b""
+
+    @classmethod
+    def from_body(cls, body: bytes | str) -> "CompressedPayload":
+        """
+        Compresses a response body.
+
+        :param body: The uncompressed body
+        :type body: bytes | str
+        :return: The payload
+        :rtype: CompressedPayload
+        """
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        return cls(
+            etag=hashlib.sha256(body).hexdigest()[:32],
+            identity=body,
+            gzip=gzip.compress(body, compresslevel=9, mtime=0),
+            br=brotli.compress(body, quality=11) if brotli else b"",
+        )
+
+    def encode(self) -> bytes:
+        """
+        Packs the payload into a single cache value: a header line with the ETag and the variant sizes, followed by the variants.
+
+        :return: The packed payload
+        :rtype: bytes
+        """
+
+        header = f"{self.etag} {len(self.identity)} {len(self.gzip)} {len(self.br)}\n"
+        return header.encode("ascii") + self.identity + self.gzip + self.br
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CompressedPayload":
+        """
+        Unpacks a payload packed by `encode`.
+
+        :param raw: The packed payload
+        :type raw: bytes
+        :return: The payload
+        :rtype: CompressedPayload
+        :raises ValueError: If the value is not a packed payload
+        """
+
+        separator = raw.index(b"\n")
+        etag, identity_size, gzip_size, br_size = raw[:separator].decode("ascii").split()
+        identity_end = separator + 1 + int(identity_size)
+        gzip_end = identity_end + int(gzip_size)
+
+        return cls(
+            etag=etag,
+            identity=raw[separator + 1 : identity_end],
+            gzip=raw[identity_end:gzip_end],
+            br=raw[gzip_end : gzip_end + int(br_size)],
+        )
+
+    def to_response(
+        self, request: Request, mimetype: str = "application/json"
+    ) -> Response:
+        """
+        Builds the response for a request, picking the best encoding the client accepts and answering 304 if its copy is current.
+
+        :param request: The request
+        :type request: flask.Request
+        :param mimetype: The mimetype of the body
+        :type mimetype: str
+        :return: The response
+        :rtype: flask.Response
+        """
+
+        if request.if_none_match.contains_weak(self.etag):
+            response = Response(status=HTTPStatus.NOT_MODIFIED)
+        else:
+            accepted = request.accept_encodings
+            if self.br and accepted["br"]:
+                response = Response(self.br, mimetype=mimetype)
+                response.headers["Content-Encoding"] = "br"
+            elif accepted["gzip"]:
+                response = Response(self.gzip, mimetype=mimetype)
+                response.headers["Content-Encoding"] = "gzip"
+            else:
+                response = Response(self.identity, mimetype=mimetype)
+
+        response.set_etag(self.etag, weak=True)
+        response.vary.add("Accept-Encoding")
+        return response
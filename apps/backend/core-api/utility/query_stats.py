@@ -0,0 +1,203 @@
+"""
+SQL statement statistics per request. Every statement run while handling a request is counted and timed, the totals
+are aggregated per blueprint into the metrics exported on `/metrics`, and routes with a query budget log a warning
+(or fail, with `QUERY_BUDGET_STRICT`) when they exceed it, so N+1 regressions show up before they reach production.
+In development, the statistics of each response are also sent in a `Server-Timing` header.
+"""
+
+import os
+import time
+from typing import Dict, List, NamedTuple, Tuple
+from flask import Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from .cache import cache
+from .logger import log_warning
+
+# Number of statements reported by duration, per request
+QUERY_STATS_SLOWEST = 3
+# Statements are shortened to this length in the headers and logs
+QUERY_STATS_STATEMENT_LENGTH = 200
+
+# Upper bounds of the histogram buckets
+REQUEST_QUERIES_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+REQUEST_DB_SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+_START_TIMES_KEY = "query_stats_start_times"
+
+
+class QueryBudget(NamedTuple):
+    """
+    The most a route may spend on the database in one request.
+
+    Attributes:
+        max_queries: Maximum number of statements
+        max_seconds: Maximum total execution time of the statements, None for no limit
+    """
+
+    max_queries: int
+    max_seconds: float | None = None
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised when a request exceeds its query budget and `QUERY_BUDGET_STRICT` is set.
+    """
+
+
+class RequestQueryStats:
+    """
+    The statements of one request.
+
+    Attributes:
+        count: Number of statements
+        seconds: Total execution time of the statements
+        slowest: (seconds, statement) of the slowest statements, slowest first
+    """
+
+    __slots__ = ("count", "seconds", "slowest")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest: List[Tuple[float, str]] = []
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+
+        if len(self.slowest) < QUERY_STATS_SLOWEST or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda entry: entry[0], reverse=True)
+            del self.slowest[QUERY_STATS_SLOWEST:]
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times: List[float] = conn.info.get(_START_TIMES_KEY, [])
+    if not start_times:
+        return
+    seconds = time.perf_counter() - start_times.pop()
+
+    # Statements of scripts and scheduled tasks are not attributed to a request
+    if not has_request_context():
+        return
+
+    stats: RequestQueryStats | None = g.get("query_stats")
+    if stats is not None:
+        stats.record(statement, seconds)
+
+
+def start_query_stats() -> None:
+    """
+    Starts counting the statements of the current request. Meant as the first `before_request` hook.
+    """
+
+    g.query_stats = RequestQueryStats()
+
+
+def get_query_budget(budgets: Dict[str, QueryBudget]) -> QueryBudget | None:
+    """
+    Retrieves the budget of the current request, by endpoint first and then by blueprint.
+
+    :param budgets: The budgets by endpoint (e.g. 'public_news.get_news') or blueprint name (e.g. 'public_news')
+    :type budgets: Dict[str, QueryBudget]
+    :return: The budget, None if the route has none
+    :rtype: QueryBudget | None
+    """
+
+    return budgets.get(request.endpoint or "") or budgets.get(request.blueprint or "")
+
+
+def _shorten(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) <= QUERY_STATS_STATEMENT_LENGTH:
+        return statement
+    return statement[: QUERY_STATS_STATEMENT_LENGTH - 3] + "..."
+
+
+def _server_timing(stats: RequestQueryStats) -> str:
+    metrics = [f'db;desc="{stats.count} queries";dur={stats.seconds * 1000:.3f}']
+    metrics.extend(
+        'db-slow-{};desc="{}";dur={:.3f}'.format(
+            position,
+            _shorten(statement).replace("\\", "\\\\").replace('"', '\\"'),
+            seconds * 1000,
+        )
+        for position, (seconds, statement) in enumerate(stats.slowest, start=1)
+    )
+    return ", ".join(metrics)
+
+
+def record_query_stats(response: Response, budgets: Dict[str, QueryBudget]) -> Response:
+    """
+    Aggregates the statements of the current request per blueprint and checks them against the route budget.
+    Meant as the last `after_request` hook, so the statements of the other hooks are counted.
+
+    :param response: The response
+    :type response: flask.Response
+    :param budgets: The budgets by endpoint or blueprint name
+    :type budgets: Dict[str, QueryBudget]
+    :return: The response, with a `Server-Timing` header in development
+    :rtype: flask.Response
+    :raises QueryBudgetExceeded: If the budget is exceeded and `QUERY_BUDGET_STRICT` is set
+    """
+
+    stats: RequestQueryStats | None = g.pop("query_stats", None)
+    if stats is None:
+        return response
+
+    blueprint = request.blueprint or "none"
+    metrics = cache.metrics
+    metrics.inc("db_requests_total", blueprint=blueprint)
+    metrics.inc("db_queries_total", stats.count, blueprint=blueprint)
+    metrics.inc("db_query_seconds_total", stats.seconds, blueprint=blueprint)
+    metrics.observe(
+        "db_request_queries", stats.count, REQUEST_QUERIES_BUCKETS, blueprint=blueprint
+    )
+    metrics.observe(
+        "db_request_seconds",
+        stats.seconds,
+        REQUEST_DB_SECONDS_BUCKETS,
+        blueprint=blueprint,
+    )
+
+    if os.environ.get("FLASK_ENV") == "development":
+        response.headers.add("Server-Timing", _server_timing(stats))
+
+    budget = get_query_budget(budgets)
+    if budget is not None and (
+        stats.count > budget.max_queries
+        or (budget.max_seconds is not None and stats.seconds > budget.max_seconds)
+    ):
+        endpoint = request.endpoint or "none"
+        metrics.inc("db_query_budget_exceeded_total", endpoint=endpoint)
+
+        message = (
+            f"Query budget exceeded by {endpoint}: {stats.count} queries in "
+            f"{stats.seconds * 1000:.1f} ms, budget {budget.max_queries} queries"
+            + (
+                f" in {budget.max_seconds * 1000:.1f} ms"
+                if budget.max_seconds is not None
+                else ""
+            )
+        )
+        if current_app.config.get("QUERY_BUDGET_STRICT"):
+            raise QueryBudgetExceeded(message)
+
+        log_warning(
+            message,
+            path=request.path,
+            slowest=[
+                f"{seconds * 1000:.1f} ms: {_shorten(statement)}"
+                for seconds, statement in stats.slowest
+            ],
+        )
+
+    metrics.maybe_flush()
+    return response
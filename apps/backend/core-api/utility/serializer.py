@@ -0,0 +1,147 @@
+"""
+Column serializers for the models. The columns and their converters are looked up once per mapped class, so that
+`to_dict` does not inspect the mapper and check every value on each call.
+"""
+
+import enum
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple
+from sqlalchemy import ARRAY, Enum, inspect
+from sqlalchemy.types import TypeEngine
+from .fieldsets import Fieldset, column_exclude
+
+Converter = Callable[[Any], Any]
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _enum_values(value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    return [_enum_value(item) for item in value]
+
+
+def get_converter(column_type: TypeEngine) -> Converter | None:
+    """
+    Retrieves the converter of a column type, turning enums into their values.
+    UUIDs and dates are left to the JSON provider, so the serialized format of the API does not change.
+
+    :param column_type: The type of the column
+    :type column_type: sqlalchemy.types.TypeEngine
+    :return: The converter, or None if values are used as they are
+    :rtype: Callable[[Any], Any] | None
+    """
+
+    if isinstance(column_type, Enum):
+        return _enum_value
+    if isinstance(column_type, ARRAY) and isinstance(column_type.item_type, Enum):
+        return _enum_values
+    return None
+
+
+def _tuple_getter(
+    getter_type: Callable[..., Callable[[Any], Any]], keys: Tuple[str, ...]
+) -> Callable[[Any], Tuple[Any, ...]]:
+    if not keys:
+        return lambda source: ()
+
+    getter = getter_type(*keys)
+    if len(keys) == 1:
+        # Getters of a single key return a bare value
+        return lambda source: (getter(source),)
+    return getter
+
+
+class ColumnSerializer:
+    """
+    Serializes the columns of one mapped class.
+
+    Attributes:
+        keys: The serialized column attributes, in mapper order
+        converters: (position in `keys`, converter) of the columns needing a conversion
+    """
+
+    __slots__ = ("keys", "converters", "_getter", "_loaded_getter")
+
+    def __init__(self, model: type, exclude: FrozenSet[str] = frozenset()):
+        column_attrs = inspect(model).column_attrs
+        self.keys: Tuple[str, ...] = tuple(
+            key for key in column_attrs.keys() if key not in exclude
+        )
+        self.converters: Tuple[Tuple[int, Converter], ...] = tuple(
+            (position, converter)
+            for position, key in enumerate(self.keys)
+            if (converter := get_converter(column_attrs[key].columns[0].type))
+        )
+
+        self._getter = _tuple_getter(attrgetter, self.keys)
+        self._loaded_getter = _tuple_getter(itemgetter, self.keys)
+
+    def __call__(self, instance: Any) -> Dict[str, Any]:
+        try:
+            # Loaded attributes live in the instance dict, reading them there skips the attribute descriptors
+            values = self._loaded_getter(instance.__dict__)
+        except KeyError:
+            # Expired, deferred or never set, let the descriptors load them
+            values = self._getter(instance)
+
+        if self.converters:
+            values: List[Any] = list(values)
+            for position, converter in self.converters:
+                values[position] = converter(values[position])
+
+        return dict(zip(self.keys, values))
+
+
+# (mapped class, excluded columns) -> serializer
+_serializers: Dict[Tuple[type, FrozenSet[str]], ColumnSerializer] = {}
+# Fieldsets come from requests, serializers past this many are built for each call instead of kept
+SERIALIZERS_MAX = 1024
+
+
+def get_serializer(model: type, exclude: Iterable[str] = ()) -> ColumnSerializer:
+    """
+    Retrieves the serializer of a mapped class, building it on first use.
+
+    :param model: The mapped class
+    :type model: type
+    :param exclude: Column attributes left out of the result
+    :type exclude: Iterable[str], optional
+    :return: The serializer
+    :rtype: ColumnSerializer
+    """
+
+    key = (model, frozenset(exclude))
+    serializer = _serializers.get(key)
+
+    if serializer is None:
+        serializer = ColumnSerializer(model, key[1])
+        if len(_serializers) < SERIALIZERS_MAX:
+            _serializers[key] = serializer
+
+    return serializer
+
+
+def serialize_columns(
+    instance: Any, exclude: Iterable[str] = (), fieldset: Fieldset | None = None
+) -> Dict[str, Any]:
+    """
+    Serializes the column attributes of a model instance, with enums turned into their values.
+
+    :param instance: The model instance
+    :type instance: Any
+    :param exclude: Column attributes left out of the result
+    :type exclude: Iterable[str], optional
+    :param fieldset: The selected attributes, None for all of them
+    :type fieldset: Fieldset | None, optional
+    :return: The column values by attribute name
+    :rtype: Dict[str, Any]
+    """
+
+    model = type(instance)
+    if fieldset is not None and fieldset.fields is not None:
+        exclude = column_exclude(fieldset, get_serializer(model).keys, exclude)
+
+    return get_serializer(model, exclude)(instance)
@@ -3,7 +3,8 @@ A Utility module for handling translations and everything language related
 """
 
 import unicodedata
-from typing import Any, Type, Optional, List, Dict
+from typing import Any, Iterable, Type, Optional, List, Dict, Tuple
+from flask import g, has_app_context
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import Query
 from werkzeug.datastructures import MultiDict
@@ -57,6 +58,76 @@ def retrieve_languages(
     )
 
 
+# Translations resolved by `get_translations`, kept on `g` for the rest of the request
+_TRANSLATION_CACHE_ATTRIBUTE = "resolved_translations"
+
+
+def _get_translation_cache() -> Dict[Tuple[Any, ...], Optional[object]] | None:
+    if not has_app_context():
+        return None
+
+    return g.setdefault(_TRANSLATION_CACHE_ATTRIBUTE, {})
+
+
+def get_translations(
+    translation_table: Type[object],
+    filter_column: str,
+    filter_values: Iterable[Any],
+    language_codes: List[str] = [DEFAULT_LANGUAGE_CODE],
+) -> Dict[Any, Dict[str, Optional[object]]]:
+    """
+    Retrieves the translations of many objects with a single query, with the same fallbacks as `get_translation`.
+    The results are kept until the end of the request, so later `get_translation` calls for these objects need no query.
+
+    :param translation_table: The translation table to query
+    :type translation_table: Type[object]
+    :param filter_column: The column referencing the translated object, e.g. 'event_id'
+    :type filter_column: str
+    :param filter_values: The values of the column, one per object
+    :type filter_values: Iterable[Any]
+    :param language_codes: The language codes to resolve
+    :type language_codes: List[str], optional
+    :return: The translation (or None if the object has none) per language code, per value
+    :rtype: Dict[Any, Dict[str, Optional[object]]]
+    """
+
+    if not hasattr(translation_table, filter_column):
+        print(f"Column {filter_column} does not exist in {translation_table}")
+        return {}
+
+    values = set(filter_values)
+    if not values:
+        return {}
+
+    column = getattr(translation_table, filter_column)
+    rows: Dict[Any, Dict[str, object]] = {value: {} for value in values}
+    for translation in translation_table.query.filter(column.in_(values)).all():
+        rows[getattr(translation, filter_column)].setdefault(
+            translation.language_code, translation
+        )
+
+    cache = _get_translation_cache()
+    resolved: Dict[Any, Dict[str, Optional[object]]] = {}
+
+    for value, translations in rows.items():
+        # Fallback 1: Default language code, fallback 2: Any language code
+        fallback = translations.get(DEFAULT_LANGUAGE_CODE) or next(
+            iter(translations.values()), None
+        )
+        resolved[value] = {
+            language_code: translations.get(language_code) or fallback
+            for language_code in language_codes
+        }
+
+        if cache is not None:
+            for language_code, translation in resolved[value].items():
+                cache[(translation_table, filter_column, value, language_code)] = (
+                    translation
+                )
+
+    return resolved
+
+
 def get_translation(
     translation_table: Type[object],
     filter_columns: List[str],
@@ -84,6 +155,18 @@ def get_translation(
             print(f"Column {column} does not exist in {translation_table}")
             return None
 
+    # Resolved earlier in the request by `get_translations`
+    cache = _get_translation_cache()
+    if cache is not None and len(filter_columns) == 1:
+        key = (
+            translation_table,
+            filter_columns[0],
+            filter_values[filter_columns[0]],
+            language_code,
+        )
+        if key in cache:
+            return cache[key]
+
     query: Query = translation_table.query
 
     # Filter by language code and filter values
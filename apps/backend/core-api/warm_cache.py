@@ -0,0 +1,56 @@
+"""
+Utility script for warming the cache of the public endpoints, runs the same warmers as the scheduler endpoint ('/api/v1/scheduler/warm_cache').
+
+This script is used in development, or to warm the cache right after a deploy.
+"""
+
+import argparse
+
+from main import app
+from services.utility.warmers import get_warmers, run_warmers
+
+
+def warm_cache(names=None):
+    """
+    Runs the warmers, optionally only those whose name starts with one of the given names.
+    """
+
+    print("Warming cache...")
+    with app.app_context():
+        results = run_warmers(names)
+
+    for name, success in results.items():
+        print(f"[{'OK' if success else 'FAILED'}] {name}")
+
+    print("-" * 59)
+    print(
+        f"{sum(results.values())} of {len(results)} warmers succeeded."
+    )
+
+
+def list_warmers():
+    """
+    Prints the names of all registered warmers.
+    """
+
+    with app.app_context():
+        for warmer in get_warmers():
+            print(warmer.name)
+
+
+parser = argparse.ArgumentParser(description="Cache warming script")
+parser.add_argument(
+    "names",
+    nargs="*",
+    help="Only run warmers whose name starts with one of these, e.g. search committees",
+)
+parser.add_argument(
+    "--list", action="store_true", help="Lists the registered warmers and exits"
+)
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    if args.list:
+        list_warmers()
+    else:
+        warm_cache(args.names)